@@ -0,0 +1,93 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+
+MODULOS_ENTRADA = ("src.cli", "src.batch")
+
+
+MODULOS_PESADOS = ("matplotlib", "numpy", "tabulate")
+
+
+RAIZ_PROYECTO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def medir_importtime(modulo: str) -> Dict[str, Tuple[int, int]]:
+    
+    
+    proceso = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+        cwd=RAIZ_PROYECTO,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    
+    tiempos: Dict[str, Tuple[int, int]] = {}
+    for linea in proceso.stderr.splitlines():
+        if not linea.startswith("import time:") or "self [us]" in linea:
+            continue
+        propio, acumulado, nombre = linea[len("import time:"):].split("|", 2)
+        tiempos[nombre.strip()] = (int(propio), int(acumulado))
+    return tiempos
+
+
+def resumir(repeticiones: int, modulo: str) -> Tuple[float, List[Tuple[str, int]], List[str]]:
+    
+    totales: List[int] = []
+    ultima: Dict[str, Tuple[int, int]] = {}
+    for _ in range(repeticiones):
+        ultima = medir_importtime(modulo)
+        totales.append(ultima[modulo][1])
+    
+    mas_costosos = sorted(
+        ((nombre, propio) for nombre, (propio, _) in ultima.items()),
+        key=lambda item: item[1],
+        reverse=True,
+    )[:10]
+    pesados = sorted(
+        nombre for nombre in ultima
+        if nombre.split(".")[0] in MODULOS_PESADOS
+    )
+    return statistics.median(totales) / 1000, mas_costosos, pesados
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Costo de importacion de los modulos que ejecuta `python -m src.main` (menu y modo por lotes), "
+        "medido con -X importtime."
+    )
+    parser.add_argument("-r", "--repeticiones", type=int, default=5)
+    parser.add_argument(
+        "--limite-ms",
+        type=float,
+        default=150.0,
+        help="falla (codigo 1) si la mediana de algun modulo supera este valor",
+    )
+    args = parser.parse_args()
+    
+    fallo = False
+    for modulo in MODULOS_ENTRADA:
+        mediana_ms, mas_costosos, pesados = resumir(args.repeticiones, modulo)
+        
+        print(f"Importacion de {modulo}: {mediana_ms:.1f} ms (mediana de {args.repeticiones})")
+        print("\nModulos con mayor tiempo propio:")
+        for nombre, propio in mas_costosos:
+            print(f"  {propio / 1000:>8.2f} ms  {nombre}")
+        
+        if pesados:
+            print(f"\nModulos pesados importados al arrancar: {', '.join(pesados)}")
+            fallo = True
+        if mediana_ms > args.limite_ms:
+            print(f"\nLa importacion supera el limite de {args.limite_ms:.0f} ms.")
+            fallo = True
+        print()
+    
+    sys.exit(1 if fallo else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import argparse
+import csv
+import json
+import os
+import tempfile
+import time
+from typing import List, Tuple
+
+from src.generators import ParametrosCarga, generar_procesos
+from src.loaders import cargar_archivo_carga
+
+
+def escribir_archivos(directorio: str, num_filas: int, semilla: int) -> Tuple[str, str]:
+    
+    ruta_csv = os.path.join(directorio, "carga.csv")
+    ruta_jsonl = os.path.join(directorio, "carga.jsonl")
+    procesos = generar_procesos(ParametrosCarga(num_procesos=num_filas, semilla=semilla))
+    with open(ruta_csv, "w", newline="", encoding="utf-8") as f_csv, \
+            open(ruta_jsonl, "w", encoding="utf-8") as f_jsonl:
+        escritor = csv.writer(f_csv)
+        escritor.writerow(["nombre", "llegada", "duracion_cpu"])
+        for p in procesos:
+            escritor.writerow([p.nombre, p.llegada, p.duracion_cpu])
+            f_jsonl.write(json.dumps({"nombre": p.nombre, "llegada": p.llegada, "duracion_cpu": p.duracion_cpu}))
+            f_jsonl.write("\n")
+    return ruta_csv, ruta_jsonl
+
+
+def medir(ruta: str, columnar: bool, repeticiones: int) -> float:
+    
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        carga = cargar_archivo_carga(ruta, columnar=columnar)
+        mejor = min(mejor, time.perf_counter() - inicio)
+        del carga
+    return mejor
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rendimiento del cargador de archivos de carga (filas/s).")
+    parser.add_argument("-n", "--filas", type=int, default=500_000)
+    parser.add_argument("-r", "--repeticiones", type=int, default=3)
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as directorio:
+        rutas = escribir_archivos(directorio, args.filas, args.semilla)
+        
+        filas: List[Tuple[str, str, float]] = []
+        for ruta in rutas:
+            for columnar in (False, True):
+                segundos = medir(ruta, columnar, args.repeticiones)
+                filas.append((os.path.basename(ruta), "columnar" if columnar else "lista", segundos))
+        
+        print(f"{'Archivo':<14}{'Salida':<10}{'MB':>8}{'Tiempo (s)':>12}{'Filas/s':>14}")
+        print("-" * 58)
+        for nombre, salida, segundos in filas:
+            megas = os.path.getsize(os.path.join(directorio, nombre)) / 1e6
+            print(f"{nombre:<14}{salida:<10}{megas:>8.1f}{segundos:>12.3f}{args.filas / segundos:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
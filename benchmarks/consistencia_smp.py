@@ -0,0 +1,220 @@
+import argparse
+import random
+import sys
+from collections import defaultdict
+from typing import Callable, Dict, List, Tuple
+
+from src.algorithms import (
+    MODOS_COLA,
+    POLITICAS_SMP,
+    crear_politica,
+    simular_fcfs,
+    simular_rr,
+    simular_sjf,
+    simular_smp,
+    simular_srtf,
+)
+from src.algorithms.kernel import _simular
+from src.models import Proceso, ResultadoAlgoritmo
+
+
+REFERENCIAS_UN_NUCLEO = {"FCFS": simular_fcfs, "SJF": simular_sjf, "SRTF": simular_srtf}
+
+
+CASOS_FIJOS: List[Tuple[str, List[Proceso], int, int]] = [
+    ("llegada en el borde del quantum", [Proceso("P0", 0, 10), Proceso("P1", 3, 2)], 2, 3),
+    ("llegada antes del borde del quantum", [Proceso("P0", 0, 10), Proceso("P1", 2, 2)], 2, 3),
+]
+
+
+def generar_caso(rnd: random.Random, con_nulas: bool) -> List[Proceso]:
+
+    return [
+        Proceso(f"P{i}", rnd.randint(0, 60), rnd.randint(0 if con_nulas else 1, 15))
+        for i in range(rnd.randint(1, 40))
+    ]
+
+
+def multinucleo_con_un_nucleo(
+    procesos: List[Proceso],
+    politica: str,
+    colas: str,
+    quantum: int,
+) -> ResultadoAlgoritmo:
+
+
+    instancia = crear_politica(politica, quantum=quantum) if politica == "RR" else crear_politica(politica)
+    return _simular(
+        procesos, instancia, 1, [1], un_nucleo=False, por_nucleo=colas == "por_nucleo",
+        robo_trabajo=True, instrumentacion=None,
+    )
+
+
+def comparar_un_nucleo(procesos: List[Proceso], politica: str, colas: str, quantum: int) -> bool:
+
+    smp = multinucleo_con_un_nucleo(procesos, politica, colas, quantum)
+    if politica == "RR":
+        referencia = simular_rr(procesos, quantum)
+    else:
+        referencia = REFERENCIAS_UN_NUCLEO[politica](procesos)
+    return (
+        list(smp.segmentos_gantt) == list(referencia.segmentos_gantt)
+        and smp.procesos == referencia.procesos
+        and smp.promedios == referencia.promedios
+    )
+
+
+def finalizacion_por_ticks(procesos: List[Proceso], politica: str, num_nucleos: int) -> List[int]:
+
+
+    restante = [p.duracion_cpu for p in procesos]
+    claves: Dict[str, Callable[[int], tuple]] = {
+        "FCFS": lambda i: (procesos[i].llegada, procesos[i].nombre, i),
+        "SJF": lambda i: (procesos[i].duracion_cpu, procesos[i].llegada, procesos[i].nombre, i),
+        "SRTF": lambda i: (restante[i], i),
+    }
+    clave = claves[politica]
+    finalizacion = [0] * len(procesos)
+    pendientes = set(range(len(procesos)))
+    ejecutando: List[int] = []
+    tiempo = 0
+    while pendientes:
+        listos = sorted(
+            (i for i in pendientes if procesos[i].llegada <= tiempo and i not in ejecutando), key=clave
+        )
+        if politica == "SRTF":
+            listos = sorted(listos + ejecutando, key=clave)
+            ejecutando = []
+        for idx in listos:
+            if len(ejecutando) == num_nucleos:
+                break
+            if restante[idx] == 0:
+                finalizacion[idx] = tiempo
+                pendientes.discard(idx)
+            else:
+                ejecutando.append(idx)
+        for idx in list(ejecutando):
+            restante[idx] -= 1
+            if restante[idx] == 0:
+                ejecutando.remove(idx)
+                finalizacion[idx] = tiempo + 1
+                pendientes.discard(idx)
+        tiempo += 1
+    return finalizacion
+
+
+def traza_valida(
+    procesos: List[Proceso],
+    resultado: ResultadoAlgoritmo,
+    num_nucleos: int,
+    conserva_trabajo: bool,
+) -> bool:
+
+
+    por_nucleo: Dict[int, List[Tuple[int, int]]] = defaultdict(list)
+    por_proceso: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+    for segmento in resultado.segmentos_gantt:
+        por_nucleo[segmento.nucleo].append((segmento.inicio, segmento.fin))
+        por_proceso[segmento.proceso].append((segmento.inicio, segmento.fin))
+    for tramos in list(por_nucleo.values()) + list(por_proceso.values()):
+        tramos.sort()
+        if any(anterior[1] > siguiente[0] for anterior, siguiente in zip(tramos, tramos[1:])):
+            return False
+
+    activos = defaultdict(int)
+    for p in procesos:
+        tramos = por_proceso[p.nombre]
+        if not tramos or tramos[0][0] < p.llegada:
+            return False
+        if sum(fin - inicio for inicio, fin in tramos) != p.duracion_cpu:
+            return False
+        if p.duracion_cpu:
+            fin = max(fin for _, fin in tramos)
+            for tiempo in range(p.llegada, fin):
+                activos[tiempo] += 1
+    if not conserva_trabajo:
+        return True
+
+
+    ocupados = defaultdict(int)
+    for tramos in por_nucleo.values():
+        for inicio, fin in tramos:
+            for tiempo in range(inicio, fin):
+                ocupados[tiempo] += 1
+    return all(ocupados[tiempo] == min(num_nucleos, activos[tiempo]) for tiempo in activos)
+
+
+def sin_espera(procesos: List[Proceso], politica: str, colas: str, quantum: int) -> bool:
+
+
+    resultado = simular_smp(procesos, politica, len(procesos), quantum=quantum, colas=colas)
+    return all(p.tiempo_espera == 0 for p in resultado.procesos if p.duracion_cpu > 0)
+
+
+def sin_migraciones(procesos: List[Proceso], num_nucleos: int, colas: str, quantum: int) -> bool:
+
+
+    resultado = simular_smp(procesos, "RR", num_nucleos, quantum=quantum, colas=colas)
+    return (
+        len(resultado.segmentos_gantt) == len(procesos)
+        and resultado.promedios["cambios_contexto"] == 0
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Consistencia de simular_smp: el ciclo multinucleo con 1 nucleo contra los motores de un "
+        "nucleo, N nucleos contra una simulacion por ticks e invariantes de la traza."
+    )
+    parser.add_argument("-c", "--casos", type=int, default=300)
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    fallos: List[str] = []
+    total = 0
+    for descripcion, procesos, num_nucleos, quantum in CASOS_FIJOS:
+        for colas in MODOS_COLA:
+            total += 1
+            if not sin_migraciones(procesos, num_nucleos, colas, quantum):
+                fallos.append(f"{descripcion} (RR, {colas}, {num_nucleos} nucleos)")
+
+    rnd = random.Random(args.semilla)
+    for caso in range(args.casos):
+        procesos = generar_caso(rnd, con_nulas=caso % 5 == 0)
+        num_nucleos = rnd.randint(2, 6)
+        for politica in POLITICAS_SMP:
+            if politica in REFERENCIAS_UN_NUCLEO:
+                total += 1
+                resultado = simular_smp(procesos, politica, num_nucleos)
+                esperada = finalizacion_por_ticks(procesos, politica, num_nucleos)
+                if [p.tiempo_finalizacion for p in resultado.procesos] != esperada:
+                    fallos.append(
+                        f"caso {caso}: {politica} global con {num_nucleos} nucleos difiere de la simulacion por ticks"
+                    )
+            for colas in MODOS_COLA:
+                quantum = rnd.randint(1, 6)
+                total += 2
+                if not comparar_un_nucleo(procesos, politica, colas, quantum):
+                    fallos.append(f"caso {caso}: {politica}/{colas} con 1 nucleo difiere del motor de un nucleo")
+                if not sin_espera(procesos, politica, colas, quantum):
+                    fallos.append(f"caso {caso}: {politica}/{colas} con un nucleo por proceso hace esperar")
+                for robo_trabajo in (True, False):
+                    total += 1
+                    resultado = simular_smp(
+                        procesos, politica, num_nucleos, quantum=quantum, colas=colas, robo_trabajo=robo_trabajo
+                    )
+                    conserva_trabajo = colas == "global" or robo_trabajo
+                    if not traza_valida(procesos, resultado, num_nucleos, conserva_trabajo):
+                        fallos.append(
+                            f"caso {caso}: {politica}/{colas} (robo={robo_trabajo}) con {num_nucleos} nucleos "
+                            "deja una traza invalida"
+                        )
+
+    print(f"Comprobaciones: {total}, fallos: {len(fallos)}")
+    for fallo in fallos[:20]:
+        print(f"  {fallo}")
+    sys.exit(1 if fallos else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+from typing import Dict, List, Tuple
+
+from src.algorithms import MODOS_COLA, POLITICAS_SMP, simular_smp
+from src.export_json import exportar_resultados_multiples_json
+from src.export_npz import cargar_resultados_npz, exportar_resultados_npz
+from src.generators import ParametrosCarga, generar_carga_columnar
+from src.models import Proceso, ResultadoAlgoritmo
+from src.simulation import ejecutar_todos_los_algoritmos
+
+
+def conjuntos_de_prueba(num_procesos: int, semilla: int) -> List[Tuple[str, Dict[str, ResultadoAlgoritmo]]]:
+
+    carga = generar_carga_columnar(ParametrosCarga(num_procesos=num_procesos, semilla=semilla))
+    nombres_raros = [
+        Proceso("Tarea ñandú", 0, 4),
+        Proceso("P\u2028linea", 1, 0),
+        Proceso('comillas "y" \\barras', 2, 7),
+        Proceso("日本", 2, 3),
+    ]
+
+    smp: Dict[str, ResultadoAlgoritmo] = {}
+    for politica in POLITICAS_SMP:
+        for colas in MODOS_COLA:
+            smp[f"{politica}_{colas}"] = simular_smp(
+                carga, politica, 4, quantum=3, colas=colas, velocidades=[1, 1, 2, 0.5]
+            )
+
+    return [
+        ("escenario 1", ejecutar_todos_los_algoritmos(1, usar_cache=False)),
+        ("escenario 2", ejecutar_todos_los_algoritmos(2, usar_cache=False)),
+        ("nombres con caracteres especiales", ejecutar_todos_los_algoritmos(nombres_raros, usar_cache=False)),
+        (f"sintetica ({num_procesos} procesos)", ejecutar_todos_los_algoritmos(carga, usar_cache=False)),
+        ("multinucleo (4 nucleos)", smp),
+    ]
+
+
+def comparar(
+    directorio: str,
+    resultados: Dict[str, ResultadoAlgoritmo],
+    indentado: bool,
+) -> Tuple[bool, float]:
+
+    ruta_directa = os.path.join(directorio, "directo.json")
+    ruta_npz = os.path.join(directorio, "resultados.npz")
+    ruta_desde_npz = os.path.join(directorio, "desde_npz.json")
+
+    exportar_resultados_multiples_json(resultados, ruta_directa, indentado=indentado)
+    inicio = time.perf_counter()
+    exportar_resultados_npz(resultados, ruta_npz)
+    recargados = cargar_resultados_npz(ruta_npz)
+    segundos = time.perf_counter() - inicio
+    exportar_resultados_multiples_json(recargados, ruta_desde_npz, indentado=indentado)
+
+    with open(ruta_directa, "rb") as directo, open(ruta_desde_npz, "rb") as desde_npz:
+        return directo.read() == desde_npz.read(), segundos
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Fidelidad de la exportacion NPZ: resultados -> NPZ -> cargar_resultados_npz -> JSON "
+        "debe coincidir byte a byte con el JSON exportado directamente."
+    )
+    parser.add_argument("-n", "--procesos", type=int, default=20_000)
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    fallos = 0
+    print(f"{'Conjunto':<36}{'JSON':<12}{'Ida y vuelta (s)':>18}  Resultado")
+    print("-" * 78)
+    with tempfile.TemporaryDirectory() as directorio:
+        for descripcion, resultados in conjuntos_de_prueba(args.procesos, args.semilla):
+            for indentado in (True, False):
+                iguales, segundos = comparar(directorio, resultados, indentado)
+                fallos += not iguales
+                formato = "indentado" if indentado else "compacto"
+                print(f"{descripcion:<36}{formato:<12}{segundos:>18.3f}  {'ok' if iguales else 'DIFERENTE'}")
+
+    sys.exit(1 if fallos else 0)
+
+
+if __name__ == "__main__":
+    main()
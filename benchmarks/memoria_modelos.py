@@ -0,0 +1,65 @@
+import argparse
+import gc
+import sys
+import tracemalloc
+from dataclasses import fields, make_dataclass
+from typing import List, Tuple
+
+from src.models import Proceso, ResultadoAlgoritmo, ResultadoProceso, SegmentoGantt
+
+
+MODELOS = (Proceso, SegmentoGantt, ResultadoProceso, ResultadoAlgoritmo)
+
+
+def _argumentos(cls: type, n: int) -> List[tuple]:
+    if cls is ResultadoAlgoritmo:
+        return [(f"Algoritmo {i}", f"Escenario {i}") for i in range(n)]
+    if cls is ResultadoProceso:
+        return [(f"P{i}", i, i + 1, i + 2, i + 3, i + 4, i + 5) for i in range(n)]
+    return [(f"P{i}", i, i + 1) for i in range(n)]
+
+
+def variante_sin_slots(cls: type) -> type:
+    
+    return make_dataclass(cls.__name__, [(f.name, f.type, f) for f in fields(cls)])
+
+
+def bytes_por_instancia(cls: type, n: int) -> float:
+    
+    
+    argumentos = _argumentos(cls, n)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        antes, _ = tracemalloc.get_traced_memory()
+        instancias = [cls(*args) for args in argumentos]
+        despues, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return (despues - antes - sys.getsizeof(instancias)) / n
+
+
+def medir_modelos(n: int) -> List[Tuple[str, float, float]]:
+    
+    return [
+        (cls.__name__, bytes_por_instancia(variante_sin_slots(cls), n), bytes_por_instancia(cls, n))
+        for cls in MODELOS
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Memoria por instancia de los modelos, con y sin __slots__."
+    )
+    parser.add_argument("-n", type=int, default=200_000, help="instancias por modelo")
+    args = parser.parse_args()
+    
+    print(f"{'Modelo':<20}{'sin slots (B)':>16}{'actual (B)':>14}{'ahorro':>10}")
+    print("-" * 60)
+    for nombre, antes, despues in medir_modelos(args.n):
+        ahorro = 1 - despues / antes if antes else 0.0
+        print(f"{nombre:<20}{antes:>16.1f}{despues:>14.1f}{ahorro:>10.0%}")
+
+
+if __name__ == "__main__":
+    main()
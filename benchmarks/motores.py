@@ -0,0 +1,219 @@
+import argparse
+import gc
+import json
+import math
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.algorithms import (
+    simular_fcfs,
+    simular_rr,
+    simular_rr_smp,
+    simular_sjf,
+    simular_srtf,
+    simular_srtf_smp,
+)
+from src.generators import ParametrosCarga, generar_carga_columnar
+from src.metrics import calcular_metricas
+from src.models import CargaColumnar
+
+
+MOTORES: Dict[str, Callable[[CargaColumnar], object]] = {
+    "FCFS": simular_fcfs,
+    "SJF": simular_sjf,
+    "SRTF": simular_srtf,
+    "RR_Q3": lambda carga: simular_rr(carga, 3),
+    "SRTF_SMP8": lambda carga: simular_srtf_smp(carga, 8, colas="por_nucleo"),
+    "RR_Q3_SMP8": lambda carga: simular_rr_smp(carga, 3, 8),
+}
+
+
+MOTORES_DISPONIBLES = tuple(MOTORES) + ("METRICAS",)
+
+
+TAMANOS = (1_000, 4_000, 16_000, 64_000)
+
+
+ESCALAS = (5.0, 50.0)
+
+
+UMBRAL_REGRESION = 0.25
+
+
+Medicion = Dict[str, object]
+
+
+def _preparar(motor: str, carga: CargaColumnar) -> Tuple[Callable[[], object], int]:
+    
+    
+    if motor == "METRICAS":
+        segmentos = list(simular_rr(carga, 3).segmentos_gantt)
+        procesos = carga.a_procesos()
+        return (lambda: calcular_metricas(procesos, segmentos)), len(segmentos)
+    funcion = MOTORES[motor]
+    return (lambda: funcion(carga)), len(funcion(carga).segmentos_gantt)
+
+
+def medir(
+    motor: str,
+    num_procesos: int,
+    escala: float,
+    repeticiones: int,
+    semilla: int,
+) -> Medicion:
+    
+    carga = generar_carga_columnar(
+        ParametrosCarga(num_procesos=num_procesos, semilla=semilla, duracion_media=escala)
+    )
+    ejecutar, segmentos = _preparar(motor, carga)
+    
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        gc.collect()
+        inicio = time.perf_counter()
+        ejecutar()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    
+    
+    gc.collect()
+    tracemalloc.start()
+    try:
+        ejecutar()
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    
+    return {
+        "motor": motor,
+        "procesos": num_procesos,
+        "escala": escala,
+        "segundos": mejor,
+        "pico_bytes": pico,
+        "segmentos": segmentos,
+    }
+
+
+def exponente_complejidad(puntos: Sequence[Tuple[int, float]]) -> Optional[float]:
+    
+    
+    puntos = [(n, t) for n, t in puntos if n > 0 and t > 0]
+    if len(puntos) < 2:
+        return None
+    xs = [math.log(n) for n, _ in puntos]
+    ys = [math.log(t) for _, t in puntos]
+    media_x = sum(xs) / len(xs)
+    media_y = sum(ys) / len(ys)
+    varianza = sum((x - media_x) ** 2 for x in xs)
+    if varianza == 0:
+        return None
+    return sum((x - media_x) * (y - media_y) for x, y in zip(xs, ys)) / varianza
+
+
+def exponentes(mediciones: List[Medicion]) -> Dict[str, Optional[float]]:
+    
+    grupos: Dict[Tuple[str, float], List[Tuple[int, float]]] = {}
+    for m in mediciones:
+        grupos.setdefault((m["motor"], m["escala"]), []).append((m["procesos"], m["segundos"]))
+    return {f"{motor}@{escala:g}": exponente_complejidad(p) for (motor, escala), p in grupos.items()}
+
+
+def comparar(
+    mediciones: List[Medicion],
+    base: List[Medicion],
+    umbral: float,
+) -> List[str]:
+    
+    indice = {(m["motor"], m["procesos"], m["escala"]): m for m in base}
+    regresiones = []
+    for m in mediciones:
+        anterior = indice.get((m["motor"], m["procesos"], m["escala"]))
+        if anterior is None:
+            continue
+        for campo in ("segundos", "pico_bytes"):
+            if anterior[campo] > 0 and m[campo] > anterior[campo] * (1 + umbral):
+                regresiones.append(
+                    f"{m['motor']} n={m['procesos']} escala={m['escala']:g}: {campo} "
+                    f"{anterior[campo]:.4g} -> {m[campo]:.4g} (+{m[campo] / anterior[campo] - 1:.0%})"
+                )
+    return regresiones
+
+
+def _lista_enteros(texto: str) -> List[int]:
+    return [int(v) for v in texto.split(",") if v.strip()]
+
+
+def _lista_reales(texto: str) -> List[float]:
+    return [float(v) for v in texto.split(",") if v.strip()]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Tiempo, memoria pico y segmentos de cada motor de planificacion por tamano de carga."
+    )
+    parser.add_argument("-m", "--motores", default=",".join(MOTORES_DISPONIBLES), help="lista separada por comas")
+    parser.add_argument("-n", "--tamanos", type=_lista_enteros, default=list(TAMANOS))
+    parser.add_argument("-e", "--escalas", type=_lista_reales, default=list(ESCALAS), help="duracion media de rafaga")
+    parser.add_argument("-r", "--repeticiones", type=int, default=3)
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("-o", "--salida", help="guardar las mediciones en JSON")
+    parser.add_argument("-b", "--base", help="JSON de una ejecucion anterior para detectar regresiones")
+    parser.add_argument("--umbral", type=float, default=UMBRAL_REGRESION, help="aumento relativo tolerado (0.25 = 25%%)")
+    args = parser.parse_args()
+    
+    motores = [m.strip().upper() for m in args.motores.split(",") if m.strip()]
+    desconocidos = [m for m in motores if m not in MOTORES_DISPONIBLES]
+    if desconocidos:
+        parser.error(
+            f"Motores no reconocidos: {', '.join(desconocidos)}. Disponibles: {', '.join(MOTORES_DISPONIBLES)}"
+        )
+    
+    print(f"{'Motor':<10}{'Procesos':>10}{'Escala':>8}{'Tiempo (s)':>12}{'Pico (MB)':>11}{'Segmentos':>12}")
+    print("-" * 63)
+    mediciones: List[Medicion] = []
+    for motor in motores:
+        for escala in args.escalas:
+            for num_procesos in args.tamanos:
+                m = medir(motor, num_procesos, escala, args.repeticiones, args.semilla)
+                mediciones.append(m)
+                print(
+                    f"{motor:<10}{num_procesos:>10}{escala:>8g}{m['segundos']:>12.4f}"
+                    f"{m['pico_bytes'] / 1e6:>11.2f}{m['segmentos']:>12}",
+                    flush=True,
+                )
+    
+    print("\nExponente empirico (tiempo ~ n^k):")
+    estimados = exponentes(mediciones)
+    for clave, k in estimados.items():
+        print(f"  {clave:<16}{'-' if k is None else f'{k:.2f}'}")
+    
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "python": platform.python_version(),
+                    "plataforma": platform.platform(),
+                    "mediciones": mediciones,
+                    "exponentes": estimados,
+                },
+                f,
+                indent=2,
+            )
+        print(f"\nMediciones guardadas en: {args.salida}")
+    
+    if args.base:
+        with open(args.base, encoding="utf-8") as f:
+            base = json.load(f)["mediciones"]
+        regresiones = comparar(mediciones, base, args.umbral)
+        if regresiones:
+            print(f"\nRegresiones (umbral {args.umbral:.0%}):")
+            for linea in regresiones:
+                print(f"  {linea}")
+            sys.exit(1)
+        print(f"\nSin regresiones respecto de {args.base} (umbral {args.umbral:.0%}).")
+
+
+if __name__ == "__main__":
+    main()
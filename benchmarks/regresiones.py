@@ -0,0 +1,130 @@
+import argparse
+import random
+import sys
+from typing import Callable, List, Tuple
+
+from src.algorithms import MODOS_COLA, POLITICAS_SMP, simular_fcfs, simular_smp, simular_srtf
+from src.cache import CacheResultados
+from src.instrumentation import Instrumentacion
+from src.metrics import calcular_metricas
+from src.models import Proceso, ResultadoAlgoritmo, SegmentoGantt
+
+
+VELOCIDADES = ([1, 1], [1, 1, 1], [1] * 5, [2, 1], [1, 0.5, 3])
+
+
+def _metricas(resultado: ResultadoAlgoritmo) -> List[tuple]:
+
+    return [
+        (p.nombre, p.tiempo_finalizacion, p.tiempo_retorno, p.tiempo_espera, p.tiempo_respuesta)
+        for p in resultado.procesos
+    ]
+
+
+def srtf_rafagas_nulas() -> bool:
+
+
+    solo_nulas = [Proceso("P0", 0, 0), Proceso("P1", 5, 0), Proceso("P2", 5, 0), Proceso("P3", 9, 0)]
+    mixta = [Proceso("P0", 0, 6), Proceso("P1", 5, 0), Proceso("P2", 5, 3), Proceso("P3", 9, 0)]
+
+    pares = [(simular_srtf(solo_nulas), simular_fcfs(solo_nulas))]
+    for colas in MODOS_COLA:
+        pares.append((
+            simular_smp(solo_nulas, "SRTF", 2, colas=colas),
+            simular_smp(solo_nulas, "FCFS", 2, colas=colas),
+        ))
+    if any(_metricas(srtf) != _metricas(fcfs) for srtf, fcfs in pares):
+        return False
+
+    resultados = [simular_srtf(mixta)] + [simular_smp(mixta, "SRTF", 2, colas=colas) for colas in MODOS_COLA]
+    for resultado in resultados:
+        for p in resultado.procesos:
+            if min(p.tiempo_retorno, p.tiempo_espera, p.tiempo_respuesta) < 0:
+                return False
+            if p.duracion_cpu == 0 and p.tiempo_finalizacion != p.llegada:
+                return False
+    return True
+
+
+def metricas_smp_como_calcular_metricas() -> bool:
+
+
+    casos = [[Proceso("P1", 0, 4), Proceso("P2", 0, 4), Proceso("P3", 4, 4), Proceso("P4", 4, 4)]]
+    rnd = random.Random(0)
+    for _ in range(60):
+        casos.append([
+            Proceso(f"P{i}", rnd.randint(0, 30), rnd.randint(0, 10)) for i in range(rnd.randint(1, 30))
+        ])
+
+    for procesos in casos:
+        for politica in POLITICAS_SMP:
+            for colas in MODOS_COLA:
+                for velocidades in VELOCIDADES:
+                    resultado = simular_smp(
+                        procesos, politica, len(velocidades), quantum=2, colas=colas, velocidades=velocidades
+                    )
+                    procesos_trazados, promedios = calcular_metricas(procesos, list(resultado.segmentos_gantt))
+                    if procesos_trazados != resultado.procesos or promedios != resultado.promedios:
+                        return False
+                    if any(p.tiempo_espera < 0 for p in resultado.procesos):
+                        return False
+    return True
+
+
+def instrumentacion_multinucleo() -> bool:
+
+
+    procesos = [Proceso(f"P{i}", i // 4, 3 + i % 5) for i in range(40)]
+    for colas in MODOS_COLA:
+        instrumentacion = Instrumentacion()
+        simular_smp(procesos, "SRTF", 2, colas=colas, instrumentacion=instrumentacion)
+        if instrumentacion.maximos.get("cola_listos_max", 0) < 1:
+            return False
+        if instrumentacion.contadores.get("candidatos_evaluados", 0) < len(procesos):
+            return False
+    return True
+
+
+def cache_devuelve_copias() -> bool:
+
+
+    procesos = [Proceso("P0", 0, 5), Proceso("P1", 2, 3), Proceso("P2", 4, 1)]
+    cache = CacheResultados()
+    for resultado in (simular_fcfs(procesos), simular_smp(procesos, "RR", 2, quantum=2)):
+        esperado = (_metricas(resultado), dict(resultado.promedios), list(resultado.segmentos_gantt))
+        cache.guardar("clave", resultado)
+        for mutable in (resultado, cache.obtener("clave")):
+            mutable.procesos[0].tiempo_espera = -1
+            mutable.procesos.pop()
+            mutable.promedios["cambios_contexto"] = -1.0
+            mutable.segmentos_gantt.append(SegmentoGantt("P0", 90, 99))
+        releido = cache.obtener("clave")
+        if (_metricas(releido), releido.promedios, list(releido.segmentos_gantt)) != esperado:
+            return False
+    return True
+
+
+COMPROBACIONES: List[Tuple[str, Callable[[], bool]]] = [
+    ("SRTF con rafagas nulas coincide con FCFS y termina al llegar", srtf_rafagas_nulas),
+    ("simular_smp y calcular_metricas coinciden sobre trazas multinucleo, sin esperas negativas", metricas_smp_como_calcular_metricas),
+    ("simular_smp instrumentado registra el largo de cola y los candidatos evaluados", instrumentacion_multinucleo),
+    ("mutar un resultado devuelto por la cache no altera la entrada guardada", cache_devuelve_copias),
+]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Comprobaciones de regresion de errores corregidos.")
+    parser.parse_args()
+
+    fallos = 0
+    for descripcion, comprobacion in COMPROBACIONES:
+        correcta = comprobacion()
+        fallos += not correcta
+        print(f"{'ok' if correcta else 'FALLO':<7}{descripcion}")
+
+    print(f"Comprobaciones: {len(COMPROBACIONES)}, fallos: {fallos}")
+    sys.exit(1 if fallos else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,55 @@
-from .fcfs import simular_fcfs
-from .sjf import simular_sjf
-from .srtf import simular_srtf
-from .round_robin import simular_rr, simular_rr_q3, simular_rr_q6
+from .kernel import MODOS_COLA, ContextoPolitica, Politica, simular_politica
+from .registro import (
+    ALGORITMOS_REGISTRADOS,
+    REGISTRO_POLITICAS,
+    AlgoritmoRegistrado,
+    DefinicionPolitica,
+    ParametroPolitica,
+    crear_politica,
+    registrar_algoritmo,
+    registrar_politica,
+)
+from .fcfs import simular_fcfs, planificar_fcfs, PoliticaFCFS
+from .sjf import simular_sjf, PoliticaSJF
+from .srtf import simular_srtf, PoliticaSRTF
+from .round_robin import simular_rr, simular_rr_q3, simular_rr_q6, PoliticaRR
+from .smp import (
+    POLITICAS_SMP,
+    simular_smp,
+    simular_fcfs_smp,
+    simular_sjf_smp,
+    simular_srtf_smp,
+    simular_rr_smp,
+)
 
 __all__ = [
     "simular_fcfs",
+    "planificar_fcfs",
     "simular_sjf",
     "simular_srtf",
     "simular_rr",
     "simular_rr_q3",
     "simular_rr_q6",
-]
\ No newline at end of file
+    "POLITICAS_SMP",
+    "MODOS_COLA",
+    "simular_smp",
+    "simular_fcfs_smp",
+    "simular_sjf_smp",
+    "simular_srtf_smp",
+    "simular_rr_smp",
+    "Politica",
+    "ContextoPolitica",
+    "simular_politica",
+    "ParametroPolitica",
+    "DefinicionPolitica",
+    "AlgoritmoRegistrado",
+    "REGISTRO_POLITICAS",
+    "ALGORITMOS_REGISTRADOS",
+    "registrar_politica",
+    "registrar_algoritmo",
+    "crear_politica",
+    "PoliticaFCFS",
+    "PoliticaSJF",
+    "PoliticaSRTF",
+    "PoliticaRR",
+]
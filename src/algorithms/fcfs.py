@@ -1,54 +1,120 @@
-from typing import List
-from ..models import Proceso, ResultadoAlgoritmo, SegmentoGantt, ResultadoProceso
-from ..metrics import calcular_metricas
+from typing import TYPE_CHECKING, Optional, Tuple
+from ..models import Carga, ResultadoAlgoritmo, TrazaGantt, como_columnar
+from ..metrics import calcular_metricas_vectorizado
+from ..instrumentation import Instrumentacion
+from .kernel import ClaveDespacho, ContextoPolitica, Politica
+from .registro import registrar_algoritmo, registrar_politica
 
+if TYPE_CHECKING:
+    import numpy as np
 
-def simular_fcfs(procesos: List[Proceso]) -> ResultadoAlgoritmo:
+
+def planificar_fcfs(procesos: Carga) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    import numpy as np
+    
+    carga = como_columnar(procesos)
+    llegadas = carga.llegadas.astype(np.int64, copy=False)
+    duraciones = carga.duraciones.astype(np.int64, copy=False)
+    
+    
+    orden = np.argsort(llegadas, kind="stable")
+    llegadas_ordenadas = llegadas[orden]
+    
+    
+    
+    empates = np.zeros(len(orden), dtype=bool)
+    iguales = llegadas_ordenadas[1:] == llegadas_ordenadas[:-1]
+    empates[1:] |= iguales
+    empates[:-1] |= iguales
+    if empates.any():
+        sub = orden[empates]
+        nombres_sub = np.array([carga.nombres[i] for i in carga.ids[sub].tolist()])
+        orden[empates] = sub[np.lexsort((nombres_sub, llegadas[sub]))]
+        llegadas_ordenadas = llegadas[orden]
+    
     
-    if not procesos:
+    
+    duraciones_ordenadas = duraciones[orden]
+    acumulado = np.cumsum(duraciones_ordenadas)
+    holgura = np.maximum.accumulate(llegadas_ordenadas - (acumulado - duraciones_ordenadas))
+    fines = acumulado + np.maximum(holgura, 0)
+    inicios = fines - duraciones_ordenadas
+    
+    return orden, inicios, fines
+
+
+def simular_fcfs(
+    procesos: Carga,
+    generar_gantt: bool = True,
+    instrumentacion: Optional[Instrumentacion] = None,
+) -> ResultadoAlgoritmo:
+    
+    if len(procesos) == 0:
         return ResultadoAlgoritmo(
             nombre_algoritmo="FCFS",
             nombre_escenario="",
             procesos=[],
             segmentos_gantt=[],
-            promedios={}
+            promedios={},
+            perfil=instrumentacion
         )
     
+    if instrumentacion is not None:
+        instrumentacion.iniciar()
     
+    carga = como_columnar(procesos)
+    if instrumentacion is not None:
+        instrumentacion.marcar("preparacion")
     
-    procesos_ordenados = sorted(procesos, key=lambda p: (p.llegada, p.nombre))
+    orden, inicios, fines = planificar_fcfs(carga)
     
     
-    tiempo_actual = 0
-    segmentos_gantt: List[SegmentoGantt] = []
+    segmentos_gantt = TrazaGantt(carga.nombres)
+    if generar_gantt:
+        segmentos_gantt = TrazaGantt.desde_arreglos(carga.nombres, carga.ids[orden], inicios, fines)
     
-    for proceso in procesos_ordenados:
-        
-        if proceso.llegada > tiempo_actual:
-            tiempo_actual = proceso.llegada
-        
+    if instrumentacion is not None:
+        instrumentacion.marcar("simulacion")
         
-        tiempo_inicio = tiempo_actual
-        tiempo_fin = tiempo_actual + proceso.duracion_cpu
-        
-        
-        segmentos_gantt.append(SegmentoGantt(
-            proceso=proceso.nombre,
-            inicio=tiempo_inicio,
-            fin=tiempo_fin
-        ))
-        
-        
-        tiempo_actual = tiempo_fin
+        instrumentacion.contar("despachos", len(orden))
+        instrumentacion.contar("segmentos_emitidos", len(orden))
     
+    resultados_procesos, promedios = calcular_metricas_vectorizado(carga, orden, inicios, fines)
     
-    resultados_procesos, promedios = calcular_metricas(procesos, segmentos_gantt)
-    
+    if instrumentacion is not None:
+        instrumentacion.marcar("metricas")
     
     return ResultadoAlgoritmo(
         nombre_algoritmo="FCFS",
         nombre_escenario="",  
         procesos=resultados_procesos,
         segmentos_gantt=segmentos_gantt,
-        promedios=promedios
-    )
\ No newline at end of file
+        promedios=promedios,
+        perfil=instrumentacion
+    )
+
+
+@registrar_politica("FCFS", descripcion="Primero en llegar, primero en ser atendido (no expropiativo).")
+class PoliticaFCFS(Politica):
+
+    def nombre_resultado(self) -> str:
+        return "FCFS"
+
+    def clave(self, contexto: ContextoPolitica) -> ClaveDespacho:
+        llegadas, nombres = contexto.llegadas, contexto.nombres
+
+        def clave(idx: int) -> tuple:
+            return (llegadas[idx], nombres[idx], idx)
+        return clave
+
+    def simular_directo(
+        self,
+        procesos: Carga,
+        instrumentacion: Optional[Instrumentacion],
+    ) -> Optional[ResultadoAlgoritmo]:
+
+
+        return simular_fcfs(procesos, instrumentacion=instrumentacion)
+
+
+registrar_algoritmo("FCFS", "FCFS")
@@ -0,0 +1,565 @@
+import heapq
+from array import array
+from collections import deque
+from fractions import Fraction
+from math import lcm
+from typing import Callable, List, Optional, Sequence, Tuple
+from ..models import Carga, ResultadoAlgoritmo, TrazaGantt, columnas_carga
+from ..metrics import AcumuladorMetricas
+from ..instrumentation import Instrumentacion
+
+
+MODOS_COLA = ("global", "por_nucleo")
+
+
+ClaveDespacho = Callable[[int], tuple]
+
+
+class ContextoPolitica:
+
+    __slots__ = ("nombres", "llegadas", "duraciones", "restante")
+
+    def __init__(
+        self,
+        nombres: List[str],
+        llegadas: List[int],
+        duraciones: List[int],
+        restante: List[int],
+    ) -> None:
+        self.nombres = nombres
+        self.llegadas = llegadas
+        self.duraciones = duraciones
+        self.restante = restante
+
+
+class Politica:
+
+
+    expropiativa: bool = False
+    quantum: Optional[int] = None
+
+    def nombre_resultado(self) -> str:
+        return type(self).__name__
+
+    def clave(self, contexto: ContextoPolitica) -> Optional[ClaveDespacho]:
+
+
+        return None
+
+    def simular_directo(
+        self,
+        procesos: Carga,
+        instrumentacion: Optional[Instrumentacion],
+    ) -> Optional[ResultadoAlgoritmo]:
+
+
+        return None
+
+
+def _escalar_velocidades(velocidades: Sequence[float]) -> Tuple[int, List[int]]:
+
+
+    fracciones = [Fraction(v).limit_denominator(1000) for v in velocidades]
+    if any(f <= 0 for f in fracciones):
+        raise ValueError("Las velocidades de los nucleos deben ser positivas.")
+    escala = lcm(*(f.denominator for f in fracciones))
+    return escala, [int(f * escala) for f in fracciones]
+
+
+def simular_politica(
+    procesos: Carga,
+    politica: Politica,
+    num_nucleos: int = 1,
+    colas: str = "global",
+    robo_trabajo: bool = True,
+    velocidades: Optional[Sequence[float]] = None,
+    instrumentacion: Optional[Instrumentacion] = None,
+) -> ResultadoAlgoritmo:
+
+    if colas not in MODOS_COLA:
+        raise ValueError(f"Modo de cola '{colas}' no soportado. Opciones: {', '.join(MODOS_COLA)}")
+    if num_nucleos < 1:
+        raise ValueError("Se necesita al menos un nucleo.")
+    if politica.quantum is not None and politica.quantum < 1:
+        raise ValueError("El quantum debe ser positivo.")
+    if velocidades is None:
+        velocidades = [1] * num_nucleos
+    elif len(velocidades) != num_nucleos:
+        raise ValueError(f"Se esperaban {num_nucleos} velocidades y se recibieron {len(velocidades)}.")
+    escala, velocidad = _escalar_velocidades(velocidades)
+
+    un_nucleo = num_nucleos == 1 and escala == 1 and velocidad[0] == 1
+    if un_nucleo:
+        resultado = politica.simular_directo(procesos, instrumentacion)
+        if resultado is not None:
+            return resultado
+
+    return _simular(
+        procesos, politica, escala, velocidad, un_nucleo, colas == "por_nucleo", robo_trabajo, instrumentacion
+    )
+
+
+def _simular(
+    procesos: Carga,
+    politica: Politica,
+    escala: int,
+    velocidad: List[int],
+    un_nucleo: bool,
+    por_nucleo: bool,
+    robo_trabajo: bool,
+    instrumentacion: Optional[Instrumentacion],
+) -> ResultadoAlgoritmo:
+
+    if instrumentacion is not None:
+        instrumentacion.iniciar()
+
+    nombres, llegadas, duraciones = columnas_carga(procesos)
+    restante = [d * escala for d in duraciones] if escala != 1 else list(duraciones)
+    clave = politica.clave(ContextoPolitica(nombres, llegadas, duraciones, restante))
+    if politica.expropiativa and clave is None:
+        raise ValueError("Una politica expropiativa debe definir su clave de despacho.")
+    acumulador = AcumuladorMetricas(nombres, llegadas, duraciones)
+
+    if un_nucleo:
+        segmentos_gantt = _ciclo_un_nucleo(
+            politica, clave, nombres, llegadas, duraciones, restante, acumulador, instrumentacion
+        )
+        nombre_algoritmo = politica.nombre_resultado()
+    else:
+        segmentos_gantt = _ciclo_multinucleo(
+            politica, clave, nombres, llegadas, duraciones, restante, acumulador,
+            velocidad, por_nucleo, robo_trabajo, instrumentacion,
+        )
+        nombre_algoritmo = f"{politica.nombre_resultado()} SMP ({len(velocidad)} nucleos)"
+
+    if instrumentacion is not None:
+        instrumentacion.marcar("simulacion")
+
+    resultados_procesos, promedios = acumulador.resultados()
+
+    if instrumentacion is not None:
+        instrumentacion.marcar("metricas")
+
+    return ResultadoAlgoritmo(
+        nombre_algoritmo=nombre_algoritmo,
+        nombre_escenario="N/A",
+        procesos=resultados_procesos,
+        segmentos_gantt=segmentos_gantt,
+        promedios=promedios,
+        perfil=instrumentacion
+    )
+
+
+def _ciclo_un_nucleo(
+    politica: Politica,
+    clave: Optional[ClaveDespacho],
+    nombres: List[str],
+    llegadas: List[int],
+    duraciones: List[int],
+    restante: List[int],
+    acumulador: AcumuladorMetricas,
+    instrumentacion: Optional[Instrumentacion],
+) -> TrazaGantt:
+
+    total_procesos = len(nombres)
+    orden_llegada = sorted(range(total_procesos), key=llegadas.__getitem__)
+    quantum = politica.quantum
+    expropiativa = politica.expropiativa
+
+    segmentos_gantt = TrazaGantt(nombres)
+
+    fifo = clave is None
+    if fifo:
+        cola_listos = deque()
+        insertar, extraer = deque.append, deque.popleft
+    else:
+        cola_listos = []
+        insertar, extraer = heapq.heappush, heapq.heappop
+
+    cerrar_segmento = segmentos_gantt.agregar
+    registrar = acumulador.agregar
+    if instrumentacion is not None:
+        insertar = instrumentacion.instrumentar(insertar, "candidatos_evaluados", cola_listos)
+        extraer = instrumentacion.instrumentar(extraer, "despachos")
+        registrar = instrumentacion.instrumentar(registrar, "segmentos_emitidos")
+        instrumentacion.marcar("preparacion")
+
+    tiempo_actual = 0
+    idx_proxima_llegada = 0
+
+
+    proceso_actual = -1
+    inicio_segmento = 0
+
+    while idx_proxima_llegada < total_procesos or cola_listos:
+
+        while (idx_proxima_llegada < total_procesos and
+               llegadas[orden_llegada[idx_proxima_llegada]] <= tiempo_actual):
+            idx = orden_llegada[idx_proxima_llegada]
+            idx_proxima_llegada += 1
+            insertar(cola_listos, idx if fifo else clave(idx))
+
+        if not cola_listos:
+            if proceso_actual >= 0:
+                cerrar_segmento(proceso_actual, inicio_segmento, tiempo_actual)
+                registrar(proceso_actual, inicio_segmento, tiempo_actual)
+                proceso_actual = -1
+            if idx_proxima_llegada < total_procesos:
+                tiempo_actual = llegadas[orden_llegada[idx_proxima_llegada]]
+            continue
+
+        idx = extraer(cola_listos) if fifo else extraer(cola_listos)[-1]
+        if idx != proceso_actual:
+            if proceso_actual >= 0:
+                cerrar_segmento(proceso_actual, inicio_segmento, tiempo_actual)
+                registrar(proceso_actual, inicio_segmento, tiempo_actual)
+            proceso_actual = idx
+            inicio_segmento = tiempo_actual
+
+        pendiente = restante[idx]
+        tramo = pendiente
+
+
+        if quantum is not None and pendiente > quantum:
+            if cola_listos:
+                tramo = quantum
+            elif idx_proxima_llegada < total_procesos:
+                hasta_llegada = llegadas[orden_llegada[idx_proxima_llegada]] - tiempo_actual
+                tramo = min(pendiente, max(1, -(-hasta_llegada // quantum)) * quantum)
+        tiempo_fin = tiempo_actual + tramo
+
+
+        if expropiativa and idx_proxima_llegada < total_procesos:
+            proxima_llegada = llegadas[orden_llegada[idx_proxima_llegada]]
+            if proxima_llegada < tiempo_fin:
+                tiempo_fin = proxima_llegada
+
+        restante[idx] = pendiente - (tiempo_fin - tiempo_actual)
+        tiempo_actual = tiempo_fin
+
+        if restante[idx] > 0:
+
+
+            while (idx_proxima_llegada < total_procesos and
+                   llegadas[orden_llegada[idx_proxima_llegada]] <= tiempo_actual):
+                llegado = orden_llegada[idx_proxima_llegada]
+                idx_proxima_llegada += 1
+                insertar(cola_listos, llegado if fifo else clave(llegado))
+            insertar(cola_listos, idx if fifo else clave(idx))
+
+    if proceso_actual >= 0:
+        cerrar_segmento(proceso_actual, inicio_segmento, tiempo_actual)
+        registrar(proceso_actual, inicio_segmento, tiempo_actual)
+
+    return segmentos_gantt
+
+
+def _ciclo_multinucleo(
+    politica: Politica,
+    clave: Optional[ClaveDespacho],
+    nombres: List[str],
+    llegadas: List[int],
+    duraciones: List[int],
+    restante: List[int],
+    acumulador: AcumuladorMetricas,
+    velocidad: List[int],
+    por_nucleo: bool,
+    robo_trabajo: bool,
+    instrumentacion: Optional[Instrumentacion],
+) -> TrazaGantt:
+
+    total_procesos = len(nombres)
+    num_nucleos = len(velocidad)
+    orden_llegada = sorted(range(total_procesos), key=llegadas.__getitem__)
+    quantum = politica.quantum
+    expropiativa = politica.expropiativa
+    registrar = acumulador.registrar_tramo
+    insertar, extraer = heapq.heappush, heapq.heappop
+
+    if clave is None:
+        colas_listos = [deque() for _ in range(num_nucleos if por_nucleo else 1)]
+
+        def encolar(cola, idx: int) -> None:
+            cola.append(idx)
+
+        def desencolar(cola) -> int:
+            return cola.popleft()
+    else:
+        colas_listos = [[] for _ in range(num_nucleos if por_nucleo else 1)]
+
+        def encolar(cola, idx: int) -> None:
+            insertar(cola, clave(idx))
+
+        def desencolar(cola) -> int:
+            return extraer(cola)[-1]
+
+    cola_nucleo = colas_listos if por_nucleo else colas_listos * num_nucleos
+
+
+    ejecutando = [-1] * num_nucleos
+    inicio_tramo = [0] * num_nucleos
+    sincronizado = [0] * num_nucleos
+    version = [0] * num_nucleos
+    ultimo_proceso = [-1] * num_nucleos
+    cambios_por_nucleo = [0] * num_nucleos
+
+
+    eventos: List[Tuple[int, int, int]] = []
+    libres = [(-v, c) for c, v in enumerate(velocidad)]
+    heapq.heapify(libres)
+
+    ocupados: List[Tuple[int, int, int, int]] = []
+
+
+    por_carga = [(0, c) for c in range(num_nucleos)]
+    por_largo: List[Tuple[int, int]] = []
+    limite_montones = 4 * num_nucleos + 64
+
+    seg_ids, seg_inicios, seg_fines, seg_nucleos = array("q"), array("q"), array("q"), array("q")
+
+    despachos = robos = expropiaciones = 0
+    idx_proxima_llegada = 0
+
+    if instrumentacion is not None:
+        encolar = instrumentacion.instrumentar_cola(encolar, "candidatos_evaluados")
+        instrumentacion.marcar("preparacion")
+
+    def anotar(c: int) -> None:
+        nonlocal por_carga, por_largo
+        cola = cola_nucleo[c]
+        insertar(por_carga, (len(cola) + (ejecutando[c] >= 0), c))
+        if cola:
+            insertar(por_largo, (-len(cola), c))
+
+        if len(por_carga) > limite_montones:
+            por_carga = [(len(cola_nucleo[n]) + (ejecutando[n] >= 0), n) for n in range(num_nucleos)]
+            heapq.heapify(por_carga)
+        if len(por_largo) > limite_montones:
+            por_largo = [(-len(cola_nucleo[n]), n) for n in range(num_nucleos) if cola_nucleo[n]]
+            heapq.heapify(por_largo)
+
+    def menos_cargado() -> int:
+        while True:
+            carga, c = por_carga[0]
+            if carga == len(cola_nucleo[c]) + (ejecutando[c] >= 0):
+                return c
+            extraer(por_carga)
+
+    def mas_cargado() -> int:
+        while por_largo:
+            largo, c = por_largo[0]
+            if -largo == len(cola_nucleo[c]):
+                return c
+            extraer(por_largo)
+        return -1
+
+    def despachar(c: int, idx: int, tiempo: int) -> None:
+        nonlocal despachos, ocupados
+        despachos += 1
+        tramo = -(-restante[idx] // velocidad[c])
+
+
+        if quantum is not None and tramo > quantum:
+            if cola_nucleo[c]:
+                tramo = quantum
+            elif idx_proxima_llegada < total_procesos:
+                hasta_llegada = llegadas[orden_llegada[idx_proxima_llegada]] - tiempo
+                tramo = min(tramo, max(1, -(-hasta_llegada // quantum)) * quantum)
+        ejecutando[c] = idx
+        inicio_tramo[c] = sincronizado[c] = tiempo
+        version[c] += 1
+        insertar(eventos, (tiempo + tramo, c, version[c]))
+        if expropiativa and not por_nucleo:
+            insertar(ocupados, (-(tiempo + tramo), -idx, c, version[c]))
+            if len(ocupados) > limite_montones:
+                ocupados = [entrada for entrada in ocupados if entrada[3] == version[entrada[2]]]
+                heapq.heapify(ocupados)
+        if por_nucleo:
+            anotar(c)
+
+    def sincronizar(c: int, tiempo: int) -> int:
+
+
+        idx = ejecutando[c]
+        hecho = (tiempo - sincronizado[c]) * velocidad[c]
+        restante[idx] = restante[idx] - hecho if hecho < restante[idx] else 0
+        sincronizado[c] = tiempo
+        return idx
+
+    def detener(c: int, tiempo: int) -> int:
+        idx = sincronizar(c, tiempo)
+        inicio = inicio_tramo[c]
+
+
+        if tiempo > inicio or duraciones[idx] == 0:
+            if ultimo_proceso[c] != idx:
+                if ultimo_proceso[c] >= 0:
+                    cambios_por_nucleo[c] += 1
+                ultimo_proceso[c] = idx
+            seg_ids.append(idx)
+            seg_inicios.append(inicio)
+            seg_fines.append(tiempo)
+            seg_nucleos.append(c)
+            registrar(idx, inicio, tiempo)
+        ejecutando[c] = -1
+        version[c] += 1
+        if por_nucleo:
+            anotar(c)
+        return idx
+
+    def expropiar(c: int, tiempo: int) -> bool:
+
+
+        cola = cola_nucleo[c]
+        if not cola or not cola[0] < clave(sincronizar(c, tiempo)):
+            return False
+        idx = detener(c, tiempo)
+        encolar(cola, idx)
+        despachar(c, desencolar(cola), tiempo)
+        return True
+
+    liberados: List[int] = []
+    receptores: List[int] = []
+    vencidos: List[Tuple[int, int]] = []
+
+    while True:
+        while eventos and eventos[0][2] != version[eventos[0][1]]:
+            extraer(eventos)
+        if eventos:
+            tiempo_actual = eventos[0][0]
+            if (idx_proxima_llegada < total_procesos and
+                    llegadas[orden_llegada[idx_proxima_llegada]] < tiempo_actual):
+                tiempo_actual = llegadas[orden_llegada[idx_proxima_llegada]]
+        elif idx_proxima_llegada < total_procesos:
+            tiempo_actual = llegadas[orden_llegada[idx_proxima_llegada]]
+        else:
+            break
+
+
+        while (idx_proxima_llegada < total_procesos and
+               llegadas[orden_llegada[idx_proxima_llegada]] <= tiempo_actual):
+            idx = orden_llegada[idx_proxima_llegada]
+            idx_proxima_llegada += 1
+            if not por_nucleo:
+                encolar(colas_listos[0], idx)
+                continue
+            if libres:
+                c = extraer(libres)[1]
+                liberados.append(c)
+            else:
+                c = menos_cargado()
+                if expropiativa:
+                    receptores.append(c)
+            encolar(colas_listos[c], idx)
+            anotar(c)
+
+
+        while eventos and eventos[0][0] == tiempo_actual:
+            _, c, ver = extraer(eventos)
+            if ver != version[c]:
+                continue
+            idx = detener(c, tiempo_actual)
+            if restante[idx]:
+                if not por_nucleo:
+                    vencidos.append((c, idx))
+                    continue
+                if not cola_nucleo[c]:
+                    despachar(c, idx, tiempo_actual)
+                    continue
+                encolar(cola_nucleo[c], idx)
+                anotar(c)
+            if por_nucleo:
+                liberados.append(c)
+            else:
+                insertar(libres, (-velocidad[c], c))
+
+        if not por_nucleo:
+            cola = colas_listos[0]
+            while libres and cola:
+                despachar(extraer(libres)[1], desencolar(cola), tiempo_actual)
+
+
+            for c, idx in vencidos:
+                if not cola:
+                    despachar(c, idx, tiempo_actual)
+                    continue
+                encolar(cola, idx)
+                insertar(libres, (-velocidad[c], c))
+            vencidos.clear()
+            while libres and cola:
+                despachar(extraer(libres)[1], desencolar(cola), tiempo_actual)
+
+
+            while expropiativa and cola and ocupados:
+                _, _, c, ver = ocupados[0]
+                if ver != version[c]:
+                    extraer(ocupados)
+                    continue
+                if not expropiar(c, tiempo_actual):
+                    break
+                expropiaciones += 1
+            continue
+
+        for c in liberados:
+            cola = colas_listos[c]
+            if cola:
+                despachar(c, desencolar(cola), tiempo_actual)
+            else:
+                insertar(libres, (-velocidad[c], c))
+        liberados.clear()
+
+        for c in receptores:
+            if ejecutando[c] >= 0 and expropiar(c, tiempo_actual):
+                expropiaciones += 1
+        receptores.clear()
+
+
+        while robo_trabajo and libres:
+            victima = mas_cargado()
+            if victima < 0:
+                break
+            c = extraer(libres)[1]
+            idx = desencolar(colas_listos[victima])
+            anotar(victima)
+            despachar(c, idx, tiempo_actual)
+            robos += 1
+
+    acumulador.cambios_contexto = sum(cambios_por_nucleo)
+    segmentos_gantt = _traza_por_inicio(nombres, seg_ids, seg_inicios, seg_fines, seg_nucleos)
+
+    if instrumentacion is not None:
+        instrumentacion.contar("despachos", despachos)
+        instrumentacion.contar("segmentos_emitidos", len(segmentos_gantt))
+        instrumentacion.contar("robos", robos)
+        instrumentacion.contar("expropiaciones", expropiaciones)
+
+    return segmentos_gantt
+
+
+def _traza_por_inicio(
+    nombres: List[str],
+    ids: array,
+    inicios: array,
+    fines: array,
+    nucleos: array,
+) -> TrazaGantt:
+    import numpy as np
+
+    ids = np.frombuffer(ids, dtype=np.int64)
+    inicios = np.frombuffer(inicios, dtype=np.int64)
+    fines = np.frombuffer(fines, dtype=np.int64)
+    nucleos = np.frombuffer(nucleos, dtype=np.int64)
+
+
+    orden = np.lexsort((inicios, nucleos))
+    por_nucleo = TrazaGantt.desde_arreglos(
+        nombres, ids[orden], inicios[orden], fines[orden], nucleos=nucleos[orden]
+    )
+    nucleos = por_nucleo.nucleos()
+    if nucleos is None:
+        return por_nucleo
+    ids, inicios, fines = por_nucleo.arreglos()
+    orden = np.lexsort((nucleos, inicios))
+    return TrazaGantt.desde_arreglos(
+        nombres, ids[orden], inicios[orden], fines[orden], fusionar=False, nucleos=nucleos[orden]
+    )
@@ -0,0 +1,111 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Type
+from ..models import Carga, ResultadoAlgoritmo
+from ..instrumentation import Instrumentacion
+from .kernel import Politica, simular_politica
+
+
+@dataclass(frozen=True, slots=True)
+class ParametroPolitica:
+
+    nombre: str
+    tipo: type = int
+    defecto: Any = None
+    minimo: Optional[int] = None
+    descripcion: str = ""
+
+    def convertir(self, valor: Any) -> Any:
+
+        try:
+            valor = self.tipo(valor)
+        except (TypeError, ValueError):
+            raise ValueError(f"Parametro '{self.nombre}' invalido: {valor!r}.") from None
+        if self.minimo is not None and valor < self.minimo:
+            raise ValueError(f"Parametro '{self.nombre}' debe ser >= {self.minimo} (recibido {valor}).")
+        return valor
+
+
+@dataclass(frozen=True, slots=True)
+class DefinicionPolitica:
+
+    nombre: str
+    clase: Type[Politica]
+    parametros: Tuple[ParametroPolitica, ...] = ()
+    descripcion: str = ""
+
+    def crear(self, **valores: Any) -> Politica:
+
+        declarados = {p.nombre for p in self.parametros}
+        desconocidos = [n for n in valores if n not in declarados]
+        if desconocidos:
+            raise ValueError(
+                f"La politica '{self.nombre}' no acepta: {', '.join(desconocidos)}. "
+                f"Parametros: {', '.join(declarados) or 'ninguno'}"
+            )
+        argumentos = {}
+        for parametro in self.parametros:
+            valor = valores.get(parametro.nombre, parametro.defecto)
+            if valor is None:
+                raise ValueError(f"La politica '{self.nombre}' requiere el parametro '{parametro.nombre}'.")
+            argumentos[parametro.nombre] = parametro.convertir(valor)
+        return self.clase(**argumentos)
+
+
+REGISTRO_POLITICAS: Dict[str, DefinicionPolitica] = {}
+
+
+def registrar_politica(
+    nombre: str,
+    parametros: Sequence[ParametroPolitica] = (),
+    descripcion: str = "",
+) -> Callable[[Type[Politica]], Type[Politica]]:
+
+
+    clave = nombre.upper()
+
+    def decorador(clase: Type[Politica]) -> Type[Politica]:
+        if clave in REGISTRO_POLITICAS:
+            raise ValueError(f"Politica '{clave}' ya registrada.")
+        REGISTRO_POLITICAS[clave] = DefinicionPolitica(clave, clase, tuple(parametros), descripcion)
+        return clase
+
+    return decorador
+
+
+def crear_politica(nombre: str, **parametros: Any) -> Politica:
+
+    definicion = REGISTRO_POLITICAS.get(nombre.upper())
+    if definicion is None:
+        raise ValueError(
+            f"Politica '{nombre}' no registrada. Disponibles: {', '.join(REGISTRO_POLITICAS)}"
+        )
+    return definicion.crear(**parametros)
+
+
+@dataclass(frozen=True, slots=True)
+class AlgoritmoRegistrado:
+
+    politica: str
+    parametros: Tuple[Tuple[str, Any], ...] = ()
+
+    def crear_politica(self) -> Politica:
+        return crear_politica(self.politica, **dict(self.parametros))
+
+    def __call__(
+        self,
+        procesos: Carga,
+        instrumentacion: Optional[Instrumentacion] = None,
+    ) -> ResultadoAlgoritmo:
+        return simular_politica(procesos, self.crear_politica(), instrumentacion=instrumentacion)
+
+
+ALGORITMOS_REGISTRADOS: Dict[str, AlgoritmoRegistrado] = {}
+
+
+def registrar_algoritmo(nombre: str, politica: str, **parametros: Any) -> AlgoritmoRegistrado:
+
+
+    algoritmo = AlgoritmoRegistrado(politica.upper(), tuple(sorted(parametros.items())))
+    algoritmo.crear_politica()
+    ALGORITMOS_REGISTRADOS[nombre.upper()] = algoritmo
+    return algoritmo
@@ -0,0 +1,93 @@
+from typing import Optional, Sequence
+from ..models import Carga, ResultadoAlgoritmo
+from ..instrumentation import Instrumentacion
+from .kernel import simular_politica
+from .registro import REGISTRO_POLITICAS
+
+
+POLITICAS_SMP = ("FCFS", "SJF", "SRTF", "RR")
+
+
+def simular_smp(
+    procesos: Carga,
+    politica: str = "FCFS",
+    num_nucleos: int = 2,
+    quantum: Optional[int] = None,
+    colas: str = "global",
+    robo_trabajo: bool = True,
+    velocidades: Optional[Sequence[float]] = None,
+    instrumentacion: Optional[Instrumentacion] = None,
+) -> ResultadoAlgoritmo:
+
+    definicion = REGISTRO_POLITICAS.get(politica.upper())
+    if definicion is None:
+        raise ValueError(f"Politica '{politica}' no soportada. Opciones: {', '.join(REGISTRO_POLITICAS)}")
+
+
+    parametros = {}
+    if quantum is not None and any(p.nombre == "quantum" for p in definicion.parametros):
+        parametros["quantum"] = quantum
+    instancia = definicion.crear(**parametros)
+
+    resultado = simular_politica(
+        procesos, instancia, num_nucleos, colas, robo_trabajo, velocidades, instrumentacion
+    )
+    resultado.nombre_algoritmo = f"{instancia.nombre_resultado()} SMP ({num_nucleos} nucleos)"
+    return resultado
+
+
+def simular_fcfs_smp(
+    procesos: Carga,
+    num_nucleos: int = 2,
+    colas: str = "global",
+    robo_trabajo: bool = True,
+    velocidades: Optional[Sequence[float]] = None,
+    instrumentacion: Optional[Instrumentacion] = None,
+) -> ResultadoAlgoritmo:
+
+    return simular_smp(
+        procesos, "FCFS", num_nucleos, None, colas, robo_trabajo, velocidades, instrumentacion
+    )
+
+
+def simular_sjf_smp(
+    procesos: Carga,
+    num_nucleos: int = 2,
+    colas: str = "global",
+    robo_trabajo: bool = True,
+    velocidades: Optional[Sequence[float]] = None,
+    instrumentacion: Optional[Instrumentacion] = None,
+) -> ResultadoAlgoritmo:
+
+    return simular_smp(
+        procesos, "SJF", num_nucleos, None, colas, robo_trabajo, velocidades, instrumentacion
+    )
+
+
+def simular_srtf_smp(
+    procesos: Carga,
+    num_nucleos: int = 2,
+    colas: str = "global",
+    robo_trabajo: bool = True,
+    velocidades: Optional[Sequence[float]] = None,
+    instrumentacion: Optional[Instrumentacion] = None,
+) -> ResultadoAlgoritmo:
+
+    return simular_smp(
+        procesos, "SRTF", num_nucleos, None, colas, robo_trabajo, velocidades, instrumentacion
+    )
+
+
+def simular_rr_smp(
+    procesos: Carga,
+    quantum: int,
+    num_nucleos: int = 2,
+    colas: str = "global",
+    robo_trabajo: bool = True,
+    velocidades: Optional[Sequence[float]] = None,
+    instrumentacion: Optional[Instrumentacion] = None,
+) -> ResultadoAlgoritmo:
+
+    return simular_smp(
+        procesos, "RR", num_nucleos, quantum, colas, robo_trabajo, velocidades, instrumentacion
+    )
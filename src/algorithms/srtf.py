@@ -1,96 +1,29 @@
+from typing import Optional
+from ..models import Carga, ResultadoAlgoritmo
+from ..instrumentation import Instrumentacion
+from .kernel import ClaveDespacho, ContextoPolitica, Politica, simular_politica
+from .registro import registrar_algoritmo, registrar_politica
 
-from typing import List, Dict, Optional
-from ..models import Proceso, ResultadoAlgoritmo, SegmentoGantt
-from ..metrics import calcular_metricas
 
+@registrar_politica("SRTF", descripcion="Menor tiempo restante primero (expropiativo).")
+class PoliticaSRTF(Politica):
 
-def simular_srtf(procesos: List[Proceso]) -> ResultadoAlgoritmo:
-    
-    
-    
-    tiempo_actual: int = 0
-    procesos_completados: int = 0
-    total_procesos: int = len(procesos)
-    
-    
-    tiempo_restante: Dict[str, int] = {p.nombre: p.duracion_cpu for p in procesos}
-    
-    segmentos_gantt: List[SegmentoGantt] = []
-    
-    
-    proceso_ejecucion_actual: Optional[str] = None
-    inicio_segmento: int = 0
+    expropiativa = True
 
-    
-    while procesos_completados < total_procesos:
-        
-        
-        candidatos = [
-            p for p in procesos 
-            if p.llegada <= tiempo_actual and tiempo_restante[p.nombre] > 0
-        ]
+    def nombre_resultado(self) -> str:
+        return "SRTF"
 
-        if not candidatos:
-            
-            
-            if proceso_ejecucion_actual is not None:
-                segmentos_gantt.append(SegmentoGantt(
-                    proceso=proceso_ejecucion_actual,
-                    inicio=inicio_segmento,
-                    fin=tiempo_actual
-                ))
-                proceso_ejecucion_actual = None
-            
-            
-            tiempo_actual += 1
-            continue
+    def clave(self, contexto: ContextoPolitica) -> ClaveDespacho:
+        restante = contexto.restante
 
-        
-        
-        proceso_seleccionado = min(candidatos, key=lambda p: tiempo_restante[p.nombre])
+        def clave(idx: int) -> tuple:
+            return (restante[idx], idx)
+        return clave
 
-        
-        
-        if proceso_ejecucion_actual != proceso_seleccionado.nombre:
-            
-            if proceso_ejecucion_actual is not None:
-                segmentos_gantt.append(SegmentoGantt(
-                    proceso=proceso_ejecucion_actual,
-                    inicio=inicio_segmento,
-                    fin=tiempo_actual
-                ))
-            
-            
-            proceso_ejecucion_actual = proceso_seleccionado.nombre
-            inicio_segmento = tiempo_actual
 
-        
-        tiempo_restante[proceso_seleccionado.nombre] -= 1
-        tiempo_actual += 1
+def simular_srtf(procesos: Carga, instrumentacion: Optional[Instrumentacion] = None) -> ResultadoAlgoritmo:
 
-        
-        if tiempo_restante[proceso_seleccionado.nombre] == 0:
-            procesos_completados += 1
-            
+    return simular_politica(procesos, PoliticaSRTF(), instrumentacion=instrumentacion)
 
-    
-    
-    if proceso_ejecucion_actual is not None:
-        segmentos_gantt.append(SegmentoGantt(
-            proceso=proceso_ejecucion_actual,
-            inicio=inicio_segmento,
-            fin=tiempo_actual
-        ))
 
-    
-    
-    resultados_procesos, promedios = calcular_metricas(procesos, segmentos_gantt)
-
-    
-    return ResultadoAlgoritmo(
-        nombre_algoritmo="SRTF",
-        nombre_escenario="N/A",  
-        procesos=resultados_procesos,
-        segmentos_gantt=segmentos_gantt,
-        promedios=promedios
-    )
+registrar_algoritmo("SRTF", "SRTF")
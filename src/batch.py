@@ -0,0 +1,296 @@
+import argparse
+import json
+import os
+import sys
+from dataclasses import asdict
+from typing import IO, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .cache import huella_carga
+from .models import Proceso, columnas_carga
+from .quantum_sweep import METRICAS_QUANTUM, barrer_quantums, optimizar_quantum
+from .simulation import (
+    MAPA_ALGORITMOS,
+    Escenario,
+    cargar_escenario,
+    ejecutar_algoritmo_en_escenario,
+)
+from .export_json import resultado_algoritmo_a_dict
+
+
+def _proceso_desde_json(dato) -> Proceso:
+    if isinstance(dato, dict):
+        return Proceso(
+            nombre=str(dato["nombre"]),
+            llegada=int(dato["llegada"]),
+            duracion_cpu=int(dato["duracion_cpu"]),
+        )
+    nombre, llegada, duracion = dato
+    return Proceso(nombre=str(nombre), llegada=int(llegada), duracion_cpu=int(duracion))
+
+
+def carga_desde_registro(registro: dict) -> Escenario:
+    
+    if "procesos" in registro:
+        return [_proceso_desde_json(p) for p in registro["procesos"]]
+    if "archivo" in registro:
+        from .loaders import cargar_archivo_carga
+        return cargar_archivo_carga(str(registro["archivo"]), columnar=True)
+    if "generador" in registro:
+        return dict(registro["generador"])
+    if "escenario" in registro:
+        escenario = registro["escenario"]
+        if isinstance(escenario, str) and escenario.isdigit():
+            return int(escenario)
+        return escenario
+    raise ValueError("El registro debe tener 'procesos', 'archivo', 'generador' o 'escenario'.")
+
+
+RegistroCarga = Tuple[str, Optional[dict], Optional[str]]
+
+
+def leer_cargas(flujo: IO[str], origen: str = "<stdin>") -> Iterator[RegistroCarga]:
+    
+    for num_linea, linea in enumerate(flujo, 1):
+        linea = linea.strip()
+        if not linea:
+            continue
+        ubicacion = f"{origen}:{num_linea}"
+        try:
+            registro = json.loads(linea)
+        except json.JSONDecodeError as e:
+            yield ubicacion, None, f"JSON invalido: {e}"
+            continue
+        if not isinstance(registro, dict):
+            yield ubicacion, None, "Se esperaba un objeto JSON por linea."
+            continue
+        yield str(registro.get("id", ubicacion)), registro, None
+
+
+def leer_archivos(rutas: Iterable[str]) -> Iterator[RegistroCarga]:
+    
+    for ruta in rutas:
+        if ruta == "-":
+            yield from leer_cargas(sys.stdin)
+            continue
+        with open(ruta, encoding="utf-8") as flujo:
+            yield from leer_cargas(flujo, ruta)
+
+
+def ejecutar_cargas(
+    registros: Iterable[RegistroCarga],
+    algoritmos: Sequence[str],
+    salida: IO[str],
+    incluir_gantt: bool = False,
+    compacto: bool = True,
+    incluir_perfil: bool = False,
+) -> int:
+    
+    errores = 0
+    separadores = (",", ":") if compacto else None
+    
+    def emitir(registro: dict) -> None:
+        salida.write(json.dumps(registro, ensure_ascii=False, separators=separadores))
+        salida.write("\n")
+        salida.flush()
+    
+    for id_carga, registro, error in registros:
+        if error is not None:
+            errores += 1
+            emitir({"carga": id_carga, "error": error})
+            continue
+        
+        try:
+            escenario_data = cargar_escenario(carga_desde_registro(registro))
+        except (KeyError, TypeError, ValueError, OSError) as e:
+            errores += 1
+            emitir({"carga": id_carga, "error": f"Carga invalida: {e}"})
+            continue
+        
+        huella = None
+        if len(algoritmos) > 1 and not incluir_perfil:
+            huella = huella_carga(escenario_data["procesos"])
+        for nombre_algoritmo in algoritmos:
+            try:
+                resultado = ejecutar_algoritmo_en_escenario(
+                    nombre_algoritmo,
+                    escenario_data["procesos"],
+                    instrumentar=incluir_perfil,
+                    huella=huella,
+                )
+            except ValueError as e:
+                errores += 1
+                emitir({"carga": id_carga, "algoritmo": nombre_algoritmo, "error": str(e)})
+                continue
+            resultado.nombre_escenario = escenario_data["nombre"]
+            
+            datos = {"carga": id_carga, "algoritmo": nombre_algoritmo}
+            datos.update(resultado_algoritmo_a_dict(resultado, incluir_gantt))
+            if incluir_perfil and resultado.perfil is not None:
+                datos["perfil"] = resultado.perfil.a_dict()
+            emitir(datos)
+    
+    return errores
+
+
+def _parsear_algoritmos(texto: Optional[str]) -> List[str]:
+    if not texto:
+        return list(MAPA_ALGORITMOS)
+    algoritmos = [a.strip().upper() for a in texto.split(",") if a.strip()]
+    desconocidos = [a for a in algoritmos if a not in MAPA_ALGORITMOS]
+    if desconocidos:
+        raise argparse.ArgumentTypeError(
+            f"Algoritmos no reconocidos: {', '.join(desconocidos)}. "
+            f"Disponibles: {', '.join(MAPA_ALGORITMOS)}"
+        )
+    return algoritmos
+
+
+def construir_parser() -> argparse.ArgumentParser:
+    
+    parser = argparse.ArgumentParser(
+        prog="python -m src.main",
+        description="Modo por lotes del simulador: lee cargas y emite un resultado JSONL por carga y algoritmo.",
+    )
+    subparsers = parser.add_subparsers(dest="comando", required=True)
+    
+    comun = argparse.ArgumentParser(add_help=False)
+    comun.add_argument(
+        "-a", "--algoritmos",
+        type=_parsear_algoritmos,
+        default=list(MAPA_ALGORITMOS),
+        help="lista separada por comas (por defecto: todos)",
+    )
+    comun.add_argument("--gantt", action="store_true", help="incluir los segmentos de Gantt")
+    comun.add_argument("--indentado", action="store_true", help="JSON con espacios (no compacto)")
+    comun.add_argument(
+        "--perfil",
+        action="store_true",
+        help="incluir tiempos por fase y contadores internos del motor (desactiva la cache)",
+    )
+    
+    p_ejecutar = subparsers.add_parser(
+        "ejecutar",
+        parents=[comun],
+        help="simular cargas JSONL leidas de archivos o de stdin",
+    )
+    p_ejecutar.add_argument(
+        "archivos",
+        nargs="*",
+        default=["-"],
+        help="archivos JSONL con un objeto {id, procesos | archivo | generador | escenario} por linea ('-' = stdin)",
+    )
+    
+    p_escenario = subparsers.add_parser(
+        "escenario",
+        parents=[comun],
+        help="simular escenarios predefinidos",
+    )
+    p_escenario.add_argument("ids", nargs="+", type=int)
+    
+    subparsers.add_parser("algoritmos", help="listar los algoritmos disponibles")
+    
+    p_quantum = subparsers.add_parser(
+        "quantum",
+        help="barrer u optimizar el quantum de Round Robin sobre una carga",
+    )
+    origen = p_quantum.add_mutually_exclusive_group(required=True)
+    origen.add_argument("--escenario", help="id de un escenario registrado")
+    origen.add_argument("--archivo", help="archivo CSV/JSONL con la carga")
+    origen.add_argument("--generador", type=json.loads, help="parametros de generacion en JSON")
+    p_quantum.add_argument("--desde", type=int, default=1)
+    p_quantum.add_argument("--hasta", type=int, default=None, help="por defecto: rafaga maxima")
+    p_quantum.add_argument("--paso", type=int, default=1)
+    p_quantum.add_argument(
+        "--optimizar",
+        choices=sorted(METRICAS_QUANTUM),
+        help="buscar el quantum que minimiza la metrica sin evaluar todo el rango "
+        "(aproximado: refina alrededor de los mejores puntos y puede perder un minimo aislado)",
+    )
+    p_quantum.add_argument("--workers", type=int, default=None)
+    p_quantum.add_argument("--jsonl", action="store_true", help="emitir una fila JSON por quantum")
+    
+    return parser
+
+
+def ejecutar_quantum(args: argparse.Namespace, salida: IO[str]) -> int:
+    
+    if args.archivo:
+        escenario = carga_desde_registro({"archivo": args.archivo})
+    elif args.generador is not None:
+        escenario = carga_desde_registro({"generador": args.generador})
+    else:
+        escenario = carga_desde_registro({"escenario": args.escenario})
+    procesos = cargar_escenario(escenario)["procesos"]
+    
+    if args.optimizar:
+        mejor, filas = optimizar_quantum(
+            procesos,
+            args.optimizar,
+            q_min=args.desde,
+            q_max=args.hasta,
+            max_workers=args.workers,
+        )
+    else:
+        hasta = args.hasta
+        if hasta is None:
+            hasta = max(columnas_carga(procesos)[2], default=args.desde)
+        filas = barrer_quantums(
+            procesos,
+            range(args.desde, hasta + 1, max(1, args.paso)),
+            max_workers=args.workers,
+        )
+    
+    if args.jsonl:
+        for fila in filas:
+            salida.write(json.dumps(asdict(fila), separators=(",", ":")) + "\n")
+    else:
+        from .formatters import tabla_barrido_quantums
+        salida.write(tabla_barrido_quantums(filas, args.optimizar) + "\n")
+        if args.optimizar:
+            salida.write(
+                f"\nMejor quantum para '{args.optimizar}': {mejor.quantum} "
+                f"({len(filas)} quantums evaluados; busqueda aproximada, "
+                f"el barrido sin --optimizar evalua todo el rango)\n"
+            )
+    return 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    
+    args = construir_parser().parse_args(argv)
+    salida = sys.stdout
+    
+    if args.comando == "algoritmos":
+        for nombre in MAPA_ALGORITMOS:
+            salida.write(nombre + "\n")
+        return 0
+    
+    if args.comando == "quantum":
+        try:
+            return ejecutar_quantum(args, salida)
+        except (KeyError, TypeError, ValueError, OSError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+    
+    if args.comando == "escenario":
+        registros = ((str(i), {"escenario": i}, None) for i in args.ids)
+    else:
+        registros = leer_archivos(args.archivos)
+    
+    try:
+        errores = ejecutar_cargas(
+            registros,
+            args.algoritmos,
+            salida,
+            incluir_gantt=args.gantt,
+            compacto=not args.indentado,
+            incluir_perfil=args.perfil,
+        )
+    except BrokenPipeError:
+        
+        os.dup2(os.open(os.devnull, os.O_WRONLY), salida.fileno())
+        return 1
+    except OSError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return 1 if errores else 0
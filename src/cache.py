@@ -0,0 +1,252 @@
+import copy
+import hashlib
+import json
+import os
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from .models import (
+    Carga,
+    CargaColumnar,
+    ResultadoAlgoritmo,
+    ResultadoProceso,
+    SegmentoGantt,
+    TrazaGantt,
+    columnas_carga,
+)
+
+
+VERSION_CACHE = 2
+
+
+MAX_BYTES_MEMORIA = 256 * 1024 * 1024
+
+
+VARIABLE_DIRECTORIO = "SIMULADOR_CACHE_DIR"
+
+
+BYTES_POR_PROCESO = 240
+BYTES_POR_SEGMENTO = 72
+
+
+def huella_carga(procesos: Carga) -> str:
+    
+    h = hashlib.sha256()
+    if isinstance(procesos, CargaColumnar):
+        import numpy as np
+        
+        nombres = procesos.nombres_procesos()
+        llegadas = np.ascontiguousarray(procesos.llegadas, dtype=np.int64).tobytes()
+        duraciones = np.ascontiguousarray(procesos.duraciones, dtype=np.int64).tobytes()
+    else:
+        nombres, lista_llegadas, lista_duraciones = columnas_carga(procesos)
+        llegadas = array("q", lista_llegadas).tobytes()
+        duraciones = array("q", lista_duraciones).tobytes()
+    
+    h.update(len(nombres).to_bytes(8, "little"))
+    h.update(llegadas)
+    h.update(duraciones)
+    h.update("\0".join(nombres).encode("utf-8"))
+    return h.hexdigest()
+
+
+def clave_resultado(
+    procesos: Carga,
+    nombre_algoritmo: str,
+    parametros: Optional[Dict[str, Any]] = None,
+) -> str:
+    
+    return clave_desde_huella(huella_carga(procesos), nombre_algoritmo, parametros)
+
+
+def clave_desde_huella(
+    huella: str,
+    nombre_algoritmo: str,
+    parametros: Optional[Dict[str, Any]] = None,
+) -> str:
+    
+    descriptor = json.dumps(
+        {
+            "version": VERSION_CACHE,
+            "carga": huella,
+            "algoritmo": nombre_algoritmo,
+            "parametros": parametros or {},
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(descriptor.encode("utf-8")).hexdigest()
+
+
+def bytes_estimados(resultado: ResultadoAlgoritmo) -> int:
+    
+    segmentos = resultado.segmentos_gantt
+    if isinstance(segmentos, TrazaGantt):
+        bytes_gantt = segmentos.nbytes
+    else:
+        bytes_gantt = len(segmentos) * BYTES_POR_SEGMENTO
+    return len(resultado.procesos) * BYTES_POR_PROCESO + bytes_gantt
+
+
+def copiar_resultado(resultado: ResultadoAlgoritmo) -> ResultadoAlgoritmo:
+    
+    
+    segmentos = resultado.segmentos_gantt
+    if isinstance(segmentos, TrazaGantt):
+        segmentos = segmentos.copia()
+    else:
+        segmentos = [SegmentoGantt(s.proceso, s.inicio, s.fin, s.nucleo) for s in segmentos]
+    return ResultadoAlgoritmo(
+        nombre_algoritmo=resultado.nombre_algoritmo,
+        nombre_escenario=resultado.nombre_escenario,
+        procesos=[
+            ResultadoProceso(
+                p.nombre,
+                p.llegada,
+                p.duracion_cpu,
+                p.tiempo_finalizacion,
+                p.tiempo_retorno,
+                p.tiempo_espera,
+                p.tiempo_respuesta,
+            )
+            for p in resultado.procesos
+        ],
+        segmentos_gantt=segmentos,
+        promedios=dict(resultado.promedios),
+        perfil=copy.deepcopy(resultado.perfil),
+    )
+
+
+class CacheResultados:
+    
+    def __init__(
+        self,
+        max_bytes_memoria: int = MAX_BYTES_MEMORIA,
+        directorio: Optional[str] = None,
+    ) -> None:
+        self.max_bytes_memoria = max_bytes_memoria
+        self.directorio = directorio
+        self._memoria: "OrderedDict[str, Tuple[ResultadoAlgoritmo, int]]" = OrderedDict()
+        self._bytes_memoria = 0
+        self._lock = threading.Lock()
+        self.aciertos = 0
+        self.fallos = 0
+        
+        
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._reiniciar_lock)
+
+    def _reiniciar_lock(self) -> None:
+        self._lock = threading.Lock()
+
+    def _ruta_disco(self, clave: str) -> str:
+        return os.path.join(self.directorio, clave[:2], f"{clave}.pkl")
+
+    def _guardar_en_memoria(self, clave: str, resultado: ResultadoAlgoritmo) -> None:
+        tamano = bytes_estimados(resultado)
+        if tamano > self.max_bytes_memoria:
+            return
+        with self._lock:
+            anterior = self._memoria.pop(clave, None)
+            if anterior is not None:
+                self._bytes_memoria -= anterior[1]
+            self._memoria[clave] = (resultado, tamano)
+            self._bytes_memoria += tamano
+            while self._bytes_memoria > self.max_bytes_memoria:
+                _, (_, expulsado) = self._memoria.popitem(last=False)
+                self._bytes_memoria -= expulsado
+
+    def _leer_disco(self, clave: str) -> Optional[bytes]:
+        if self.directorio is None:
+            return None
+        try:
+            with open(self._ruta_disco(clave), "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _escribir_disco(self, clave: str, datos: bytes) -> None:
+        if self.directorio is None:
+            return
+        import tempfile
+        
+        ruta = self._ruta_disco(clave)
+        try:
+            os.makedirs(os.path.dirname(ruta), exist_ok=True)
+            
+            
+            descriptor, temporal = tempfile.mkstemp(dir=os.path.dirname(ruta), suffix=".tmp")
+            try:
+                with os.fdopen(descriptor, "wb") as f:
+                    f.write(datos)
+                os.replace(temporal, ruta)
+            except BaseException:
+                os.unlink(temporal)
+                raise
+        except OSError:
+            pass
+
+    def obtener(self, clave: str) -> Optional[ResultadoAlgoritmo]:
+        
+        with self._lock:
+            entrada = self._memoria.get(clave)
+            if entrada is not None:
+                self._memoria.move_to_end(clave)
+        
+        if entrada is not None:
+            resultado = entrada[0]
+        else:
+            resultado = None
+            datos = self._leer_disco(clave)
+            if datos is not None:
+                import pickle
+                
+                try:
+                    resultado = pickle.loads(datos)
+                except Exception:
+                    resultado = None
+                if isinstance(resultado, ResultadoAlgoritmo):
+                    self._guardar_en_memoria(clave, resultado)
+                else:
+                    resultado = None
+        
+        if resultado is not None:
+            self.aciertos += 1
+            return copiar_resultado(resultado)
+        
+        self.fallos += 1
+        return None
+
+    def guardar(self, clave: str, resultado: ResultadoAlgoritmo) -> None:
+        
+        self._guardar_en_memoria(clave, copiar_resultado(resultado))
+        if self.directorio is not None:
+            import pickle
+            
+            self._escribir_disco(clave, pickle.dumps(resultado, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def limpiar(self, incluir_disco: bool = False) -> None:
+        
+        with self._lock:
+            self._memoria.clear()
+            self._bytes_memoria = 0
+        if incluir_disco and self.directorio is not None:
+            for raiz, _, archivos in os.walk(self.directorio):
+                for nombre in archivos:
+                    if nombre.endswith(".pkl"):
+                        try:
+                            os.unlink(os.path.join(raiz, nombre))
+                        except OSError:
+                            pass
+
+    @property
+    def bytes_en_memoria(self) -> int:
+        return self._bytes_memoria
+
+    def __len__(self) -> int:
+        return len(self._memoria)
+
+
+CACHE_RESULTADOS = CacheResultados(directorio=os.environ.get(VARIABLE_DIRECTORIO) or None)
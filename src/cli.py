@@ -15,7 +15,7 @@ from typing import Union
 from .models import ResultadoAlgoritmo
 
 from .simulation import (
-    ALGORITMOS_DISPONIBLES,
+    MAPA_ALGORITMOS,
     ejecutar_algoritmo_en_escenario,
     ejecutar_todos_los_algoritmos,
 )
@@ -54,27 +54,28 @@ def seleccionar_escenario() -> int:
 
 
 def seleccionar_algoritmo() -> str:
+    disponibles = tuple(MAPA_ALGORITMOS)
     while True:
         print("\n" + "=" * 60)
         print("SELECCIONAR ALGORITMO")
         print("=" * 60)
         
-        for i, algo in enumerate(ALGORITMOS_DISPONIBLES, 1):
+        for i, algo in enumerate(disponibles, 1):
             print(f"{i}. {algo}")
         
-        print(f"{len(ALGORITMOS_DISPONIBLES) + 1}. Ejecutar TODOS")
+        print(f"{len(disponibles) + 1}. Ejecutar TODOS")
         print("-" * 60)
         
         entrada = input("Ingrese el numero del algoritmo: ").strip()
         
         try:
             opcion = int(entrada)
-            if 1 <= opcion <= len(ALGORITMOS_DISPONIBLES):
-                return ALGORITMOS_DISPONIBLES[opcion - 1]
-            elif opcion == len(ALGORITMOS_DISPONIBLES) + 1:
+            if 1 <= opcion <= len(disponibles):
+                return disponibles[opcion - 1]
+            elif opcion == len(disponibles) + 1:
                 return "TODOS"
             else:
-                print(f"Opciun invulida. Ingrese un numero entre 1 y {len(ALGORITMOS_DISPONIBLES) + 1}.")
+                print(f"Opciun invulida. Ingrese un numero entre 1 y {len(disponibles) + 1}.")
         except ValueError:
             print("Entrada invulida. Por favor, ingrese un numero.")
 
@@ -146,7 +147,6 @@ def mostrar_resultados_multiples(resultados: dict, mostrar_graficos: bool = Fals
     print("\n" + separador(100))
     
     if mostrar_graficos:
-        datos_para_graficar = {
         datos_para_graficar = {
             nombre: resultado.segmentos_gantt 
             for nombre, resultado in resultados.items()
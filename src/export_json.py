@@ -1,46 +1,262 @@
+import gzip
 import json
-from typing import Dict
-from .models import ResultadoAlgoritmo, ResultadoProceso
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Tuple
+from .models import ResultadoAlgoritmo, ResultadoProceso, SegmentosGantt, TrazaGantt
 
 
-def resultado_algoritmo_a_dict(resultado: ResultadoAlgoritmo) -> dict:
-    
+TAMANO_LOTE = 1024
+
+
+def _proceso_a_dict(p: ResultadoProceso) -> dict:
     return {
+        "nombre": p.nombre,
+        "llegada": p.llegada,
+        "duracion_cpu": p.duracion_cpu,
+        "tiempo_finalizacion": p.tiempo_finalizacion,
+        "tiempo_retorno": p.tiempo_retorno,
+        "tiempo_espera": p.tiempo_espera,
+        "tiempo_respuesta": p.tiempo_respuesta,
+    }
+
+
+def resultado_algoritmo_a_dict(resultado: ResultadoAlgoritmo, incluir_gantt: bool = False) -> dict:
+    
+    datos = {
         "nombre_algoritmo": resultado.nombre_algoritmo,
         "nombre_escenario": resultado.nombre_escenario,
-        "procesos": [
-            {
-                "nombre": p.nombre,
-                "llegada": p.llegada,
-                "duracion_cpu": p.duracion_cpu,
-                "tiempo_finalizacion": p.tiempo_finalizacion,
-                "tiempo_retorno": p.tiempo_retorno,
-                "tiempo_espera": p.tiempo_espera,
-                "tiempo_respuesta": p.tiempo_respuesta,
-            }
-            for p in resultado.procesos
-        ],
+        "procesos": [_proceso_a_dict(p) for p in resultado.procesos],
         
         "promedios": resultado.promedios,
     }
+    if incluir_gantt:
+        segmentos = resultado.segmentos_gantt
+        if _tiene_nucleos(segmentos):
+            datos["segmentos_gantt"] = [[s.proceso, s.inicio, s.fin, s.nucleo] for s in segmentos]
+        else:
+            datos["segmentos_gantt"] = [[s.proceso, s.inicio, s.fin] for s in segmentos]
+    return datos
+
+
+def _tiene_nucleos(segmentos: SegmentosGantt) -> bool:
+    
+    
+    if isinstance(segmentos, TrazaGantt):
+        return segmentos.nucleos() is not None
+    return any(s.nucleo for s in segmentos)
+
+
+def _lotes_segmentos(
+    segmentos: SegmentosGantt,
+) -> Iterator[Tuple[List[str], List[int], List[int], List[int]]]:
+    
+    
+    if isinstance(segmentos, TrazaGantt):
+        ids, inicios, fines = segmentos.arreglos()
+        nucleos = segmentos.nucleos()
+        nombres = segmentos.nombres
+        for i in range(0, len(ids), TAMANO_LOTE):
+            fin_lote = i + TAMANO_LOTE
+            yield (
+                [nombres[j] for j in ids[i:fin_lote].tolist()],
+                inicios[i:fin_lote].tolist(),
+                fines[i:fin_lote].tolist(),
+                nucleos[i:fin_lote].tolist() if nucleos is not None else [0] * len(ids[i:fin_lote]),
+            )
+        return
+    for i in range(0, len(segmentos), TAMANO_LOTE):
+        lote = segmentos[i:i + TAMANO_LOTE]
+        yield [s.proceso for s in lote], [s.inicio for s in lote], [s.fin for s in lote], [s.nucleo for s in lote]
+
+
+def _segmentos_codificados(
+    segmentos: SegmentosGantt,
+    plantilla: str,
+    plantilla_nucleo: str,
+) -> Iterator[str]:
+    
+    
+    con_nucleo = _tiene_nucleos(segmentos)
+    codificados: Dict[str, str] = {}
+    for nombres, inicios, fines, nucleos in _lotes_segmentos(segmentos):
+        for nombre, inicio, fin, nucleo in zip(nombres, inicios, fines, nucleos):
+            nombre_json = codificados.get(nombre)
+            if nombre_json is None:
+                nombre_json = codificados[nombre] = json.dumps(nombre, ensure_ascii=False)
+            if con_nucleo:
+                yield plantilla_nucleo % (nombre_json, inicio, fin, nucleo)
+            else:
+                yield plantilla % (nombre_json, inicio, fin)
+
+
+def abrir_salida(ruta: str, comprimir: Optional[bool] = None) -> IO[str]:
+    
+    if comprimir is None:
+        comprimir = ruta.endswith(".gz")
+    if comprimir:
+        return gzip.open(ruta, "wt", encoding="utf-8", compresslevel=6)
+    return open(ruta, "w", encoding="utf-8")
+
+
+def _escribir_por_lotes(flujo: IO[str], lineas: Iterator[str]) -> None:
+    
+    lote: List[str] = []
+    for linea in lineas:
+        lote.append(linea)
+        if len(lote) >= TAMANO_LOTE:
+            flujo.write("".join(lote))
+            lote.clear()
+    if lote:
+        flujo.write("".join(lote))
+
+
+def _escribir_arreglo(
+    flujo: IO[str],
+    elementos: Iterable[str],
+    sangria: Optional[str],
+) -> None:
+    
+    
+    if sangria is None:
+        separador, apertura, cierre = ",", "[", "]"
+    else:
+        separador, apertura, cierre = ",\n" + sangria + "  ", "[\n" + sangria + "  ", "\n" + sangria + "]"
+    
+    def lineas() -> Iterator[str]:
+        primero = True
+        for elemento in elementos:
+            if primero:
+                yield apertura + elemento
+                primero = False
+            else:
+                yield separador + elemento
+        if primero:
+            yield "[]"
+        else:
+            yield cierre
+    
+    _escribir_por_lotes(flujo, lineas())
 
 
-def exportar_resultado_json(resultado: ResultadoAlgoritmo, ruta: str) -> None:
+def escribir_resultado_json(
+    resultado: ResultadoAlgoritmo,
+    flujo: IO[str],
+    incluir_gantt: bool = True,
+    indentado: bool = True,
+    nivel: int = 0,
+) -> None:
+    
+    if indentado:
+        sangria = "  " * (nivel + 1)
+        
+        def valor(dato, extra: str = "") -> str:
+            return json.dumps(dato, ensure_ascii=False, indent=2).replace("\n", "\n" + sangria + extra)
+        
+        plantilla_segmento = "[%s, %d, %d]"
+        plantilla_nucleo = "[%s, %d, %d, %d]"
+        def clave(nombre: str) -> str:
+            return "\n" + sangria + json.dumps(nombre) + ": "
+        
+        abre, cierra, coma = "{", "\n" + "  " * nivel + "}", ","
+    else:
+        sangria = None
+        
+        def valor(dato, extra: str = "") -> str:
+            return json.dumps(dato, ensure_ascii=False, separators=(",", ":"))
+        
+        plantilla_segmento = "[%s,%d,%d]"
+        plantilla_nucleo = "[%s,%d,%d,%d]"
+        def clave(nombre: str) -> str:
+            return json.dumps(nombre) + ":"
+        
+        abre, cierra, coma = "{", "}", ","
+    
+    flujo.write(abre)
+    flujo.write(clave("nombre_algoritmo") + valor(resultado.nombre_algoritmo) + coma)
+    flujo.write(clave("nombre_escenario") + valor(resultado.nombre_escenario) + coma)
+    flujo.write(clave("procesos"))
+    _escribir_arreglo(flujo, (valor(_proceso_a_dict(p), "  ") for p in resultado.procesos), sangria)
+    flujo.write(coma + clave("promedios") + valor(resultado.promedios))
+    if incluir_gantt:
+        flujo.write(coma + clave("segmentos_gantt"))
+        _escribir_arreglo(flujo, _segmentos_codificados(resultado.segmentos_gantt, plantilla_segmento, plantilla_nucleo), sangria)
+    flujo.write(cierra)
+
+
+def exportar_resultado_json(
+    resultado: ResultadoAlgoritmo,
+    ruta: str,
+    incluir_gantt: bool = True,
+    indentado: bool = True,
+    comprimir: Optional[bool] = None,
+) -> None:
     
-    data = resultado_algoritmo_a_dict(resultado)
-    with open(ruta, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    with abrir_salida(ruta, comprimir) as f:
+        escribir_resultado_json(resultado, f, incluir_gantt, indentado)
 
 
 def exportar_resultados_multiples_json(
     resultados: Dict[str, ResultadoAlgoritmo],
     ruta: str,
+    incluir_gantt: bool = True,
+    indentado: bool = True,
+    comprimir: Optional[bool] = None,
 ) -> None:
     
     
-    data = {
-        nombre_algo: resultado_algoritmo_a_dict(res)
-        for nombre_algo, res in resultados.items()
+    with abrir_salida(ruta, comprimir) as f:
+        f.write("{")
+        for i, (nombre_algo, res) in enumerate(resultados.items()):
+            if i:
+                f.write(",")
+            if indentado:
+                f.write("\n  " + json.dumps(nombre_algo, ensure_ascii=False) + ": ")
+                escribir_resultado_json(res, f, incluir_gantt, indentado, nivel=1)
+            else:
+                f.write(json.dumps(nombre_algo, ensure_ascii=False) + ":")
+                escribir_resultado_json(res, f, incluir_gantt, indentado)
+        f.write("\n}" if indentado and resultados else "}")
+
+
+def _registros_jsonl(resultado: ResultadoAlgoritmo) -> Iterator[dict]:
+    
+    algoritmo = resultado.nombre_algoritmo
+    yield {
+        "tipo": "resultado",
+        "algoritmo": algoritmo,
+        "nombre_escenario": resultado.nombre_escenario,
     }
-    with open(ruta, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
\ No newline at end of file
+    for p in resultado.procesos:
+        registro = {"tipo": "proceso", "algoritmo": algoritmo}
+        registro.update(_proceso_a_dict(p))
+        yield registro
+    yield {"tipo": "promedios", "algoritmo": algoritmo, **resultado.promedios}
+
+
+def escribir_resultados_jsonl(
+    resultados: Iterable[ResultadoAlgoritmo],
+    flujo: IO[str],
+) -> None:
+    
+    codificar = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    for resultado in resultados:
+        _escribir_por_lotes(flujo, (codificar(r) + "\n" for r in _registros_jsonl(resultado)))
+        
+        
+        prefijo = '{"tipo":"segmento","algoritmo":' + codificar(resultado.nombre_algoritmo).replace("%", "%%")
+        plantilla = prefijo + ',"proceso":%s,"inicio":%d,"fin":%d}\n'
+        plantilla_nucleo = prefijo + ',"proceso":%s,"inicio":%d,"fin":%d,"nucleo":%d}\n'
+        _escribir_por_lotes(flujo, _segmentos_codificados(resultado.segmentos_gantt, plantilla, plantilla_nucleo))
+
+
+def exportar_resultados_jsonl(
+    resultados: Iterable[ResultadoAlgoritmo],
+    ruta: str,
+    comprimir: Optional[bool] = None,
+) -> None:
+    
+    if isinstance(resultados, ResultadoAlgoritmo):
+        resultados = [resultados]
+    elif isinstance(resultados, dict):
+        resultados = resultados.values()
+    with abrir_salida(ruta, comprimir) as f:
+        escribir_resultados_jsonl(resultados, f)
@@ -0,0 +1,252 @@
+import struct
+import zipfile
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Tuple, Union
+
+from .models import ResultadoAlgoritmo, ResultadoProceso, SegmentosGantt, TrazaGantt
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+METRICAS_PROCESO = (
+    "llegada",
+    "duracion_cpu",
+    "tiempo_finalizacion",
+    "tiempo_retorno",
+    "tiempo_espera",
+    "tiempo_respuesta",
+)
+
+
+ResultadosExportables = Union[Dict[str, ResultadoAlgoritmo], Iterable[ResultadoAlgoritmo]]
+
+
+def _columnas_gantt(segmentos: SegmentosGantt) -> Tuple[List[str], "np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray"]:
+    import numpy as np
+    
+    if isinstance(segmentos, TrazaGantt):
+        nucleos = segmentos.nucleos()
+        if nucleos is None:
+            nucleos = np.zeros(len(segmentos), dtype=np.int64)
+        return (segmentos.nombres,) + segmentos.arreglos() + (nucleos,)
+    
+    indice_por_nombre: Dict[str, int] = {}
+    ids = [indice_por_nombre.setdefault(s.proceso, len(indice_por_nombre)) for s in segmentos]
+    return (
+        list(indice_por_nombre),
+        np.asarray(ids, dtype=np.int64),
+        np.asarray([s.inicio for s in segmentos], dtype=np.int64),
+        np.asarray([s.fin for s in segmentos], dtype=np.int64),
+        np.asarray([s.nucleo for s in segmentos], dtype=np.int64),
+    )
+
+
+def _texto(valores: List[str], ancho: int) -> "np.ndarray":
+    import numpy as np
+    
+    return np.asarray(valores, dtype=f"<U{max(1, ancho)}")
+
+
+def _ancho(valores: Iterable[str]) -> int:
+    return max((len(v) for v in valores), default=1)
+
+
+def _escribir_miembro(
+    zf: zipfile.ZipFile,
+    nombre: str,
+    dtype,
+    forma: Tuple[int, ...],
+    bloques: Iterable["np.ndarray"],
+) -> None:
+    import numpy as np
+    
+    dtype = np.dtype(dtype)
+    with zf.open(nombre + ".npy", "w", force_zip64=True) as f:
+        np.lib.format.write_array_header_1_0(
+            f,
+            {"descr": np.lib.format.dtype_to_descr(dtype), "fortran_order": False, "shape": forma},
+        )
+        for bloque in bloques:
+            f.write(np.ascontiguousarray(bloque, dtype=dtype).tobytes())
+
+
+def exportar_resultados_npz(resultados: ResultadosExportables, ruta: str) -> None:
+    
+    import numpy as np
+    
+    if isinstance(resultados, ResultadoAlgoritmo):
+        resultados = [resultados]
+    if isinstance(resultados, dict):
+        claves = list(resultados)
+        lista = list(resultados.values())
+    else:
+        lista = list(resultados)
+        claves = [r.nombre_algoritmo for r in lista]
+    
+    
+    claves_promedios = list(dict.fromkeys(k for r in lista for k in r.promedios))
+    offsets_procesos = np.cumsum([0] + [len(r.procesos) for r in lista], dtype=np.int64)
+    offsets_gantt = np.cumsum([0] + [len(r.segmentos_gantt) for r in lista], dtype=np.int64)
+    ancho_procesos = max((_ancho(p.nombre for p in r.procesos) for r in lista), default=1)
+    gantt = [_columnas_gantt(r.segmentos_gantt) for r in lista]
+    offsets_nombres_gantt = np.cumsum([0] + [len(g[0]) for g in gantt], dtype=np.int64)
+    ancho_gantt = max((_ancho(g[0]) for g in gantt), default=1)
+    
+    promedios = np.full((len(lista), len(claves_promedios)), np.nan)
+    presentes = np.zeros((len(lista), len(claves_promedios)), dtype=bool)
+    for i, r in enumerate(lista):
+        for j, clave in enumerate(claves_promedios):
+            if clave in r.promedios:
+                promedios[i, j] = r.promedios[clave]
+                presentes[i, j] = True
+    
+    def metricas(r: ResultadoAlgoritmo) -> "np.ndarray":
+        return np.array(
+            [[getattr(p, m) for m in METRICAS_PROCESO] for p in r.procesos],
+            dtype=np.int64,
+        ).reshape(-1, len(METRICAS_PROCESO))
+    
+    total_procesos = int(offsets_procesos[-1])
+    total_segmentos = int(offsets_gantt[-1])
+    with zipfile.ZipFile(ruta, "w", compression=zipfile.ZIP_STORED, allowZip64=True) as zf:
+        for nombre, arreglo in (
+            ("claves", _texto(claves, _ancho(claves))),
+            ("algoritmos", _texto([r.nombre_algoritmo for r in lista], _ancho(r.nombre_algoritmo for r in lista))),
+            ("escenarios", _texto([r.nombre_escenario for r in lista], _ancho(r.nombre_escenario for r in lista))),
+            ("claves_promedios", _texto(claves_promedios, _ancho(claves_promedios))),
+            ("promedios", promedios),
+            ("promedios_presentes", presentes),
+            ("metricas_proceso", _texto(list(METRICAS_PROCESO), _ancho(METRICAS_PROCESO))),
+            ("offsets_procesos", offsets_procesos),
+            ("offsets_gantt", offsets_gantt),
+            ("offsets_nombres_gantt", offsets_nombres_gantt),
+        ):
+            _escribir_miembro(zf, nombre, arreglo.dtype, arreglo.shape, [arreglo])
+        
+        
+        _escribir_miembro(
+            zf, "procesos_nombres", f"<U{ancho_procesos}", (total_procesos,),
+            (_texto([p.nombre for p in r.procesos], ancho_procesos) for r in lista),
+        )
+        _escribir_miembro(
+            zf, "procesos_metricas", np.int64, (total_procesos, len(METRICAS_PROCESO)),
+            (metricas(r) for r in lista),
+        )
+        _escribir_miembro(
+            zf, "gantt_nombres", f"<U{ancho_gantt}", (int(offsets_nombres_gantt[-1]),),
+            (_texto(g[0], ancho_gantt) for g in gantt),
+        )
+        for columna, nombre in enumerate(("gantt_ids", "gantt_inicios", "gantt_fines", "gantt_nucleos"), 1):
+            _escribir_miembro(
+                zf, nombre, np.int64, (total_segmentos,),
+                (g[columna] for g in gantt),
+            )
+
+
+def _mapear_miembro(archivo, ruta: str, info: zipfile.ZipInfo) -> "np.ndarray":
+    import numpy as np
+    
+    
+    archivo.seek(info.header_offset)
+    cabecera_local = archivo.read(30)
+    largo_nombre, largo_extra = struct.unpack("<HH", cabecera_local[26:30])
+    archivo.seek(info.header_offset + 30 + largo_nombre + largo_extra)
+    version = np.lib.format.read_magic(archivo)
+    if version == (1, 0):
+        forma, fortran, dtype = np.lib.format.read_array_header_1_0(archivo)
+    else:
+        forma, fortran, dtype = np.lib.format.read_array_header_2_0(archivo)
+    
+    if dtype.hasobject:
+        raise ValueError(f"Miembro con objetos Python no soportado: {info.filename}")
+    if 0 in forma:
+        return np.empty(forma, dtype=dtype)
+    return np.memmap(
+        ruta,
+        dtype=dtype,
+        mode="r",
+        shape=forma,
+        order="F" if fortran else "C",
+        offset=archivo.tell(),
+    )
+
+
+class ResultadosNpz:
+    
+    def __init__(self, ruta: str) -> None:
+        self.ruta = ruta
+        self._arreglos: Dict[str, "np.ndarray"] = {}
+        with zipfile.ZipFile(ruta) as zf, open(ruta, "rb") as archivo:
+            for info in zf.infolist():
+                if not info.filename.endswith(".npy"):
+                    continue
+                if info.compress_type != zipfile.ZIP_STORED:
+                    raise ValueError(
+                        f"{ruta}: el miembro {info.filename} esta comprimido y no se puede mapear en memoria."
+                    )
+                self._arreglos[info.filename[:-4]] = _mapear_miembro(archivo, ruta, info)
+        
+        self.claves: List[str] = self["claves"].tolist()
+
+    def __getitem__(self, nombre: str) -> "np.ndarray":
+        return self._arreglos[nombre]
+
+    def __contains__(self, nombre: str) -> bool:
+        return nombre in self._arreglos
+
+    def __len__(self) -> int:
+        return len(self.claves)
+
+    def promedios(self, i: int) -> Dict[str, float]:
+        
+        claves = self["claves_promedios"].tolist()
+        valores = self["promedios"][i].tolist()
+        presentes = self["promedios_presentes"][i].tolist()
+        return {c: v for c, v, p in zip(claves, valores, presentes) if p}
+
+    def segmentos(self, i: int) -> TrazaGantt:
+        
+        a, b = self["offsets_gantt"][i:i + 2].tolist()
+        na, nb = self["offsets_nombres_gantt"][i:i + 2].tolist()
+        return TrazaGantt.desde_arreglos(
+            self["gantt_nombres"][na:nb].tolist(),
+            self["gantt_ids"][a:b],
+            self["gantt_inicios"][a:b],
+            self["gantt_fines"][a:b],
+            fusionar=False,
+            nucleos=self["gantt_nucleos"][a:b] if "gantt_nucleos" in self else None,
+        )
+
+    def resultado(self, i: int) -> ResultadoAlgoritmo:
+        
+        a, b = self["offsets_procesos"][i:i + 2].tolist()
+        columnas = self["metricas_proceso"].tolist()
+        procesos = [
+            ResultadoProceso(nombre=nombre, **dict(zip(columnas, fila)))
+            for nombre, fila in zip(
+                self["procesos_nombres"][a:b].tolist(),
+                self["procesos_metricas"][a:b].tolist(),
+            )
+        ]
+        return ResultadoAlgoritmo(
+            nombre_algoritmo=str(self["algoritmos"][i]),
+            nombre_escenario=str(self["escenarios"][i]),
+            procesos=procesos,
+            segmentos_gantt=self.segmentos(i),
+            promedios=self.promedios(i),
+        )
+
+    def __iter__(self) -> Iterator[ResultadoAlgoritmo]:
+        for i in range(len(self)):
+            yield self.resultado(i)
+
+
+def abrir_resultados_npz(ruta: str) -> ResultadosNpz:
+    
+    return ResultadosNpz(ruta)
+
+
+def cargar_resultados_npz(ruta: str) -> Dict[str, ResultadoAlgoritmo]:
+    
+    datos = ResultadosNpz(ruta)
+    return {clave: datos.resultado(i) for i, clave in enumerate(datos.claves)}
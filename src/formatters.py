@@ -1,5 +1,4 @@
-from typing import List, Dict, Any
-from tabulate import tabulate
+from typing import List, Dict, Any, Optional
 from .models import ResultadoProceso, ResultadoAlgoritmo
 
 
@@ -58,6 +57,8 @@ def formato_subtitulo(subtitulo: str) -> str:
 
 def tabla_metricas_procesos(procesos: List[ResultadoProceso]) -> str:
     
+    from tabulate import tabulate
+    
     datos = []
     for proc in procesos:
         datos.append([
@@ -92,6 +93,8 @@ def tabla_metricas_procesos(procesos: List[ResultadoProceso]) -> str:
 
 def tabla_promedios(promedios: Dict[str, float]) -> str:
     
+    from tabulate import tabulate
+    
     datos = [
         [
             colorear_encabezado("Tiempo de Retorno"),
@@ -118,6 +121,8 @@ def tabla_promedios(promedios: Dict[str, float]) -> str:
 
 def tabla_comparativa_algoritmos(resultados: Dict[str, ResultadoAlgoritmo]) -> str:
     
+    from tabulate import tabulate
+    
     datos = []
     
     for nombre_algo, resultado in resultados.items():
@@ -148,6 +153,42 @@ def tabla_comparativa_algoritmos(resultados: Dict[str, ResultadoAlgoritmo]) -> s
     )
 
 
+def tabla_barrido_quantums(filas: List[Any], metrica: Optional[str] = None) -> str:
+    
+    from tabulate import tabulate
+    
+    mejor = min(filas, key=lambda f: (f.valor(metrica), f.quantum)) if metrica and filas else None
+    
+    datos = []
+    for fila in filas:
+        quantum = str(fila.quantum)
+        if fila is mejor:
+            quantum = colorear_exito(f"{quantum} *")
+        datos.append([
+            quantum,
+            f"{fila.retorno:.2f}",
+            f"{fila.espera:.2f}",
+            f"{fila.respuesta:.2f}",
+            fila.cambios_contexto,
+        ])
+    
+    encabezados = [
+        colorear_encabezado("Quantum"),
+        colorear_encabezado("Retorno Prom."),
+        colorear_encabezado("Espera Prom."),
+        colorear_encabezado("Respuesta Prom."),
+        colorear_encabezado("Cambios ctx."),
+    ]
+    
+    return tabulate(
+        datos,
+        headers=encabezados,
+        tablefmt="simple",
+        stralign="right",
+        numalign="right"
+    )
+
+
 def separador(ancho: int = 80, simbolo: str = "=") -> str:
     
     return simbolo * ancho
@@ -1,7 +1,20 @@
-from typing import List, Optional
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-from .models import SegmentoGantt
+import io
+import shutil
+import string
+import sys
+from typing import IO, TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+from .models import SegmentoGantt, SegmentosGantt, TrazaGantt
+from .gantt_resumen import (
+    ResumenGantt,
+    carriles_gantt,
+    columnas_gantt,
+    columnas_ordenadas,
+    muestrear_exacto,
+    nucleos_gantt,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 
@@ -23,7 +36,7 @@ def formatear_gantt_string(segmentos_gantt: List[SegmentoGantt]) -> str:
     
     
     
-timeline_parts = []
+    timeline_parts = []
     chart_parts = []
     
     if not segmentos_gantt:
@@ -61,116 +74,399 @@ timeline_parts = []
         chart_parts.append(bloque_chart)
 
     
-timeline_str = "".join(timeline_parts)
+    timeline_str = "".join(timeline_parts)
     chart_str = "".join(chart_parts)
     
     return f"{timeline_str}\n{chart_str}"
 
 
-def imprimir_gantt(segmentos_gantt: List[SegmentoGantt]):
+SIMBOLOS_GANTT = string.ascii_uppercase + string.ascii_lowercase + string.digits
+
+
+SIMBOLO_OCIOSO = "."
+
+
+ANCHO_BLOQUE_FIJO = 8
+
+
+def _eje_tiempo(desde: int, escala: float, ancho: int, separacion: int = 10) -> str:
     
-    gantt_string = formatear_gantt_string(segmentos_gantt)
-    print(gantt_string)
+    eje = [" "] * (ancho + 12)
+    ocupado_hasta = -1
+    for columna in list(range(0, ancho, separacion)) + [ancho]:
+        etiqueta = str(int(desde + columna * escala))
+        if columna <= ocupado_hasta:
+            continue
+        eje[columna:columna + len(etiqueta)] = etiqueta
+        ocupado_hasta = columna + len(etiqueta)
+    return "".join(eje).rstrip()
 
-def graficar_gantt(
-    segmentos_gantt: List[SegmentoGantt],
-    nombre_algoritmo: str,
-    nombre_escenario: str,
-    guardar_como: Optional[str] = None,
-    mostrar: bool = True,
+
+def escribir_gantt_escalado(
+    segmentos_gantt: Union[SegmentosGantt, ResumenGantt],
+    flujo: IO[str],
+    ancho: int = 80,
+    desde: Optional[int] = None,
+    hasta: Optional[int] = None,
 ) -> None:
     
+    import numpy as np
     
     if not segmentos_gantt:
-        print("No hay segmentos de Gantt para graficar.")
+        flujo.write("No hay segmentos de Gantt para mostrar.\n")
         return
     
+    carriles = None if isinstance(segmentos_gantt, ResumenGantt) else carriles_gantt(segmentos_gantt)
+    if isinstance(segmentos_gantt, ResumenGantt):
+        resumen = segmentos_gantt
+        nombres = resumen.nombres
+        desde = resumen.tiempo_inicio if desde is None else desde
+        hasta = resumen.tiempo_fin if hasta is None else hasta
+    elif carriles is not None:
+        resumen = None
+        nombres = carriles[0][1].nombres
+        desde = min(int(traza.arreglos()[1][0]) for _, traza in carriles) if desde is None else desde
+        hasta = max(int(traza.arreglos()[2].max()) for _, traza in carriles) if hasta is None else hasta
+    else:
+        resumen = None
+        nombres, ids, inicios, fines = columnas_ordenadas(segmentos_gantt)
+        desde = int(inicios[0]) if desde is None else desde
+        hasta = int(fines.max()) if hasta is None else hasta
+    if hasta <= desde:
+        raise ValueError(f"Ventana vacia: desde={desde}, hasta={hasta}.")
+    
+    ancho = max(1, min(ancho, hasta - desde))
+    escala = (hasta - desde) / ancho
+    
+    
+    
+    
+    if resumen is not None:
+        filas = [("", resumen.muestrear(desde, hasta, ancho))]
+    else:
+        medios = desde + (np.arange(ancho) + 0.5) * escala
+        if carriles is None:
+            filas = [("", muestrear_exacto(ids, inicios, fines, medios))]
+        else:
+            ancho_etiqueta = len(f"C{carriles[-1][0]}") + 1
+            filas = [
+                (f"C{nucleo}".ljust(ancho_etiqueta), muestrear_exacto(*traza.arreglos(), medios))
+                for nucleo, traza in carriles
+            ]
+    
+    
+    ids_columna = np.stack([ids_fila for _, ids_fila in filas], axis=1).ravel()
+    presentes, primera_columna = np.unique(ids_columna, return_index=True)
+    visibles = [int(i) for i in presentes[np.argsort(primera_columna)].tolist() if i >= 0]
+    simbolo_por_id = {i: SIMBOLOS_GANTT[k % len(SIMBOLOS_GANTT)] for k, i in enumerate(visibles)}
+    
+    flujo.write(f"Gantt {desde}-{hasta} ({escala:g} ms por columna)\n")
+    for etiqueta, ids_fila in filas:
+        flujo.write(etiqueta + "|")
+        for inicio_bloque in range(0, ancho, 256):
+            flujo.write("".join(
+                simbolo_por_id.get(i, SIMBOLO_OCIOSO)
+                for i in ids_fila[inicio_bloque:inicio_bloque + 256].tolist()
+            ))
+        flujo.write("|\n")
+    flujo.write(" " * (len(filas[0][0]) + 1) + _eje_tiempo(desde, escala, ancho) + "\n")
+    
+    if len(visibles) > len(SIMBOLOS_GANTT):
+        flujo.write(f"Leyenda: {len(visibles)} procesos visibles; los simbolos se repiten.\n")
+        return
+    flujo.write("Leyenda: " + " ".join(f"{simbolo_por_id[i]}={nombres[i]}" for i in visibles))
+    flujo.write(f" {SIMBOLO_OCIOSO}=ocioso\n")
+
+
+def formatear_gantt_escalado(
+    segmentos_gantt: Union[SegmentosGantt, ResumenGantt],
+    ancho: int = 80,
+    desde: Optional[int] = None,
+    hasta: Optional[int] = None,
+) -> str:
+    
+    salida = io.StringIO()
+    escribir_gantt_escalado(segmentos_gantt, salida, ancho, desde, hasta)
+    return salida.getvalue().rstrip("\n")
+
+
+def imprimir_gantt(
+    segmentos_gantt: Union[SegmentosGantt, ResumenGantt],
+    ancho: Optional[int] = None,
+    desde: Optional[int] = None,
+    hasta: Optional[int] = None,
+) -> None:
     
-    fig, ax = plt.subplots(figsize=(14, 6))
     
     
-    procesos_unicos = []
-    for seg in segmentos_gantt:
-        if seg.proceso not in procesos_unicos:
-            procesos_unicos.append(seg.proceso)
+    columnas_terminal = shutil.get_terminal_size().columns
+    if ancho is None and desde is None and hasta is None and (
+        not isinstance(segmentos_gantt, ResumenGantt)
+        and len(segmentos_gantt) * ANCHO_BLOQUE_FIJO < columnas_terminal
+        and nucleos_gantt(segmentos_gantt) is None
+    ):
+        print(formatear_gantt_string(segmentos_gantt))
+        return
+    escribir_gantt_escalado(
+        segmentos_gantt,
+        sys.stdout,
+        ancho or max(10, columnas_terminal - 2),
+        desde,
+        hasta,
+    )
+
+UMBRAL_BORDES = 500
+
+
+UMBRAL_RESUMEN = 50_000
+
+
+MAX_TRAMOS = 4096
+
+
+MAX_FILAS_ETIQUETADAS = 40
+
+
+def _filas_por_proceso(nombres: List[str], ids: "np.ndarray") -> Tuple[List[str], "np.ndarray"]:
+    import numpy as np
     
     
-    proceso_a_y = {proc: i for i, proc in enumerate(reversed(procesos_unicos))}
     
+    ids_presentes, primera_aparicion = np.unique(ids, return_index=True)
+    ids_en_orden = ids_presentes[np.argsort(primera_aparicion, kind="stable")].tolist()
     
-    tiempo_minimo = min(seg.inicio for seg in segmentos_gantt)
-    tiempo_maximo = max(seg.fin for seg in segmentos_gantt)
+    fila_por_nombre: Dict[str, int] = {}
+    procesos_unicos: List[str] = []
+    fila_por_id = np.zeros(int(ids_presentes[-1]) + 1, dtype=np.int64)
+    for indice in ids_en_orden:
+        nombre = nombres[indice]
+        fila = fila_por_nombre.get(nombre)
+        if fila is None:
+            fila = fila_por_nombre[nombre] = len(procesos_unicos)
+            procesos_unicos.append(nombre)
+        fila_por_id[indice] = fila
     
     
-    for segmento in segmentos_gantt:
-        y_pos = proceso_a_y[segmento.proceso]
-        duracion = segmento.fin - segmento.inicio
-        
-        
-        color = COLORES_PROCESOS.get(segmento.proceso, '#95A5A6')
+    y_por_fila = len(procesos_unicos) - 1 - fila_por_id
+    return procesos_unicos, y_por_fila[ids]
+
+
+def _datos_para_graficar(
+    segmentos_gantt: Union[SegmentosGantt, ResumenGantt],
+    desde: Optional[int],
+    hasta: Optional[int],
+) -> Tuple[List[str], "np.ndarray", "np.ndarray", "np.ndarray", int, int]:
+    import numpy as np
+    
+    
+    
+    if not isinstance(segmentos_gantt, ResumenGantt) and len(segmentos_gantt) > UMBRAL_RESUMEN:
+        segmentos_gantt = ResumenGantt(segmentos_gantt)
+    
+    if isinstance(segmentos_gantt, ResumenGantt):
+        resumen = segmentos_gantt
+        desde = resumen.tiempo_inicio if desde is None else desde
+        hasta = resumen.tiempo_fin if hasta is None else hasta
+        return (resumen.nombres,) + resumen.tramos(desde, hasta, MAX_TRAMOS) + (desde, hasta)
+    
+    nombres, ids, inicios, fines = columnas_gantt(segmentos_gantt)
+    desde = int(inicios.min()) if desde is None else desde
+    hasta = int(fines.max()) if hasta is None else hasta
+    visibles = (fines > desde) & (inicios < hasta)
+    return (
+        nombres,
+        ids[visibles],
+        np.maximum(inicios[visibles], desde),
+        np.minimum(fines[visibles], hasta),
+        desde,
+        hasta,
+    )
+
+
+def _datos_por_nucleo(
+    carriles: List[Tuple[int, TrazaGantt]],
+    desde: Optional[int],
+    hasta: Optional[int],
+) -> Tuple[List[str], "np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray", List[str], int, int]:
+    import numpy as np
+    
+    
+    if desde is None:
+        desde = min(int(traza.arreglos()[1][0]) for _, traza in carriles)
+    if hasta is None:
+        hasta = max(int(traza.arreglos()[2].max()) for _, traza in carriles)
+    
+    ids, inicios, fines, y_pos = [], [], [], []
+    for fila, (_, traza) in enumerate(carriles):
+        _, ids_c, inicios_c, fines_c, _, _ = _datos_para_graficar(traza, desde, hasta)
+        ids.append(ids_c)
+        inicios.append(inicios_c)
+        fines.append(fines_c)
+        y_pos.append(np.full(len(ids_c), len(carriles) - 1 - fila, dtype=np.int64))
+    
+    etiquetas = [f"Nucleo {nucleo}" for nucleo, _ in carriles]
+    return (
+        carriles[0][1].nombres,
+        np.concatenate(ids),
+        np.concatenate(inicios),
+        np.concatenate(fines),
+        np.concatenate(y_pos),
+        etiquetas,
+        desde,
+        hasta,
+    )
+
+
+def _dibujar_gantt(
+    ax,
+    segmentos_gantt: Union[SegmentosGantt, ResumenGantt],
+    tamano_fuente: int,
+    desde: Optional[int] = None,
+    hasta: Optional[int] = None,
+) -> Tuple[List[str], int, int]:
+    import numpy as np
+    from matplotlib.collections import PolyCollection
+    from matplotlib.colors import to_rgba_array
+    
+    carriles = None if isinstance(segmentos_gantt, ResumenGantt) else carriles_gantt(segmentos_gantt)
+    if carriles is not None:
+        nombres, ids, inicios, fines, y_pos, filas_unicas, tiempo_minimo, tiempo_maximo = _datos_por_nucleo(carriles, desde, hasta)
+    else:
+        nombres, ids, inicios, fines, tiempo_minimo, tiempo_maximo = _datos_para_graficar(segmentos_gantt, desde, hasta)
+    if len(ids) == 0:
+        ax.text(0.5, 0.5, 'Sin datos', ha='center', va='center',
+               transform=ax.transAxes, fontsize=12)
+        return [], tiempo_minimo, tiempo_maximo
+    if carriles is None:
+        filas_unicas, y_pos = _filas_por_proceso(nombres, ids)
+    num_filas = len(filas_unicas)
+    
+    ax.set_xlim(tiempo_minimo - 1, tiempo_maximo + 1)
+    ax.set_ylim(-0.5, num_filas - 0.5)
+    
+    
+    if carriles is not None:
         
         
-        rect = mpatches.Rectangle(
-            (segmento.inicio, y_pos - 0.4),
-            duracion,
-            0.8,
-            linewidth=2,
-            edgecolor='black',
-            facecolor=color,
-            alpha=0.8
+        import matplotlib
+        paleta = matplotlib.colormaps['tab20'](np.arange(20))
+        paleta[:, 3] = 0.8
+        colores_proceso = paleta[np.arange(len(nombres)) % 20]
+        for i, nombre in enumerate(nombres):
+            if nombre in COLORES_PROCESOS:
+                colores_proceso[i] = to_rgba_array(COLORES_PROCESOS[nombre], alpha=0.8)[0]
+        colores = colores_proceso[ids]
+    else:
+        colores_fila = to_rgba_array(
+            [COLORES_PROCESOS.get(proc, '#95A5A6') for proc in reversed(filas_unicas)],
+            alpha=0.8,
         )
-        ax.add_patch(rect)
-        
-        
-        x_center = segmento.inicio + duracion / 2
+        colores = colores_fila[y_pos]
+    vertices = np.empty((len(ids), 4, 2), dtype=float)
+    vertices[:, 0, 0] = vertices[:, 1, 0] = inicios
+    vertices[:, 2, 0] = vertices[:, 3, 0] = fines
+    vertices[:, 0, 1] = vertices[:, 3, 1] = y_pos - 0.4
+    vertices[:, 1, 1] = vertices[:, 2, 1] = y_pos + 0.4
+    pocos = len(ids) <= UMBRAL_BORDES
+    
+    
+    ax.add_collection(PolyCollection(
+        vertices,
+        facecolors=colores,
+        edgecolors='black' if pocos else colores,
+        linewidths=2 if pocos else 0.5,
+        rasterized=not pocos,
+    ))
+    
+    
+    pixeles_por_unidad = ax.get_window_extent().width / max(1, tiempo_maximo - tiempo_minimo + 2)
+    pixeles_por_caracter = tamano_fuente * 0.75 * ax.figure.dpi / 72
+    largo_nombre = np.array([len(n) + 1 for n in nombres], dtype=float)
+    caben = np.flatnonzero((fines - inicios) * pixeles_por_unidad >= largo_nombre[ids] * pixeles_por_caracter)
+    for i, inicio, fin, y in zip(ids[caben].tolist(), inicios[caben].tolist(), fines[caben].tolist(), y_pos[caben].tolist()):
         ax.text(
-            x_center,
-            y_pos,
-            segmento.proceso,
+            (inicio + fin) / 2,
+            y,
+            nombres[i],
             ha='center',
             va='center',
             fontweight='bold',
-            fontsize=10,
+            fontsize=tamano_fuente,
             color='black'
         )
     
     
-    ax.set_xlim(tiempo_minimo - 1, tiempo_maximo + 1)
-    ax.set_ylim(-0.5, len(procesos_unicos) - 0.5)
+    filas = np.arange(num_filas)
+    if num_filas > MAX_FILAS_ETIQUETADAS:
+        filas = np.unique(np.linspace(0, num_filas - 1, MAX_FILAS_ETIQUETADAS).astype(np.int64))
+    etiquetas = list(reversed(filas_unicas))
+    ax.set_yticks(filas.tolist())
+    ax.set_yticklabels([etiquetas[f] for f in filas.tolist()], fontsize=tamano_fuente)
+    ax.set_xticks(range(tiempo_minimo, tiempo_maximo + 1, max(1, (tiempo_maximo - tiempo_minimo) // 10)))
+    ax.grid(True, axis='x', alpha=0.3, linestyle='--')
     
+    return filas_unicas, tiempo_minimo, tiempo_maximo
+
+
+def _titulo_filas(segmentos_gantt: Union[SegmentosGantt, ResumenGantt]) -> str:
+    if isinstance(segmentos_gantt, ResumenGantt) or nucleos_gantt(segmentos_gantt) is None:
+        return 'Procesos'
+    return 'Nucleos'
+
+
+def _finalizar_figura(plt, fig, guardar_como: Optional[str], mostrar: bool) -> None:
     
-    ax.set_xlabel('Tiempo (ms)', fontsize=12, fontweight='bold')
-    ax.set_ylabel('Procesos', fontsize=12, fontweight='bold')
-    ax.set_title(
-        f'Diagrama de Gantt - {nombre_algoritmo} ({nombre_escenario})',
-        fontsize=14,
-        fontweight='bold',
-        pad=20
-    )
+    plt.tight_layout()
     
+    if guardar_como:
+        plt.savefig(guardar_como, dpi=100, bbox_inches='tight')
+        print(f"Diagrama guardado en: {guardar_como}")
     
-    ax.set_yticks(range(len(procesos_unicos)))
-    ax.set_yticklabels(reversed(procesos_unicos), fontsize=10)
+    if mostrar:
+        plt.show()
+    else:
+        plt.close(fig)
+
+
+def graficar_gantt(
+    segmentos_gantt: Union[SegmentosGantt, ResumenGantt],
+    nombre_algoritmo: str,
+    nombre_escenario: str,
+    guardar_como: Optional[str] = None,
+    mostrar: bool = True,
+    desde: Optional[int] = None,
+    hasta: Optional[int] = None,
+) -> None:
     
     
-    ax.set_xticks(range(tiempo_minimo, tiempo_maximo + 1, max(1, (tiempo_maximo - tiempo_minimo) // 10)))
-    ax.grid(True, axis='x', alpha=0.3, linestyle='--')
+    if not segmentos_gantt:
+        print("No hay segmentos de Gantt para graficar.")
+        return
     
+    import matplotlib.pyplot as plt
     
-    plt.tight_layout()
+    fig, ax = plt.subplots(figsize=(14, 6))
     
+    _dibujar_gantt(ax, segmentos_gantt, 10, desde, hasta)
     
-    if guardar_como:
-        plt.savefig(guardar_como, dpi=100, bbox_inches='tight')
-        print(f"Diagrama guardado en: {guardar_como}")
+    ax.set_xlabel('Tiempo (ms)', fontsize=12, fontweight='bold')
+    ax.set_ylabel(_titulo_filas(segmentos_gantt), fontsize=12, fontweight='bold')
+    ax.set_title(
+        f'Diagrama de Gantt - {nombre_algoritmo} ({nombre_escenario})',
+        fontsize=14,
+        fontweight='bold',
+        pad=20
+    )
     
-    plt.show()
+    _finalizar_figura(plt, fig, guardar_como, mostrar)
 
 def graficar_gantt_subplots(
-    resultados: dict,
+    resultados: Dict[str, Union[SegmentosGantt, ResumenGantt]],
     nombre_escenario: str,
     guardar_como: Optional[str] = None,
     mostrar: bool = True,
+    desde: Optional[int] = None,
+    hasta: Optional[int] = None,
 ) -> None:
     
     
@@ -178,6 +474,8 @@ def graficar_gantt_subplots(
         print("No hay resultados para graficar.")
         return
     
+    import matplotlib.pyplot as plt
+    
     num_algoritmos = len(resultados)
     fig, axes = plt.subplots(num_algoritmos, 1, figsize=(14, 3 * num_algoritmos))
     
@@ -194,65 +492,13 @@ def graficar_gantt_subplots(
                    transform=ax.transAxes, fontsize=12)
             continue
         
+        _dibujar_gantt(ax, segmentos_gantt, 9, desde, hasta)
         
-        procesos_unicos = []
-        for seg in segmentos_gantt:
-            if seg.proceso not in procesos_unicos:
-                procesos_unicos.append(seg.proceso)
-        
-        proceso_a_y = {proc: i for i, proc in enumerate(reversed(procesos_unicos))}
-        
-        
-        tiempo_minimo = min(seg.inicio for seg in segmentos_gantt)
-        tiempo_maximo = max(seg.fin for seg in segmentos_gantt)
-        
-        
-        for segmento in segmentos_gantt:
-            y_pos = proceso_a_y[segmento.proceso]
-            duracion = segmento.fin - segmento.inicio
-            color = COLORES_PROCESOS.get(segmento.proceso, '#95A5A6')
-            
-            rect = mpatches.Rectangle(
-                (segmento.inicio, y_pos - 0.4),
-                duracion,
-                0.8,
-                linewidth=2,
-                edgecolor='black',
-                facecolor=color,
-                alpha=0.8
-            )
-            ax.add_patch(rect)
-            
-            x_center = segmento.inicio + duracion / 2
-            ax.text(
-                x_center,
-                y_pos,
-                segmento.proceso,
-                ha='center',
-                va='center',
-                fontweight='bold',
-                fontsize=9,
-                color='black'
-            )
-        
-        
-        ax.set_xlim(tiempo_minimo - 1, tiempo_maximo + 1)
-        ax.set_ylim(-0.5, len(procesos_unicos) - 0.5)
         ax.set_xlabel('Tiempo (ms)', fontsize=10)
-        ax.set_ylabel('Procesos', fontsize=10)
+        ax.set_ylabel(_titulo_filas(segmentos_gantt), fontsize=10)
         ax.set_title(f'{nombre_algoritmo}', fontsize=12, fontweight='bold')
-        ax.set_yticks(range(len(procesos_unicos)))
-        ax.set_yticklabels(reversed(procesos_unicos), fontsize=9)
-        ax.set_xticks(range(tiempo_minimo, tiempo_maximo + 1, 
-                           max(1, (tiempo_maximo - tiempo_minimo) // 10)))
-        ax.grid(True, axis='x', alpha=0.3, linestyle='--')
     
     fig.suptitle(f'Diagramas de Gantt - {nombre_escenario}', 
                  fontsize=14, fontweight='bold', y=1.00)
-    plt.tight_layout()
-    
-    if guardar_como:
-        plt.savefig(guardar_como, dpi=100, bbox_inches='tight')
-        print(f"Diagrama guardado en: {guardar_como}")
     
-    plt.show()
\ No newline at end of file
+    _finalizar_figura(plt, fig, guardar_como, mostrar)
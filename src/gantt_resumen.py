@@ -0,0 +1,291 @@
+import math
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+from .models import SegmentosGantt, TrazaGantt
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+CUBETAS_BASE = 1 << 16
+
+
+def columnas_gantt(segmentos_gantt: SegmentosGantt) -> Tuple[List[str], "np.ndarray", "np.ndarray", "np.ndarray"]:
+    
+    import numpy as np
+    
+    if isinstance(segmentos_gantt, TrazaGantt):
+        return (segmentos_gantt.nombres,) + segmentos_gantt.arreglos()
+    
+    total = len(segmentos_gantt)
+    indice_por_nombre = {}
+    ids = np.fromiter(
+        (indice_por_nombre.setdefault(s.proceso, len(indice_por_nombre)) for s in segmentos_gantt),
+        dtype=np.int64,
+        count=total,
+    )
+    inicios = np.fromiter((s.inicio for s in segmentos_gantt), dtype=np.int64, count=total)
+    fines = np.fromiter((s.fin for s in segmentos_gantt), dtype=np.int64, count=total)
+    return list(indice_por_nombre), ids, inicios, fines
+
+
+def columnas_ordenadas(segmentos_gantt: SegmentosGantt) -> Tuple[List[str], "np.ndarray", "np.ndarray", "np.ndarray"]:
+    
+    import numpy as np
+    
+    nombres, ids, inicios, fines = columnas_gantt(segmentos_gantt)
+    
+    
+    if len(inicios) > 1 and not bool(np.all(inicios[1:] >= fines[:-1])):
+        orden = np.lexsort((fines, inicios))
+        ids, inicios, fines = ids[orden], inicios[orden], fines[orden]
+    return nombres, ids, inicios, fines
+
+
+def nucleos_gantt(segmentos_gantt: SegmentosGantt) -> Optional["np.ndarray"]:
+    
+    import numpy as np
+    
+    if isinstance(segmentos_gantt, TrazaGantt):
+        return segmentos_gantt.nucleos()
+    if not any(s.nucleo for s in segmentos_gantt):
+        return None
+    return np.fromiter((s.nucleo for s in segmentos_gantt), dtype=np.int64, count=len(segmentos_gantt))
+
+
+def carriles_gantt(segmentos_gantt: SegmentosGantt) -> Optional[List[Tuple[int, TrazaGantt]]]:
+    
+    
+    import numpy as np
+    
+    nucleos = nucleos_gantt(segmentos_gantt)
+    if nucleos is None:
+        return None
+    nombres, ids, inicios, fines = columnas_gantt(segmentos_gantt)
+    orden = np.lexsort((fines, inicios, nucleos))
+    nucleos = nucleos[orden]
+    limites = [0] + (np.flatnonzero(np.diff(nucleos)) + 1).tolist() + [len(orden)]
+    return [
+        (
+            int(nucleos[a]),
+            TrazaGantt.desde_arreglos(nombres, ids[orden[a:b]], inicios[orden[a:b]], fines[orden[a:b]], fusionar=False),
+        )
+        for a, b in zip(limites, limites[1:])
+    ]
+
+
+def muestrear_exacto(
+    ids: "np.ndarray",
+    inicios: "np.ndarray",
+    fines: "np.ndarray",
+    instantes: "np.ndarray",
+) -> "np.ndarray":
+    
+    import numpy as np
+    
+    posiciones = np.searchsorted(fines, instantes, side="right")
+    dentro = posiciones < len(fines)
+    posiciones[~dentro] = 0
+    ocupada = dentro & (inicios[posiciones] <= instantes)
+    return np.where(ocupada, ids[posiciones], -1)
+
+
+class NivelResumen:
+    
+    __slots__ = ("ancho_cubeta", "dominante", "tiempo_dominante", "ocupacion")
+
+    def __init__(
+        self,
+        ancho_cubeta: int,
+        dominante: "np.ndarray",
+        tiempo_dominante: "np.ndarray",
+        ocupacion: "np.ndarray",
+    ) -> None:
+        self.ancho_cubeta = ancho_cubeta
+        self.dominante = dominante
+        self.tiempo_dominante = tiempo_dominante
+        self.ocupacion = ocupacion
+
+    def __len__(self) -> int:
+        return len(self.dominante)
+
+    def agrupar(self) -> "NivelResumen":
+        
+        import numpy as np
+        
+        dominante, tiempo, ocupacion = self.dominante, self.tiempo_dominante, self.ocupacion
+        if len(dominante) % 2:
+            dominante = np.append(dominante, -1)
+            tiempo = np.append(tiempo, 0)
+            ocupacion = np.append(ocupacion, 0)
+        
+        d1, d2 = dominante[0::2], dominante[1::2]
+        t1, t2 = tiempo[0::2], tiempo[1::2]
+        iguales = d1 == d2
+        
+        
+        return NivelResumen(
+            self.ancho_cubeta * 2,
+            np.where(iguales | (t1 >= t2), d1, d2),
+            np.where(iguales, t1 + t2, np.maximum(t1, t2)),
+            (ocupacion[0::2] + ocupacion[1::2]) / 2,
+        )
+
+
+class ResumenGantt:
+    
+    __slots__ = ("nombres", "ids", "inicios", "fines", "tiempo_inicio", "tiempo_fin", "niveles")
+
+    def __init__(self, segmentos_gantt: SegmentosGantt, cubetas_base: int = CUBETAS_BASE) -> None:
+        import numpy as np
+        
+        
+        nucleos = nucleos_gantt(segmentos_gantt)
+        if nucleos is not None and len(np.unique(nucleos)) > 1:
+            raise ValueError("La traza usa varios nucleos: construir un ResumenGantt por carril (ver carriles_gantt).")
+        self.nombres, self.ids, self.inicios, self.fines = columnas_ordenadas(segmentos_gantt)
+        self.niveles: List[NivelResumen] = []
+        if len(self.ids) == 0:
+            self.tiempo_inicio = self.tiempo_fin = 0
+            return
+        
+        self.tiempo_inicio = int(self.inicios[0])
+        self.tiempo_fin = int(self.fines.max())
+        duracion_total = max(1, self.tiempo_fin - self.tiempo_inicio)
+        ancho = max(1, -(-duracion_total // cubetas_base))
+        num_cubetas = -(-duracion_total // ancho)
+        
+        nivel = self._nivel_base(ancho, num_cubetas)
+        self.niveles.append(nivel)
+        while len(nivel) > 1:
+            nivel = nivel.agrupar()
+            self.niveles.append(nivel)
+
+    def _nivel_base(self, ancho: int, num_cubetas: int) -> NivelResumen:
+        import numpy as np
+        
+        validos = self.fines > self.inicios
+        ids = self.ids[validos]
+        a = self.inicios[validos] - self.tiempo_inicio
+        b = self.fines[validos] - self.tiempo_inicio
+        primera = a // ancho
+        ultima = (b - 1) // ancho
+        
+        
+        
+        misma = primera == ultima
+        cruza = ~misma
+        intermedias = np.where(cruza, ultima - primera - 1, 0)
+        total_intermedias = int(intermedias.sum())
+        desplazamiento = np.arange(total_intermedias) - np.repeat(np.cumsum(intermedias) - intermedias, intermedias)
+        
+        cubetas = np.concatenate([
+            primera[misma],
+            primera[cruza],
+            ultima[cruza],
+            np.repeat(primera + 1, intermedias) + desplazamiento,
+        ])
+        procesos = np.concatenate([
+            ids[misma],
+            ids[cruza],
+            ids[cruza],
+            np.repeat(ids, intermedias),
+        ])
+        tiempos = np.concatenate([
+            (b - a)[misma],
+            ((primera + 1) * ancho - a)[cruza],
+            (b - ultima * ancho)[cruza],
+            np.full(total_intermedias, ancho, dtype=np.int64),
+        ])
+        
+        
+        orden = np.lexsort((procesos, cubetas))
+        cubetas, procesos, tiempos = cubetas[orden], procesos[orden], tiempos[orden]
+        cortes = np.flatnonzero((np.diff(cubetas) != 0) | (np.diff(procesos) != 0)) + 1
+        inicios_grupo = np.concatenate([[0], cortes])
+        cubetas, procesos = cubetas[inicios_grupo], procesos[inicios_grupo]
+        tiempos = np.add.reduceat(tiempos, inicios_grupo)
+        
+        ocupacion = np.zeros(num_cubetas, dtype=np.float64)
+        np.add.at(ocupacion, cubetas, tiempos)
+        ocupacion /= ancho
+        
+        orden = np.lexsort((-tiempos, cubetas))
+        cubetas, procesos, tiempos = cubetas[orden], procesos[orden], tiempos[orden]
+        primeros = np.concatenate([[True], cubetas[1:] != cubetas[:-1]])
+        dominante = np.full(num_cubetas, -1, dtype=np.int64)
+        tiempo_dominante = np.zeros(num_cubetas, dtype=np.int64)
+        dominante[cubetas[primeros]] = procesos[primeros]
+        tiempo_dominante[cubetas[primeros]] = tiempos[primeros]
+        
+        return NivelResumen(ancho, dominante, tiempo_dominante, ocupacion)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def nivel_para(self, ancho_columna: float) -> Optional[int]:
+        
+        
+        if not self.niveles or ancho_columna < self.niveles[0].ancho_cubeta:
+            return None
+        nivel = int(math.log2(ancho_columna / self.niveles[0].ancho_cubeta))
+        return min(nivel, len(self.niveles) - 1)
+
+    def muestrear(self, desde: int, hasta: int, columnas: int) -> "np.ndarray":
+        
+        import numpy as np
+        
+        ancho_columna = (hasta - desde) / columnas
+        medios = desde + (np.arange(columnas) + 0.5) * ancho_columna
+        indice_nivel = self.nivel_para(ancho_columna)
+        if indice_nivel is None:
+            return muestrear_exacto(self.ids, self.inicios, self.fines, medios)
+        
+        nivel = self.niveles[indice_nivel]
+        cubetas = np.floor((medios - self.tiempo_inicio) / nivel.ancho_cubeta).astype(np.int64)
+        dentro = (cubetas >= 0) & (cubetas < len(nivel))
+        return np.where(dentro, nivel.dominante[np.clip(cubetas, 0, len(nivel) - 1)], -1)
+
+    def tramos(
+        self,
+        desde: int,
+        hasta: int,
+        max_tramos: int,
+    ) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+        
+        import numpy as np
+        
+        indice_nivel = self.nivel_para((hasta - desde) / max_tramos)
+        if indice_nivel is None:
+            
+            primero = int(np.searchsorted(self.fines, desde, side="right"))
+            ultimo = int(np.searchsorted(self.inicios, hasta, side="left"))
+            return (
+                self.ids[primero:ultimo],
+                np.maximum(self.inicios[primero:ultimo], desde),
+                np.minimum(self.fines[primero:ultimo], hasta),
+            )
+        
+        nivel = self.niveles[indice_nivel]
+        ancho = nivel.ancho_cubeta
+        primera = max(0, (desde - self.tiempo_inicio) // ancho)
+        ultima = min(len(nivel), -(-(hasta - self.tiempo_inicio) // ancho))
+        dominante = nivel.dominante[primera:ultima]
+        if len(dominante) == 0:
+            vacio = np.zeros(0, dtype=np.int64)
+            return vacio, vacio, vacio
+        
+        
+        cambios = np.flatnonzero(np.diff(dominante)) + 1
+        comienzos = np.concatenate([[0], cambios])
+        finales = np.append(cambios, len(dominante))
+        ocupados = dominante[comienzos] >= 0
+        comienzos, finales = comienzos[ocupados], finales[ocupados]
+        
+        inicios = self.tiempo_inicio + (primera + comienzos) * ancho
+        fines = self.tiempo_inicio + (primera + finales) * ancho
+        return (
+            dominante[comienzos],
+            np.maximum(inicios, desde),
+            np.minimum(fines, hasta),
+        )
@@ -0,0 +1,129 @@
+import math
+import random
+from array import array
+from dataclasses import asdict, dataclass
+from typing import Iterator, Tuple
+
+from .models import CargaColumnar, Proceso
+
+
+LLEGADAS_DISPONIBLES = ("poisson", "rafagas")
+DURACIONES_DISPONIBLES = ("exponencial", "lognormal", "bimodal")
+
+
+@dataclass(frozen=True)
+class ParametrosCarga:
+    
+    num_procesos: int = 1000
+    semilla: int = 0
+    llegadas: str = "poisson"
+    tasa_llegada: float = 0.1
+    factor_rafaga: float = 10.0
+    prob_inicio_rafaga: float = 0.05
+    prob_fin_rafaga: float = 0.2
+    duraciones: str = "exponencial"
+    duracion_media: float = 10.0
+    sigma: float = 1.0
+    duracion_larga: float = 100.0
+    proporcion_larga: float = 0.2
+    prefijo: str = "P"
+
+    def __post_init__(self) -> None:
+        if self.num_procesos < 0:
+            raise ValueError(f"num_procesos debe ser >= 0 (recibido {self.num_procesos}).")
+        if self.llegadas not in LLEGADAS_DISPONIBLES:
+            raise ValueError(
+                f"Proceso de llegadas '{self.llegadas}' no reconocido. "
+                f"Disponibles: {', '.join(LLEGADAS_DISPONIBLES)}"
+            )
+        if self.duraciones not in DURACIONES_DISPONIBLES:
+            raise ValueError(
+                f"Distribucion de duraciones '{self.duraciones}' no reconocida. "
+                f"Disponibles: {', '.join(DURACIONES_DISPONIBLES)}"
+            )
+        if self.tasa_llegada <= 0 or self.factor_rafaga <= 0:
+            raise ValueError("tasa_llegada y factor_rafaga deben ser positivos.")
+        if self.duracion_media <= 0 or self.duracion_larga <= 0 or self.sigma < 0:
+            raise ValueError("Las duraciones medias deben ser positivas y sigma >= 0.")
+        for nombre in ("prob_inicio_rafaga", "prob_fin_rafaga", "proporcion_larga"):
+            if not 0.0 <= getattr(self, nombre) <= 1.0:
+                raise ValueError(f"{nombre} debe estar entre 0 y 1.")
+
+    def descripcion(self) -> str:
+        
+        return (
+            f"Carga generada - {self.num_procesos} procesos, "
+            f"llegadas {self.llegadas}, duraciones {self.duraciones}, semilla {self.semilla}"
+        )
+
+
+def _generar_columnas(parametros: ParametrosCarga) -> Iterator[Tuple[int, int]]:
+    
+    rng = random.Random(parametros.semilla)
+    
+    tasa = parametros.tasa_llegada
+    tasa_rafaga = tasa * parametros.factor_rafaga
+    en_rafaga = False
+    
+    mu_lognormal = math.log(parametros.duracion_media) - parametros.sigma ** 2 / 2
+    
+    tiempo = 0.0
+    for _ in range(parametros.num_procesos):
+        
+        if parametros.llegadas == "rafagas":
+            if en_rafaga:
+                en_rafaga = rng.random() >= parametros.prob_fin_rafaga
+            else:
+                en_rafaga = rng.random() < parametros.prob_inicio_rafaga
+            tiempo += rng.expovariate(tasa_rafaga if en_rafaga else tasa)
+        else:
+            tiempo += rng.expovariate(tasa)
+        
+        if parametros.duraciones == "exponencial":
+            duracion = rng.expovariate(1.0 / parametros.duracion_media)
+        elif parametros.duraciones == "lognormal":
+            duracion = rng.lognormvariate(mu_lognormal, parametros.sigma)
+        else:
+            media = (
+                parametros.duracion_larga
+                if rng.random() < parametros.proporcion_larga
+                else parametros.duracion_media
+            )
+            duracion = rng.normalvariate(media, media / 4)
+        
+        yield int(tiempo), max(1, round(duracion))
+
+
+def generar_procesos(parametros: ParametrosCarga) -> Iterator[Proceso]:
+    
+    prefijo = parametros.prefijo
+    for i, (llegada, duracion) in enumerate(_generar_columnas(parametros), 1):
+        yield Proceso(nombre=f"{prefijo}{i}", llegada=llegada, duracion_cpu=duracion)
+
+
+def generar_carga_columnar(parametros: ParametrosCarga) -> CargaColumnar:
+    
+    import numpy as np
+    
+    llegadas = array("q")
+    duraciones = array("q")
+    for llegada, duracion in _generar_columnas(parametros):
+        llegadas.append(llegada)
+        duraciones.append(duracion)
+    
+    n = len(llegadas)
+    return CargaColumnar(
+        ids=np.arange(n, dtype=np.int64),
+        llegadas=np.frombuffer(llegadas, dtype=np.int64).copy(),
+        duraciones=np.frombuffer(duraciones, dtype=np.int64).copy(),
+        nombres=[f"{parametros.prefijo}{i}" for i in range(1, n + 1)],
+    )
+
+
+def parametros_desde_dict(datos: dict) -> ParametrosCarga:
+    
+    validos = asdict(ParametrosCarga()).keys()
+    desconocidos = set(datos) - set(validos)
+    if desconocidos:
+        raise ValueError(f"Parametros de generacion desconocidos: {', '.join(sorted(desconocidos))}")
+    return ParametrosCarga(**datos)
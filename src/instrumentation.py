@@ -0,0 +1,93 @@
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+class Instrumentacion:
+    
+    __slots__ = ("tiempos", "contadores", "maximos", "_marca")
+
+    def __init__(self) -> None:
+        self.tiempos: Dict[str, float] = {}
+        self.contadores: Dict[str, int] = {}
+        self.maximos: Dict[str, int] = {}
+        self._marca: Optional[float] = None
+
+    def iniciar(self) -> None:
+        
+        self._marca = time.perf_counter()
+
+    def marcar(self, fase: str) -> None:
+        
+        ahora = time.perf_counter()
+        if self._marca is not None:
+            self.tiempos[fase] = self.tiempos.get(fase, 0.0) + (ahora - self._marca)
+        self._marca = ahora
+
+    def contar(self, nombre: str, cantidad: int = 1) -> None:
+        self.contadores[nombre] = self.contadores.get(nombre, 0) + cantidad
+
+    def registrar_maximo(self, nombre: str, valor: int) -> None:
+        if valor > self.maximos.get(nombre, 0):
+            self.maximos[nombre] = valor
+
+    def instrumentar(
+        self,
+        funcion: Callable[..., Any],
+        contador: str,
+        cola: Optional[Any] = None,
+        maximo: str = "cola_listos_max",
+    ) -> Callable[..., Any]:
+        
+        
+        
+        contadores = self.contadores
+        maximos = self.maximos
+        contadores.setdefault(contador, 0)
+        
+        if cola is None:
+            def envoltura(*args):
+                contadores[contador] += 1
+                return funcion(*args)
+            return envoltura
+        
+        maximos.setdefault(maximo, 0)
+        
+        def envoltura_cola(*args):
+            resultado = funcion(*args)
+            contadores[contador] += 1
+            if len(cola) > maximos[maximo]:
+                maximos[maximo] = len(cola)
+            return resultado
+        return envoltura_cola
+
+    def instrumentar_cola(
+        self,
+        funcion: Callable[..., Any],
+        contador: str,
+        maximo: str = "cola_listos_max",
+    ) -> Callable[..., Any]:
+
+
+        contadores = self.contadores
+        maximos = self.maximos
+        contadores.setdefault(contador, 0)
+        maximos.setdefault(maximo, 0)
+
+        def envoltura(cola, *args):
+            resultado = funcion(cola, *args)
+            contadores[contador] += 1
+            if len(cola) > maximos[maximo]:
+                maximos[maximo] = len(cola)
+            return resultado
+        return envoltura
+
+    def a_dict(self) -> Dict[str, Dict[str, float]]:
+        
+        return {
+            "tiempos": dict(self.tiempos),
+            "contadores": dict(self.contadores),
+            "maximos": dict(self.maximos),
+        }
+
+    def __repr__(self) -> str:
+        return f"Instrumentacion({self.a_dict()})"
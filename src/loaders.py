@@ -0,0 +1,178 @@
+import csv
+import json
+import mmap
+import os
+from array import array
+from typing import Iterator, List, Optional, Tuple
+
+from .models import Carga, CargaColumnar, Proceso
+
+
+FORMATOS_ARCHIVO = {
+    ".csv": "csv",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+}
+
+
+COLUMNAS_CSV = ("nombre", "llegada", "duracion_cpu")
+
+
+TAMANO_BLOQUE = 1 << 20
+
+
+Fila = Tuple[str, int, int]
+
+
+def detectar_formato(ruta: str) -> str:
+    
+    extension = os.path.splitext(ruta)[1].lower()
+    formato = FORMATOS_ARCHIVO.get(extension)
+    if formato is None:
+        raise ValueError(
+            f"No se reconoce el formato de '{ruta}'. "
+            f"Extensiones admitidas: {', '.join(FORMATOS_ARCHIVO)}"
+        )
+    return formato
+
+
+def _bloques_de_lineas(ruta: str, tamano_bloque: int) -> Iterator[List[str]]:
+    
+    with open(ruta, "rb") as archivo:
+        if os.fstat(archivo.fileno()).st_size == 0:
+            return
+        with mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+            total = len(mapa)
+            inicio = 0
+            if mapa[:3] == b"\xef\xbb\xbf":
+                inicio = 3
+            while inicio < total:
+                fin = min(inicio + tamano_bloque, total)
+                if fin < total:
+                    
+                    corte = mapa.rfind(b"\n", inicio, fin)
+                    if corte == -1:
+                        corte = mapa.find(b"\n", fin)
+                    fin = total if corte == -1 else corte + 1
+                
+                
+                lineas = mapa[inicio:fin].decode("utf-8").split("\n")
+                if not lineas[-1]:
+                    lineas.pop()
+                yield lineas
+                inicio = fin
+
+
+def _filas_csv(ruta: str, tamano_bloque: int) -> Iterator[Tuple[int, Fila]]:
+    indices: Optional[Tuple[int, int, int]] = None
+    num_linea = 0
+    for lineas in _bloques_de_lineas(ruta, tamano_bloque):
+        for celdas in csv.reader(lineas):
+            num_linea += 1
+            if not celdas or not any(c.strip() for c in celdas):
+                continue
+            celdas = [c.strip() for c in celdas]
+            
+            if indices is None:
+                encabezado = [c.lower() for c in celdas]
+                if all(columna in encabezado for columna in COLUMNAS_CSV):
+                    indices = tuple(encabezado.index(c) for c in COLUMNAS_CSV)
+                    continue
+                indices = (0, 1, 2)
+            try:
+                yield num_linea, (
+                    celdas[indices[0]],
+                    int(celdas[indices[1]]),
+                    int(celdas[indices[2]]),
+                )
+            except (IndexError, ValueError) as e:
+                raise ValueError(f"{ruta}:{num_linea}: fila invalida {celdas!r} ({e})") from None
+
+
+def _filas_jsonl(ruta: str, tamano_bloque: int) -> Iterator[Tuple[int, Fila]]:
+    num_linea = 0
+    for lineas in _bloques_de_lineas(ruta, tamano_bloque):
+        for linea in lineas:
+            num_linea += 1
+            if not linea.strip():
+                continue
+            try:
+                dato = json.loads(linea)
+                if isinstance(dato, dict):
+                    fila = (str(dato["nombre"]), int(dato["llegada"]), int(dato["duracion_cpu"]))
+                else:
+                    nombre, llegada, duracion = dato
+                    fila = (str(nombre), int(llegada), int(duracion))
+            except (KeyError, TypeError, ValueError) as e:
+                raise ValueError(f"{ruta}:{num_linea}: registro invalido ({e})") from None
+            yield num_linea, fila
+
+
+def iterar_filas(
+    ruta: str,
+    formato: Optional[str] = None,
+    tamano_bloque: int = TAMANO_BLOQUE,
+) -> Iterator[Tuple[int, Fila]]:
+    
+    formato = formato or detectar_formato(ruta)
+    if formato == "csv":
+        return _filas_csv(ruta, tamano_bloque)
+    if formato == "jsonl":
+        return _filas_jsonl(ruta, tamano_bloque)
+    raise ValueError(f"Formato '{formato}' no soportado. Use 'csv' o 'jsonl'.")
+
+
+def cargar_archivo_carga(
+    ruta: str,
+    formato: Optional[str] = None,
+    columnar: bool = False,
+    tamano_bloque: int = TAMANO_BLOQUE,
+) -> Carga:
+    
+    import numpy as np
+    
+    nombres: List[str] = []
+    llegadas = array("q")
+    duraciones = array("q")
+    vistos = set()
+    ordenado = True
+    ultima_llegada: Optional[int] = None
+    
+    for num_linea, (nombre, llegada, duracion) in iterar_filas(ruta, formato, tamano_bloque):
+        if nombre in vistos:
+            raise ValueError(f"{ruta}:{num_linea}: nombre de proceso duplicado '{nombre}'")
+        if duracion < 0:
+            raise ValueError(f"{ruta}:{num_linea}: duracion negativa para '{nombre}'")
+        vistos.add(nombre)
+        
+        if ultima_llegada is not None and llegada < ultima_llegada:
+            ordenado = False
+        ultima_llegada = llegada
+        
+        nombres.append(nombre)
+        llegadas.append(llegada)
+        duraciones.append(duracion)
+    del vistos
+    
+    arr_llegadas = np.frombuffer(llegadas, dtype=np.int64)
+    arr_duraciones = np.frombuffer(duraciones, dtype=np.int64)
+    
+    
+    if not ordenado:
+        orden = np.argsort(arr_llegadas, kind="stable")
+        arr_llegadas = arr_llegadas[orden]
+        arr_duraciones = arr_duraciones[orden]
+        nombres = [nombres[i] for i in orden.tolist()]
+    
+    if columnar:
+        return CargaColumnar(
+            ids=np.arange(len(nombres), dtype=np.int64),
+            llegadas=arr_llegadas,
+            duraciones=arr_duraciones,
+            nombres=nombres,
+        )
+    
+    return [
+        Proceso(nombre=n, llegada=l, duracion_cpu=d)
+        for n, l, d in zip(nombres, arr_llegadas.tolist(), arr_duraciones.tolist())
+    ]
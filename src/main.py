@@ -1,10 +1,17 @@
-from .cli import ejecutar_aplicacion
+import sys
+from typing import Optional, Sequence
 
 
-def main() -> None:
+def main(argv: Optional[Sequence[str]] = None) -> None:
     
+    argv = sys.argv[1:] if argv is None else argv
+    if argv:
+        from .batch import main as main_lotes
+        sys.exit(main_lotes(argv))
+    
+    from .cli import ejecutar_aplicacion
     ejecutar_aplicacion()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,22 +1,169 @@
-from typing import List, Tuple, Dict, Optional
-from .models import Proceso, SegmentoGantt, ResultadoProceso, MetricasPromedio
+from typing import TYPE_CHECKING, List, Tuple, Dict, Optional
+from .models import (
+    Carga,
+    CargaColumnar,
+    SegmentoGantt,
+    ResultadoProceso,
+    MetricasPromedio,
+    columnas_carga,
+    como_columnar,
+)
+from .instrumentation import Instrumentacion
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def esta_ordenado(segmentos_gantt: List[SegmentoGantt]) -> bool:
+    
+    inicio_anterior: Optional[int] = None
+    fin_anterior = 0
+    for segmento in segmentos_gantt:
+        inicio = segmento.inicio
+        if inicio_anterior is not None and (
+            inicio < inicio_anterior
+            or (inicio == inicio_anterior and segmento.fin < fin_anterior)
+        ):
+            return False
+        inicio_anterior = inicio
+        fin_anterior = segmento.fin
+    return True
+
+
+class AcumuladorMetricas:
+    
+    def __init__(
+        self,
+        nombres: List[str],
+        llegadas: List[int],
+        duraciones: List[int],
+    ) -> None:
+        self.nombres = nombres
+        self.llegadas = llegadas
+        self.duraciones = duraciones
+        
+        num_procesos = len(nombres)
+        self.primer_inicio: List[Optional[int]] = [None] * num_procesos
+        self.finalizacion: List[int] = [0] * num_procesos
+        self.cambios_contexto: int = 0
+        self.servicio: Optional[List[int]] = None
+        
+        self._ultimo_proceso: Optional[int] = None
+        self._ultimo_inicio: int = 0
+        self._ultimo_fin: int = 0
+
+    @classmethod
+    def desde_carga(cls, procesos: Carga) -> "AcumuladorMetricas":
+        
+        return cls(*columnas_carga(procesos))
+
+    def agregar(self, indice: int, inicio: int, fin: int) -> None:
+        
+        if self._ultimo_proceso is None:
+            self._ultimo_proceso = indice
+        else:
+            if inicio < self._ultimo_inicio or (
+                inicio == self._ultimo_inicio and fin < self._ultimo_fin
+            ):
+                raise ValueError(
+                    f"Segmento fuera de orden: ({inicio}, {fin}) despues de "
+                    f"({self._ultimo_inicio}, {self._ultimo_fin})"
+                )
+            if indice != self._ultimo_proceso:
+                self.cambios_contexto += 1
+                self._ultimo_proceso = indice
+        self._ultimo_inicio = inicio
+        self._ultimo_fin = fin
+        
+        if self.primer_inicio[indice] is None:
+            self.primer_inicio[indice] = inicio
+        if fin > self.finalizacion[indice]:
+            self.finalizacion[indice] = fin
+
+    def registrar_tramo(self, indice: int, inicio: int, fin: int) -> None:
+
+
+        servicio = self.servicio
+        if servicio is None:
+            servicio = self.servicio = [0] * len(self.nombres)
+        servicio[indice] += fin - inicio
+        primer_inicio = self.primer_inicio[indice]
+        if primer_inicio is None or inicio < primer_inicio:
+            self.primer_inicio[indice] = inicio
+        if fin > self.finalizacion[indice]:
+            self.finalizacion[indice] = fin
+
+    def resultados(self) -> Tuple[List[ResultadoProceso], MetricasPromedio]:
+        
+        resultados_individuales: List[ResultadoProceso] = []
+        
+        total_retorno = 0
+        total_espera = 0
+        total_respuesta = 0
+        
+        for nombre, llegada, duracion, finalizacion, primer_inicio, servicio in zip(
+            self.nombres,
+            self.llegadas,
+            self.duraciones,
+            self.finalizacion,
+            self.primer_inicio,
+            self.servicio or self.duraciones,
+        ):
+            retorno = finalizacion - llegada
+            espera = retorno - servicio
+            respuesta = (primer_inicio or 0) - llegada
+            
+            total_retorno += retorno
+            total_espera += espera
+            total_respuesta += respuesta
+            
+            resultados_individuales.append(ResultadoProceso(
+                nombre=nombre,
+                llegada=llegada,
+                duracion_cpu=duracion,
+                tiempo_finalizacion=finalizacion,
+                tiempo_retorno=retorno,
+                tiempo_espera=espera,
+                tiempo_respuesta=respuesta
+            ))
+        
+        num_procesos = len(self.nombres)
+        promedios: MetricasPromedio = {
+            "tiempo_retorno_promedio": total_retorno / num_procesos if num_procesos > 0 else 0,
+            "tiempo_espera_promedio": total_espera / num_procesos if num_procesos > 0 else 0,
+            "tiempo_respuesta_promedio": total_respuesta / num_procesos if num_procesos > 0 else 0,
+        }
+        promedios["cambios_contexto"] = float(self.cambios_contexto)
+        
+        return resultados_individuales, promedios
 
 
 def calcular_metricas(
-    procesos: List[Proceso],
-    segmentos_gantt: List[SegmentoGantt]
+    procesos: Carga,
+    segmentos_gantt: List[SegmentoGantt],
+    instrumentacion: Optional[Instrumentacion] = None,
 ) -> Tuple[List[ResultadoProceso], MetricasPromedio]:
     
-
+    if instrumentacion is not None:
+        instrumentacion.iniciar()
+    
+    if esta_ordenado(segmentos_gantt):
+        segmentos_ordenados = segmentos_gantt
+    else:
+        segmentos_ordenados = sorted(
+            segmentos_gantt,
+            key=lambda s: (s.inicio, s.fin)
+        )
+        if instrumentacion is not None:
+            instrumentacion.contar("reordenamientos")
     
-    segmentos_ordenados = sorted(
-        segmentos_gantt,
-        key=lambda s: (s.inicio, s.fin)
-    )
+    if instrumentacion is not None:
+        instrumentacion.marcar("ordenamiento")
+        instrumentacion.contar("segmentos_procesados", len(segmentos_ordenados))
 
     
     
-    mapa_procesos: Dict[str, Proceso] = {p.nombre: p for p in procesos}
+    nombres, llegadas, duraciones = columnas_carga(procesos)
 
     
     
@@ -24,21 +171,23 @@ def calcular_metricas(
     mapa_tiempo_respuesta_inicio: Dict[str, int] = {}
     
     mapa_tiempo_finalizacion: Dict[str, int] = {}
+    
+    mapa_servicio: Dict[str, int] = {}
 
     
     
     cambios_contexto: int = 0
-    proceso_anterior: Optional[str] = None
+    proceso_anterior: Dict[int, str] = {}
 
     for segmento in segmentos_ordenados:
         nombre_proceso = segmento.proceso
 
         
-        if proceso_anterior is None:
-            proceso_anterior = nombre_proceso
-        elif nombre_proceso != proceso_anterior:
-            cambios_contexto += 1
-            proceso_anterior = nombre_proceso
+        anterior = proceso_anterior.get(segmento.nucleo)
+        if anterior != nombre_proceso:
+            if anterior is not None:
+                cambios_contexto += 1
+            proceso_anterior[segmento.nucleo] = nombre_proceso
 
         
         if nombre_proceso not in mapa_tiempo_respuesta_inicio:
@@ -49,6 +198,12 @@ def calcular_metricas(
             mapa_tiempo_finalizacion.get(nombre_proceso, 0),
             segmento.fin
         )
+        mapa_servicio[nombre_proceso] = (
+            mapa_servicio.get(nombre_proceso, 0) + segmento.fin - segmento.inicio
+        )
+
+    if instrumentacion is not None:
+        instrumentacion.marcar("recorrido")
 
     
     resultados_individuales: List[ResultadoProceso] = []
@@ -58,10 +213,7 @@ def calcular_metricas(
     total_respuesta = 0
 
     
-    for proceso in procesos:
-        nombre = proceso.nombre
-        llegada = proceso.llegada
-        duracion = proceso.duracion_cpu
+    for nombre, llegada, duracion in zip(nombres, llegadas, duraciones):
 
         finalizacion = mapa_tiempo_finalizacion.get(nombre, 0)
         primer_inicio = mapa_tiempo_respuesta_inicio.get(nombre, 0)
@@ -70,7 +222,7 @@ def calcular_metricas(
         retorno = finalizacion - llegada
 
         
-        espera = retorno - duracion
+        espera = retorno - mapa_servicio.get(nombre, 0)
 
         
         respuesta = primer_inicio - llegada
@@ -90,7 +242,7 @@ def calcular_metricas(
         ))
 
     
-    num_procesos = len(procesos)
+    num_procesos = len(nombres)
     promedios: MetricasPromedio = {
         "tiempo_retorno_promedio": total_retorno / num_procesos if num_procesos > 0 else 0,
         "tiempo_espera_promedio": total_espera / num_procesos if num_procesos > 0 else 0,
@@ -100,4 +252,89 @@ def calcular_metricas(
     
     promedios["cambios_contexto"] = float(cambios_contexto)
 
-    return resultados_individuales, promedios
\ No newline at end of file
+    if instrumentacion is not None:
+        instrumentacion.marcar("resultados")
+
+    return resultados_individuales, promedios
+
+
+def _resultados_desde_arreglos(
+    carga: CargaColumnar,
+    finalizacion: "np.ndarray",
+    primer_inicio: "np.ndarray",
+    cambios_contexto: int,
+) -> Tuple[List[ResultadoProceso], MetricasPromedio]:
+    
+    retorno = finalizacion - carga.llegadas
+    espera = retorno - carga.duraciones
+    respuesta = primer_inicio - carga.llegadas
+    
+    resultados_individuales = [
+        ResultadoProceso(
+            nombre=nombre,
+            llegada=llegada,
+            duracion_cpu=duracion,
+            tiempo_finalizacion=fin,
+            tiempo_retorno=ret,
+            tiempo_espera=esp,
+            tiempo_respuesta=resp
+        )
+        for nombre, llegada, duracion, fin, ret, esp, resp in zip(
+            carga.nombres_procesos(),
+            carga.llegadas.tolist(),
+            carga.duraciones.tolist(),
+            finalizacion.tolist(),
+            retorno.tolist(),
+            espera.tolist(),
+            respuesta.tolist(),
+        )
+    ]
+    
+    num_procesos = len(carga)
+    promedios: MetricasPromedio = {
+        "tiempo_retorno_promedio": int(retorno.sum()) / num_procesos if num_procesos > 0 else 0,
+        "tiempo_espera_promedio": int(espera.sum()) / num_procesos if num_procesos > 0 else 0,
+        "tiempo_respuesta_promedio": int(respuesta.sum()) / num_procesos if num_procesos > 0 else 0,
+    }
+    promedios["cambios_contexto"] = float(cambios_contexto)
+    
+    return resultados_individuales, promedios
+
+
+def calcular_metricas_vectorizado(
+    procesos: Carga,
+    ids: "np.ndarray",
+    inicios: "np.ndarray",
+    fines: "np.ndarray",
+) -> Tuple[List[ResultadoProceso], MetricasPromedio]:
+    import numpy as np
+    
+    carga = como_columnar(procesos)
+    num_procesos = len(carga)
+    
+    ids = np.asarray(ids, dtype=np.int64)
+    inicios = np.asarray(inicios, dtype=np.int64)
+    fines = np.asarray(fines, dtype=np.int64)
+    
+    
+    
+    ordenado = bool(np.all(
+        (inicios[1:] > inicios[:-1])
+        | ((inicios[1:] == inicios[:-1]) & (fines[1:] >= fines[:-1]))
+    ))
+    if not ordenado:
+        orden = np.lexsort((fines, inicios))
+        ids, inicios, fines = ids[orden], inicios[orden], fines[orden]
+    
+    cambios_contexto = int(np.count_nonzero(ids[1:] != ids[:-1]))
+    
+    
+    finalizacion = np.zeros(num_procesos, dtype=np.int64)
+    np.maximum.at(finalizacion, ids, fines)
+    
+    sin_inicio = np.iinfo(np.int64).max
+    primer_inicio = np.full(num_procesos, sin_inicio, dtype=np.int64)
+    np.minimum.at(primer_inicio, ids, inicios)
+    primer_inicio[primer_inicio == sin_inicio] = 0
+    
+    return _resultados_desde_arreglos(carga, finalizacion, primer_inicio, cambios_contexto)
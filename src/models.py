@@ -1,11 +1,16 @@
+from array import array
 from dataclasses import dataclass, field
-from typing import List, Dict
+from typing import TYPE_CHECKING, List, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+    from .instrumentation import Instrumentacion
 
 
 MetricasPromedio = Dict[str, float]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Proceso:
     
     nombre: str
@@ -14,14 +19,262 @@ class Proceso:
 
 
 @dataclass
+class CargaColumnar:
+    
+    ids: "np.ndarray"
+    llegadas: "np.ndarray"
+    duraciones: "np.ndarray"
+    nombres: List[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def desde_procesos(cls, procesos: Iterable[Proceso]) -> "CargaColumnar":
+        import numpy as np
+        
+        nombres: List[str] = []
+        llegadas: List[int] = []
+        duraciones: List[int] = []
+        for p in procesos:
+            nombres.append(p.nombre)
+            llegadas.append(p.llegada)
+            duraciones.append(p.duracion_cpu)
+
+        return cls(
+            ids=np.arange(len(nombres), dtype=np.int64),
+            llegadas=np.asarray(llegadas, dtype=np.int64),
+            duraciones=np.asarray(duraciones, dtype=np.int64),
+            nombres=nombres,
+        )
+
+    def nombres_procesos(self) -> List[str]:
+        
+        tabla = self.nombres
+        return [tabla[i] for i in self.ids.tolist()]
+
+    def a_procesos(self) -> List[Proceso]:
+        
+        return [
+            Proceso(nombre=n, llegada=l, duracion_cpu=d)
+            for n, l, d in zip(
+                self.nombres_procesos(),
+                self.llegadas.tolist(),
+                self.duraciones.tolist(),
+            )
+        ]
+
+
+Carga = Union[List[Proceso], CargaColumnar]
+
+
+def como_columnar(carga: Carga) -> CargaColumnar:
+    
+    if isinstance(carga, CargaColumnar):
+        return carga
+    return CargaColumnar.desde_procesos(carga)
+
+
+def columnas_carga(carga: Carga) -> Tuple[List[str], List[int], List[int]]:
+    
+    if isinstance(carga, CargaColumnar):
+        return carga.nombres_procesos(), carga.llegadas.tolist(), carga.duraciones.tolist()
+
+    return (
+        [p.nombre for p in carga],
+        [p.llegada for p in carga],
+        [p.duracion_cpu for p in carga],
+    )
+
+
+@dataclass(slots=True)
 class SegmentoGantt:
     
     proceso: str
     inicio: int
     fin: int
+    nucleo: int = 0
 
 
-@dataclass
+class TrazaGantt:
+    
+    __slots__ = ("nombres", "_indice_por_nombre", "_ids", "_inicios", "_fines", "_nucleos")
+
+    def __init__(self, nombres: Optional[List[str]] = None) -> None:
+        self.nombres: List[str] = nombres if nombres is not None else []
+        self._indice_por_nombre: Optional[Dict[str, int]] = None
+        self._ids = array("q")
+        self._inicios = array("q")
+        self._fines = array("q")
+        
+        self._nucleos: Optional[array] = None
+
+    @classmethod
+    def desde_segmentos(cls, segmentos: Iterable[SegmentoGantt]) -> "TrazaGantt":
+        
+        traza = cls()
+        for segmento in segmentos:
+            traza.append(segmento)
+        return traza
+
+    @classmethod
+    def desde_arreglos(
+        cls,
+        nombres: List[str],
+        ids: "np.ndarray",
+        inicios: "np.ndarray",
+        fines: "np.ndarray",
+        fusionar: bool = True,
+        nucleos: Optional["np.ndarray"] = None,
+    ) -> "TrazaGantt":
+        import numpy as np
+        
+        ids = np.asarray(ids, dtype=np.int64)
+        inicios = np.asarray(inicios, dtype=np.int64)
+        fines = np.asarray(fines, dtype=np.int64)
+        if nucleos is not None:
+            nucleos = np.asarray(nucleos, dtype=np.int64)
+            if not nucleos.any():
+                nucleos = None
+        
+        
+        continua = np.zeros(len(ids), dtype=bool)
+        if fusionar:
+            continua[1:] = (ids[1:] == ids[:-1]) & (inicios[1:] == fines[:-1])
+            if nucleos is not None:
+                continua[1:] &= nucleos[1:] == nucleos[:-1]
+        if continua.any():
+            primeros = np.flatnonzero(~continua)
+            ultimos = np.append(primeros[1:] - 1, len(ids) - 1)
+            ids, inicios, fines = ids[primeros], inicios[primeros], fines[ultimos]
+            if nucleos is not None:
+                nucleos = nucleos[primeros]
+        
+        traza = cls(nombres)
+        traza._ids.frombytes(ids.tobytes())
+        traza._inicios.frombytes(inicios.tobytes())
+        traza._fines.frombytes(fines.tobytes())
+        if nucleos is not None:
+            traza._nucleos = array("q", nucleos.tobytes())
+        return traza
+
+    def agregar(self, indice: int, inicio: int, fin: int, nucleo: int = 0) -> None:
+        
+        if nucleo or self._nucleos is not None:
+            self._agregar_en_nucleo(indice, inicio, fin, nucleo)
+            return
+        ids = self._ids
+        if ids and ids[-1] == indice and self._fines[-1] == inicio:
+            self._fines[-1] = fin
+            return
+        ids.append(indice)
+        self._inicios.append(inicio)
+        self._fines.append(fin)
+
+    def _agregar_en_nucleo(self, indice: int, inicio: int, fin: int, nucleo: int) -> None:
+        
+        ids = self._ids
+        nucleos = self._nucleos
+        if nucleos is None:
+            nucleos = self._nucleos = array("q", bytes(8 * len(ids)))
+        if ids and ids[-1] == indice and self._fines[-1] == inicio and nucleos[-1] == nucleo:
+            self._fines[-1] = fin
+            return
+        ids.append(indice)
+        self._inicios.append(inicio)
+        self._fines.append(fin)
+        nucleos.append(nucleo)
+
+    def append(self, segmento: SegmentoGantt) -> None:
+        
+        if self._indice_por_nombre is None:
+            self.nombres = list(self.nombres)
+            self._indice_por_nombre = {}
+            for i, nombre in enumerate(self.nombres):
+                self._indice_por_nombre.setdefault(nombre, i)
+        indice = self._indice_por_nombre.get(segmento.proceso)
+        if indice is None:
+            indice = len(self.nombres)
+            self.nombres.append(segmento.proceso)
+            self._indice_por_nombre[segmento.proceso] = indice
+        self.agregar(indice, segmento.inicio, segmento.fin, segmento.nucleo)
+
+    def arreglos(self) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+        import numpy as np
+        
+        return (
+            np.frombuffer(self._ids, dtype=np.int64),
+            np.frombuffer(self._inicios, dtype=np.int64),
+            np.frombuffer(self._fines, dtype=np.int64),
+        )
+
+    def nucleos(self) -> Optional["np.ndarray"]:
+        import numpy as np
+        
+        
+        if self._nucleos is None:
+            return None
+        return np.frombuffer(self._nucleos, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __iter__(self) -> Iterator[SegmentoGantt]:
+        nombres = self.nombres
+        if self._nucleos is None:
+            for indice, inicio, fin in zip(self._ids, self._inicios, self._fines):
+                yield SegmentoGantt(proceso=nombres[indice], inicio=inicio, fin=fin)
+            return
+        for indice, inicio, fin, nucleo in zip(self._ids, self._inicios, self._fines, self._nucleos):
+            yield SegmentoGantt(proceso=nombres[indice], inicio=inicio, fin=fin, nucleo=nucleo)
+
+    def __getitem__(self, posicion):
+        if isinstance(posicion, slice):
+            return [self[i] for i in range(*posicion.indices(len(self)))]
+        return SegmentoGantt(
+            proceso=self.nombres[self._ids[posicion]],
+            inicio=self._inicios[posicion],
+            fin=self._fines[posicion],
+            nucleo=self._nucleos[posicion] if self._nucleos is not None else 0,
+        )
+
+    def __eq__(self, otro: object) -> bool:
+        if isinstance(otro, (TrazaGantt, list)):
+            return len(self) == len(otro) and all(a == b for a, b in zip(self, otro))
+        return NotImplemented
+
+    def copia(self) -> "TrazaGantt":
+        
+        traza = TrazaGantt.__new__(TrazaGantt)
+        traza.__setstate__((
+            list(self.nombres),
+            self._ids[:],
+            self._inicios[:],
+            self._fines[:],
+            self._nucleos[:] if self._nucleos is not None else None,
+        ))
+        return traza
+
+    @property
+    def nbytes(self) -> int:
+        columnas = 3 if self._nucleos is None else 4
+        return columnas * self._ids.itemsize * len(self._ids)
+
+    def __repr__(self) -> str:
+        return f"TrazaGantt({len(self)} segmentos)"
+
+    def __getstate__(self):
+        return (self.nombres, self._ids, self._inicios, self._fines, self._nucleos)
+
+    def __setstate__(self, estado) -> None:
+        self.nombres, self._ids, self._inicios, self._fines, self._nucleos = estado
+        self._indice_por_nombre = None
+
+
+SegmentosGantt = Union[List[SegmentoGantt], TrazaGantt]
+
+
+@dataclass(slots=True)
 class ResultadoProceso:
     
     nombre: str
@@ -33,11 +286,12 @@ class ResultadoProceso:
     tiempo_respuesta: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ResultadoAlgoritmo:
     
     nombre_algoritmo: str
     nombre_escenario: str
     procesos: List[ResultadoProceso] = field(default_factory=list)
-    segmentos_gantt: List[SegmentoGantt] = field(default_factory=list)
-    promedios: MetricasPromedio = field(default_factory=dict)
\ No newline at end of file
+    segmentos_gantt: SegmentosGantt = field(default_factory=list)
+    promedios: MetricasPromedio = field(default_factory=dict)
+    perfil: Optional["Instrumentacion"] = None
\ No newline at end of file
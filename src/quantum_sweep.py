@@ -0,0 +1,190 @@
+import os
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+from .models import Carga, columnas_carga
+from .algorithms import simular_rr
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+
+METRICAS_QUANTUM = {
+    "retorno": "tiempo_retorno_promedio",
+    "espera": "tiempo_espera_promedio",
+    "respuesta": "tiempo_respuesta_promedio",
+    "cambios_contexto": "cambios_contexto",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class FilaQuantum:
+    
+    quantum: int
+    retorno: float
+    espera: float
+    respuesta: float
+    cambios_contexto: int
+
+    def valor(self, metrica: str) -> float:
+        
+        if metrica not in METRICAS_QUANTUM:
+            raise ValueError(
+                f"Metrica '{metrica}' no reconocida. "
+                f"Disponibles: {', '.join(METRICAS_QUANTUM)}"
+            )
+        return getattr(self, metrica)
+
+
+def evaluar_quantum(procesos: Carga, quantum: int) -> FilaQuantum:
+    
+    promedios = simular_rr(procesos, quantum).promedios
+    return FilaQuantum(
+        quantum=quantum,
+        retorno=promedios["tiempo_retorno_promedio"],
+        espera=promedios["tiempo_espera_promedio"],
+        respuesta=promedios["tiempo_respuesta_promedio"],
+        cambios_contexto=int(promedios["cambios_contexto"]),
+    )
+
+
+_CARGA_WORKER: Optional[Carga] = None
+
+
+def _inicializar_worker(procesos: Carga) -> None:
+    global _CARGA_WORKER
+    _CARGA_WORKER = procesos
+
+
+def _evaluar_en_worker(quantum: int) -> FilaQuantum:
+    return evaluar_quantum(_CARGA_WORKER, quantum)
+
+
+class _Evaluador:
+    
+    def __init__(self, procesos: Carga, max_workers: Optional[int]) -> None:
+        self.procesos = procesos
+        self.cache: Dict[int, FilaQuantum] = {}
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        self._pool: Optional["ProcessPoolExecutor"] = None
+        if max_workers > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            
+            try:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    initializer=_inicializar_worker,
+                    initargs=(procesos,),
+                )
+            except (OSError, NotImplementedError):
+                self._pool = None
+
+    def evaluar(self, quantums: Iterable[int]) -> List[FilaQuantum]:
+        
+        quantums = list(dict.fromkeys(quantums))
+        pendientes = [q for q in quantums if q not in self.cache]
+        
+        if self._pool is not None and len(pendientes) > 1:
+            from concurrent.futures.process import BrokenProcessPool
+            from pickle import PicklingError
+            
+            try:
+                for fila in self._pool.map(_evaluar_en_worker, pendientes):
+                    self.cache[fila.quantum] = fila
+            except (OSError, BrokenProcessPool, PicklingError):
+                self.cerrar()
+        
+        for q in pendientes:
+            if q not in self.cache:
+                self.cache[q] = evaluar_quantum(self.procesos, q)
+        
+        return [self.cache[q] for q in quantums]
+
+    def cerrar(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    def __enter__(self) -> "_Evaluador":
+        return self
+
+    def __exit__(self, *excepcion) -> None:
+        self.cerrar()
+
+
+def _validar_quantum(quantum: int) -> None:
+    if quantum < 1:
+        raise ValueError(f"El quantum debe ser >= 1 (recibido {quantum}).")
+
+
+def barrer_quantums(
+    procesos: Carga,
+    quantums: Iterable[int],
+    max_workers: Optional[int] = None,
+) -> List[FilaQuantum]:
+    
+    quantums = list(quantums)
+    for q in quantums:
+        _validar_quantum(q)
+    with _Evaluador(procesos, max_workers) as evaluador:
+        return evaluador.evaluar(quantums)
+
+
+def _puntos_intermedios(desde: int, hasta: int, puntos: int) -> List[int]:
+    
+    if hasta - desde - 1 <= puntos:
+        return list(range(desde + 1, hasta))
+    paso = (hasta - desde) / (puntos + 1)
+    return sorted({desde + round(i * paso) for i in range(1, puntos + 1)})
+
+
+def optimizar_quantum(
+    procesos: Carga,
+    metrica: str = "espera",
+    q_min: int = 1,
+    q_max: Optional[int] = None,
+    puntos_por_ronda: int = 8,
+    max_workers: Optional[int] = None,
+    mejores_por_ronda: int = 3,
+) -> Tuple[FilaQuantum, List[FilaQuantum]]:
+    
+    if metrica not in METRICAS_QUANTUM:
+        raise ValueError(
+            f"Metrica '{metrica}' no reconocida. "
+            f"Disponibles: {', '.join(METRICAS_QUANTUM)}"
+        )
+    _validar_quantum(q_min)
+    
+    
+    if q_max is None:
+        _, _, duraciones = columnas_carga(procesos)
+        q_max = max(duraciones, default=q_min)
+    q_max = max(q_min, q_max)
+    puntos_por_ronda = max(3, puntos_por_ronda)
+    mejores_por_ronda = max(1, mejores_por_ronda)
+    
+    def clave(fila: FilaQuantum) -> Tuple[float, int]:
+        return fila.valor(metrica), fila.quantum
+    
+    
+    
+    puntos_por_lado = max(1, puntos_por_ronda // 2)
+    with _Evaluador(procesos, max_workers) as evaluador:
+        candidatos = [q_min, q_max] + _puntos_intermedios(q_min, q_max, puntos_por_ronda - 2)
+        while candidatos:
+            evaluador.evaluar(candidatos)
+            evaluados = sorted(evaluador.cache)
+            mejores = sorted(evaluador.cache.values(), key=clave)[:mejores_por_ronda]
+            
+            candidatos = []
+            for fila in mejores:
+                posicion = evaluados.index(fila.quantum)
+                if posicion > 0:
+                    candidatos += _puntos_intermedios(evaluados[posicion - 1], fila.quantum, puntos_por_lado)
+                if posicion + 1 < len(evaluados):
+                    candidatos += _puntos_intermedios(fila.quantum, evaluados[posicion + 1], puntos_por_lado)
+        
+        evaluadas = sorted(evaluador.cache.values(), key=lambda f: f.quantum)
+    
+    return min(evaluadas, key=clave), evaluadas
@@ -1,24 +1,25 @@
-from typing import Dict, List
-from .models import Proceso, ResultadoAlgoritmo
+import os
+from typing import Callable, Dict, List, Optional, Union
+from .models import Carga, CargaColumnar, ResultadoAlgoritmo
 from . import scenarios
-from .algorithms import (
-    simular_fcfs,
-    simular_sjf,
-    simular_srtf,
-    simular_rr_q3,
-    simular_rr_q6,
-)
-
-ALGORITMOS_DISPONIBLES = ("FCFS", "SJF", "SRTF", "RR_Q3", "RR_Q6")
-
-
-MAPA_ALGORITMOS = {
-    "FCFS": simular_fcfs,
-    "SJF": simular_sjf,
-    "SRTF": simular_srtf,
-    "RR_Q3": simular_rr_q3,
-    "RR_Q6": simular_rr_q6,
-}
+from .cache import CACHE_RESULTADOS, CacheResultados, clave_desde_huella, huella_carga
+from .instrumentation import Instrumentacion
+from .generators import ParametrosCarga, generar_carga_columnar, parametros_desde_dict
+from .algorithms import ALGORITMOS_REGISTRADOS, AlgoritmoRegistrado, simular_politica
+
+
+UMBRAL_PARALELO = 20_000
+
+
+MAPA_ALGORITMOS = ALGORITMOS_REGISTRADOS
+
+
+def __getattr__(nombre: str):
+    
+    
+    if nombre == "ALGORITMOS_DISPONIBLES":
+        return tuple(MAPA_ALGORITMOS)
+    raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
 
 
 NOMBRES_ESCENARIOS = {
@@ -27,41 +28,125 @@ NOMBRES_ESCENARIOS = {
 }
 
 
-def cargar_escenario(escenario_id: int) -> Dict[str, object]:
+FABRICAS_ESCENARIOS: Dict[Union[int, str], Callable[[], Carga]] = {
+    1: scenarios.obtener_escenario_1,
+    2: scenarios.obtener_escenario_2,
+}
+
+
+Escenario = Union[int, str, Carga, ParametrosCarga, dict]
+
+
+def registrar_escenario(
+    escenario_id: Union[int, str],
+    nombre: str,
+    fabrica: Callable[[], Carga],
+) -> None:
     
-    if escenario_id == 1:
-        procesos = scenarios.obtener_escenario_1()
-    elif escenario_id == 2:
-        procesos = scenarios.obtener_escenario_2()
-    else:
-        raise ValueError(f"Escenario inválido: {escenario_id}. Debe ser 1 o 2.")
+    FABRICAS_ESCENARIOS[escenario_id] = fabrica
+    NOMBRES_ESCENARIOS[escenario_id] = nombre
+
+
+def registrar_escenario_generado(
+    escenario_id: Union[int, str],
+    parametros: ParametrosCarga,
+    nombre: Optional[str] = None,
+) -> None:
+    
+    registrar_escenario(
+        escenario_id,
+        nombre or parametros.descripcion(),
+        lambda: generar_carga_columnar(parametros),
+    )
+
+
+def cargar_escenario(escenario_id: Escenario) -> Dict[str, object]:
+    
+    if isinstance(escenario_id, (list, CargaColumnar)):
+        return {
+            "nombre": "Carga personalizada",
+            "procesos": escenario_id,
+        }
+    
+    if isinstance(escenario_id, dict):
+        escenario_id = parametros_desde_dict(escenario_id)
+    
+    if isinstance(escenario_id, ParametrosCarga):
+        return {
+            "nombre": escenario_id.descripcion(),
+            "procesos": generar_carga_columnar(escenario_id),
+        }
+    
+    fabrica = FABRICAS_ESCENARIOS.get(escenario_id)
+    if fabrica is None:
+        disponibles = ", ".join(str(e) for e in FABRICAS_ESCENARIOS)
+        raise ValueError(f"Escenario inválido: {escenario_id}. Disponibles: {disponibles}.")
     
     return {
         "nombre": NOMBRES_ESCENARIOS.get(escenario_id, f"Escenario {escenario_id}"),
-        "procesos": procesos,
+        "procesos": fabrica(),
     }
 
 
+def _clave_cache(huella: str, nombre_algoritmo: str) -> str:
+
+    algoritmo = MAPA_ALGORITMOS[nombre_algoritmo]
+    parametros = None
+    if isinstance(algoritmo, AlgoritmoRegistrado):
+        parametros = {"politica": algoritmo.politica, **dict(algoritmo.parametros)}
+    return clave_desde_huella(huella, nombre_algoritmo, parametros)
+
+
+def _simular_con_cache(
+    nombre_algoritmo: str,
+    procesos: Carga,
+    cache: Optional[CacheResultados],
+    huella: Optional[str] = None,
+) -> ResultadoAlgoritmo:
+    
+    algoritmo = MAPA_ALGORITMOS[nombre_algoritmo]
+    if cache is None:
+        return algoritmo(procesos)
+    
+    clave = _clave_cache(huella or huella_carga(procesos), nombre_algoritmo)
+    resultado = cache.obtener(clave)
+    if resultado is None:
+        resultado = algoritmo(procesos)
+        cache.guardar(clave, resultado)
+    return resultado
+
+
 def ejecutar_algoritmo_en_escenario(
     nombre_algoritmo: str,
-    escenario_id: int,
+    escenario_id: Escenario,
+    usar_cache: bool = True,
+    instrumentar: bool = False,
+    huella: Optional[str] = None,
 ) -> ResultadoAlgoritmo:
     
     
     escenario_data = cargar_escenario(escenario_id)
-    procesos: List[Proceso] = escenario_data["procesos"]
+    procesos: Carga = escenario_data["procesos"]
     nombre_escenario: str = escenario_data["nombre"]
     
     
     if nombre_algoritmo not in MAPA_ALGORITMOS:
         raise ValueError(
             f"Algoritmo '{nombre_algoritmo}' no reconocido. "
-            f"Disponibles: {', '.join(ALGORITMOS_DISPONIBLES)}"
+            f"Disponibles: {', '.join(MAPA_ALGORITMOS)}"
         )
     
     
-    funcion_simulacion = MAPA_ALGORITMOS[nombre_algoritmo]
-    resultado = funcion_simulacion(procesos)
+    if instrumentar:
+        
+        resultado = MAPA_ALGORITMOS[nombre_algoritmo](procesos, instrumentacion=Instrumentacion())
+    else:
+        resultado = _simular_con_cache(
+            nombre_algoritmo,
+            procesos,
+            CACHE_RESULTADOS if usar_cache else None,
+            huella,
+        )
     
     
     resultado.nombre_algoritmo = nombre_algoritmo
@@ -70,12 +155,100 @@ def ejecutar_algoritmo_en_escenario(
     return resultado
 
 
-def ejecutar_todos_los_algoritmos(escenario_id: int) -> Dict[str, ResultadoAlgoritmo]:
+def _tarea_paralela(nombre_algoritmo: str) -> Optional[tuple]:
+    
+    
+    import pickle
+    
+    algoritmo = MAPA_ALGORITMOS[nombre_algoritmo]
+    if isinstance(algoritmo, AlgoritmoRegistrado):
+        tarea = (simular_politica, algoritmo.crear_politica())
+    else:
+        tarea = (algoritmo,)
+    try:
+        pickle.dumps(tarea, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        return None
+    return tarea
+
+
+def _ejecutar_en_paralelo(
+    procesos: Carga,
+    algoritmos: List[str],
+    max_workers: Optional[int],
+) -> Optional[Dict[str, ResultadoAlgoritmo]]:
+    
+    tareas = {}
+    for nombre_algoritmo in algoritmos:
+        tarea = _tarea_paralela(nombre_algoritmo)
+        if tarea is not None:
+            tareas[nombre_algoritmo] = tarea
+    if len(tareas) < 2:
+        return None
+    
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures.process import BrokenProcessPool
+    from pickle import PicklingError
+    
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futuros = {
+                nombre_algoritmo: pool.submit(funcion, procesos, *argumentos)
+                for nombre_algoritmo, (funcion, *argumentos) in tareas.items()
+            }
+            return {nombre: futuro.result() for nombre, futuro in futuros.items()}
+    except (OSError, BrokenProcessPool, PicklingError):
+        
+        return None
+
+
+def ejecutar_todos_los_algoritmos(
+    escenario_id: Escenario,
+    paralelo: Optional[bool] = None,
+    max_workers: Optional[int] = None,
+    usar_cache: bool = True,
+) -> Dict[str, ResultadoAlgoritmo]:
+    
+    escenario_data = cargar_escenario(escenario_id)
+    procesos: Carga = escenario_data["procesos"]
+    nombre_escenario: str = escenario_data["nombre"]
+    
+    
+    cache = CACHE_RESULTADOS if usar_cache else None
+    claves: Dict[str, str] = {}
+    resultados: Dict[str, ResultadoAlgoritmo] = {}
+    if cache is not None:
+        huella = huella_carga(procesos)
+        for nombre_algoritmo in MAPA_ALGORITMOS:
+            claves[nombre_algoritmo] = _clave_cache(huella, nombre_algoritmo)
+            resultado = cache.obtener(claves[nombre_algoritmo])
+            if resultado is not None:
+                resultados[nombre_algoritmo] = resultado
+    pendientes = [a for a in MAPA_ALGORITMOS if a not in resultados]
+    
+    if paralelo is None:
+        paralelo = len(procesos) >= UMBRAL_PARALELO
+    if max_workers is None:
+        max_workers = min(len(pendientes), os.cpu_count() or 1)
+    
+    calculados: Dict[str, ResultadoAlgoritmo] = {}
+    if pendientes and paralelo and max_workers > 1:
+        calculados = _ejecutar_en_paralelo(procesos, pendientes, max_workers) or {}
+    
+    
+    for nombre_algoritmo in pendientes:
+        if nombre_algoritmo not in calculados:
+            calculados[nombre_algoritmo] = ejecutar_algoritmo_en_escenario(
+                nombre_algoritmo, procesos, usar_cache=False
+            )
     
-    resultados = {}
+    if cache is not None:
+        for nombre_algoritmo, resultado in calculados.items():
+            cache.guardar(claves[nombre_algoritmo], resultado)
+    resultados.update(calculados)
     
-    for nombre_algoritmo in ALGORITMOS_DISPONIBLES:
-        resultado = ejecutar_algoritmo_en_escenario(nombre_algoritmo, escenario_id)
-        resultados[nombre_algoritmo] = resultado
+    for nombre_algoritmo, resultado in resultados.items():
+        resultado.nombre_algoritmo = nombre_algoritmo
+        resultado.nombre_escenario = nombre_escenario
     
-    return resultados
+    return {nombre: resultados[nombre] for nombre in MAPA_ALGORITMOS}